@@ -0,0 +1,44 @@
+# benchmarks/awr_data.py
+# This file generates synthetic AWR/ASH-like chart data for the benchmarks.
+
+import numpy as np
+import pandas as pd
+
+WAIT_CLASSES = ["CPU", "User I/O", "System I/O", "Concurrency", "Commit", "Application", "Network", "Configuration", "Other"]
+
+# ASH samples every second; several active sessions share a sample time
+SESSIONS_PER_SAMPLE = 10
+
+
+def metric_columns(series: int) -> list:
+    return [f"metric_{index:03d}" for index in range(series)]
+
+
+def event_names(series: int) -> list:
+    return [f"{WAIT_CLASSES[index % len(WAIT_CLASSES)]}: event {index:03d}" for index in range(series)]
+
+
+def ash_frame(rows: int, series: int, seed: int = 0) -> pd.DataFrame:
+    """``rows`` ASH-like samples: ``sample_time`` (one second per SESSIONS_PER_SAMPLE rows),
+    ``instance_number``, ``wait_class``, ``event`` (``series`` distinct, skewed like real
+    top-event lists) and ``series`` float metric columns ``metric_000`` ..."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2024-01-01T00:00:00", "ns")
+    seconds = np.arange(rows, dtype=np.int64) // SESSIONS_PER_SAMPLE
+    events = event_names(series)
+    # Zipf-like: a few events dominate, as in an AWR top wait events section
+    weights = 1.0 / np.arange(1, series + 1)
+    event_codes = rng.choice(series, size=rows, p=weights / weights.sum())
+
+    frame = {
+        "sample_time": start + seconds * np.timedelta64(1, "s"),
+        "instance_number": rng.integers(1, 3, size=rows),
+        "wait_class": pd.Categorical.from_codes(event_codes % len(WAIT_CLASSES), WAIT_CLASSES).astype(object),
+        "event": np.asarray(events, dtype=object)[event_codes],
+    }
+    base = rng.gamma(2.0, 50.0, size=series)
+    for index, column in enumerate(metric_columns(series)):
+        # Slow daily-like wave plus noise, never negative (time waited, sessions, ...)
+        wave = 1 + 0.5 * np.sin(seconds / 3600.0 + index)
+        frame[column] = np.abs(base[index] * wave + rng.normal(0, base[index] * 0.1, size=rows))
+    return pd.DataFrame(frame)
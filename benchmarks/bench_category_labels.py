@@ -0,0 +1,51 @@
+# benchmarks/bench_category_labels.py
+# This file compares the row-wise " - ".join category labels with chart.base.category_labels.
+#
+# Run from the repository root: python benchmarks/bench_category_labels.py [--max-rows 10000000]
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from chart.base import category_labels
+
+X_AXIS = ["instance", "snap_id", "wait_class"]
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "instance": rng.choice(["orcl1", "orcl2", "orcl3", "orcl4"], rows),
+        "snap_id": rng.integers(1000, 1000 + max(rows // 40, 1), rows),
+        "wait_class": rng.choice(["User I/O", "CPU", "Concurrency", "Commit", "Network", "Other"], rows),
+    })
+
+
+def row_wise(df: pd.DataFrame) -> list:
+    return df[X_AXIS].astype(str).agg(" - ".join, axis=1).to_list()
+
+
+def timed(func, df: pd.DataFrame):
+    start = time.perf_counter()
+    result = func(df)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-rows", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'row-wise s':>12} {'columnar s':>12} {'speedup':>8}")
+    rows = 100_000
+    while rows <= args.max_rows:
+        df = make_frame(rows)
+        slow, expected = timed(row_wise, df)
+        fast, labels = timed(lambda frame: category_labels(frame, X_AXIS), df)
+        assert labels == expected
+        print(f"{rows:>10} {slow:>12.3f} {fast:>12.3f} {slow / fast:>7.1f}x")
+        rows *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# benchmarks/bench_render.py
+# This file times every stage of a chart render (axis defaults, groupby, category labels, data
+# preparation, option building, render_embed, browser snapshot, base64, SVG) on synthetic
+# AWR/ASH data, for line, bar and pie charts, and writes the timings as JSON.
+#
+# Run from the repository root: python benchmarks/bench_render.py [--full] [--output results.json]
+# Compare two runs with benchmarks/compare_results.py.
+
+import argparse
+import base64
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import pandas as pd
+import pyecharts
+from awr_data import ash_frame, metric_columns
+from chart.base import category_labels
+from chart.components.bar_chart import BarChart
+from chart.components.line_chart import LineChart
+from chart.components.pie_chart import PieChart
+from chart.models.chart_model import ChartModel
+from chart.svg import svg_to_png
+
+CHART_TYPES = ("line", "bar", "pie")
+FORMATS = ("html", "png", "base64", "svg", "svg-png")
+
+QUICK_ROWS = [1_000, 10_000, 100_000]
+QUICK_SERIES = [1, 10]
+FULL_ROWS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+FULL_SERIES = [1, 10, 50, 200]
+
+# rows x series above which a case is skipped (1e8 float cells is ~800 MB of input)
+DEFAULT_MAX_CELLS = 100_000_000
+
+PIE_ARGS = (0.05, "Others")
+
+
+def measure(func, repeat: int):
+    """(min seconds, median seconds, result of the last call)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings), result
+
+
+def make_component(chart_type: str, data: pd.DataFrame, series: int):
+    if chart_type == "pie":
+        # One slice per event: ``series`` slices before the small ones are grouped
+        chart_model = ChartModel(id="bench", type="pie", title="Top events", x_axis=["event"], y_axis=["metric_000"])
+        return PieChart(chart_model, data)
+    chart_model = ChartModel(
+        id="bench", type=chart_type, title="Load profile", x_axis=["sample_time"], y_axis=metric_columns(series),
+    )
+    chart_class = LineChart if chart_type == "line" else BarChart
+    return chart_class(chart_model, data)
+
+
+def build(component, chart_type: str, for_image: bool):
+    if chart_type == "line":
+        return component._build_line_chart(for_image=for_image)
+    if chart_type == "bar":
+        return component._build_bar_chart(for_image=for_image)
+    return component._build_pie_chart(component.get_prepared_data(*PIE_ARGS), donut=True, for_image=for_image)
+
+
+def bench_case(chart_type: str, data: pd.DataFrame, series: int, formats, repeat: int, state: dict) -> list:
+    component = make_component(chart_type, data, series)
+    prepare_args = PIE_ARGS if chart_type == "pie" else ()
+    records = []
+
+    def record(stage: str, timing, **stats):
+        records.append({"stage": stage, "min_s": timing[0], "median_s": timing[1], **stats})
+
+    record("set_default_axis", measure(component.set_default_axis, repeat))
+    aggregated = measure(component.aggregate_data, repeat)
+    record("aggregate", aggregated, groups=len(aggregated[2]))
+    record("category_labels", measure(lambda: category_labels(aggregated[2], component.chart_model.x_axis), repeat))
+    record("prepare", measure(lambda: component._prepare_chart_data(*prepare_args), repeat))
+    # Later stages reuse the memoized preparation, as a render does
+    component.get_prepared_data(*prepare_args)
+
+    if "html" in formats:
+        chart = measure(lambda: build(component, chart_type, for_image=False), repeat)
+        record("build_options", chart)
+        html = measure(chart[2].render_embed, repeat)
+        record("render_embed", html, bytes=len(html[2].encode("utf-8")))
+
+    if ("png" in formats or "base64" in formats) and state.get("browser", True):
+        chart = measure(lambda: build(component, chart_type, for_image=True), repeat)
+        record("build_options_image", chart)
+        try:
+            image = measure(lambda: component.snapshot(chart[2]), repeat)
+            record("snapshot", image, bytes=len(image[2]))
+            if "base64" in formats:
+                encoded = measure(lambda: base64.b64encode(image[2]).decode("utf-8"), repeat)
+                record("base64", encoded, bytes=len(encoded[2]))
+        except Exception as e:
+            # No browser here: keep benchmarking the other stages
+            state["browser"] = False
+            print(f"  browser snapshot unavailable, skipping png/base64: {str(e).splitlines()[0]}", file=sys.stderr)
+
+    if "svg" in formats or "svg-png" in formats:
+        if chart_type == "pie":
+            svg = measure(lambda: component.render_svg(threshold=PIE_ARGS[0], group_other_name=PIE_ARGS[1], donut=True), repeat)
+        else:
+            svg = measure(component.render_svg, repeat)
+        record("svg", svg, bytes=len(svg[2].encode("utf-8")))
+        if "svg-png" in formats and state.get("cairo", True):
+            try:
+                png = measure(lambda: svg_to_png(svg[2]), repeat)
+                record("svg_png", png, bytes=len(png[2]))
+            except Exception as e:
+                state["cairo"] = False
+                print(f"  cairosvg unavailable, skipping svg-png: {str(e).splitlines()[0]}", file=sys.stderr)
+
+    return records
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-stage chart render benchmarks on synthetic AWR/ASH data")
+    parser.add_argument("--full", action="store_true", help="1e3-1e7 rows and 1-200 series (slow, needs a lot of memory)")
+    parser.add_argument("--rows", type=int, nargs="+", help="row counts (overrides --full)")
+    parser.add_argument("--series", type=int, nargs="+", help="series counts (overrides --full)")
+    parser.add_argument("--charts", nargs="+", choices=CHART_TYPES, default=list(CHART_TYPES))
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-cells", type=int, default=DEFAULT_MAX_CELLS, help="skip cases with rows x series above this")
+    parser.add_argument("--output", help="JSON results file (default benchmarks/results/bench-<timestamp>.json)")
+    args = parser.parse_args()
+
+    rows_list = args.rows or (FULL_ROWS if args.full else QUICK_ROWS)
+    series_list = args.series or (FULL_SERIES if args.full else QUICK_SERIES)
+    started = datetime.datetime.now()
+    results = {
+        "meta": {
+            "started": started.isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "pyecharts": pyecharts.__version__,
+            "repeat": args.repeat,
+        },
+        "results": [],
+    }
+
+    state = {}
+    print(f"{'chart':>5} {'rows':>9} {'series':>6} {'stage':>20} {'min s':>9} {'median s':>9} {'bytes':>10}")
+    for rows in rows_list:
+        for series in series_list:
+            if rows * series > args.max_cells:
+                print(f"skip {rows} rows x {series} series (above --max-cells)", file=sys.stderr)
+                continue
+            data = ash_frame(rows, series)
+            for chart_type in args.charts:
+                for record in bench_case(chart_type, data, series, args.formats, args.repeat, state):
+                    record = {"chart": chart_type, "rows": rows, "series": series, **record}
+                    results["results"].append(record)
+                    print(
+                        f"{chart_type:>5} {rows:>9} {series:>6} {record['stage']:>20} "
+                        f"{record['min_s']:>9.4f} {record['median_s']:>9.4f} {record.get('bytes', ''):>10}"
+                    )
+            del data
+
+    # Stages that could not run here (no Chrome for snapshots, no cairosvg for SVG to PNG)
+    results["meta"]["unavailable"] = [name for name in ("browser", "cairo") if state.get(name) is False]
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results", f"bench-{started:%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
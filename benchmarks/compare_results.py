@@ -0,0 +1,45 @@
+# benchmarks/compare_results.py
+# This file compares two bench_render.py JSON result files stage by stage.
+#
+# Run from the repository root: python benchmarks/compare_results.py baseline.json candidate.json
+
+import argparse
+import json
+
+KEY_FIELDS = ("chart", "rows", "series", "stage")
+
+
+def load(path: str) -> dict:
+    with open(path, "r") as f:
+        results = json.load(f)
+    return {tuple(record[field] for field in KEY_FIELDS): record for record in results["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two bench_render.py result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="flag changes above this ratio (default 10%%)")
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    print(f"{'chart':>5} {'rows':>9} {'series':>6} {'stage':>20} {'baseline s':>11} {'candidate s':>11} {'change':>8}")
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[key]["min_s"], candidate[key]["min_s"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = " slower"
+        elif change < -args.threshold:
+            flag = " faster"
+        chart, rows, series, stage = key
+        print(f"{chart:>5} {rows:>9} {series:>6} {stage:>20} {before:>11.4f} {after:>11.4f} {change:>+7.1%}{flag}")
+
+    for label, missing in (("only in baseline", baseline.keys() - candidate.keys()),
+                           ("only in candidate", candidate.keys() - baseline.keys())):
+        if missing:
+            print(f"{len(missing)} cases {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# src/chart/aggregate.py
+# This file groups the chart data by its x-axis keys and aggregates the y columns.
+
+from typing import Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+AGGREGATIONS = ("sum", "mean", "max", "min", "count")
+
+# Integer keys spanning more values than this (and than 4x the rows) are not bincounted
+MAX_BINCOUNT_SPAN = 1 << 20
+
+# Rows checked for a repeated key before testing the whole key for uniqueness
+UNIQUE_PROBE_ROWS = 1000
+
+
+def resolve_aggregations(y_columns: List[str], aggregations: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Aggregation of every y column, "sum" unless chart_model.aggregations says otherwise"""
+    aggregations = aggregations or {}
+    how = {column: aggregations.get(column, "sum") for column in y_columns}
+    for column, func in how.items():
+        if func not in AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation for {column}: {func}")
+    return how
+
+
+def aggregate(data: pd.DataFrame, keys: List[Union[str, pd.Series]], y_columns: List[str],
+              aggregations: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """Group ``data`` by ``keys`` (column names or Series aligned with ``data``) and aggregate
+    ``y_columns``. Returns one row per group, the key columns first, sorted by key like
+    ``groupby(keys).agg(...).reset_index()``.
+
+    - a single integer or categorical key is aggregated with NumPy bincount / reduceat;
+    - keys that are already unique (pre-aggregated input) are not grouped at all;
+    - an already sorted single key is grouped with ``sort=False``."""
+    how = resolve_aggregations(y_columns, aggregations)
+    key_series = [data[key] if isinstance(key, str) else key for key in keys]
+
+    if len(key_series) == 1:
+        result = _aggregate_codes(data, key_series[0], how)
+        if result is not None:
+            return result
+
+    if _keys_unique(key_series):
+        return _passthrough(data, key_series, how)
+
+    presorted = len(key_series) == 1 and key_series[0].is_monotonic_increasing
+    grouped = data.groupby(key_series, sort=not presorted, observed=True)[list(how)].agg(how)
+    return grouped.reset_index()
+
+
+def _keys_unique(key_series: List[pd.Series]) -> bool:
+    # Raw (not yet aggregated) data almost always repeats a key within its first rows
+    for rows in (UNIQUE_PROBE_ROWS, None):
+        probe = [key.iloc[:rows] for key in key_series]
+        if len(probe) == 1:
+            unique = probe[0].is_unique
+        else:
+            unique = not pd.MultiIndex.from_arrays(probe).has_duplicates
+        if not unique or len(key_series[0]) <= UNIQUE_PROBE_ROWS:
+            return unique
+    return True
+
+
+def _passthrough(data: pd.DataFrame, key_series: List[pd.Series], how: Dict[str, str]) -> pd.DataFrame:
+    """Aggregate groups of one row each: the value itself (NaN sums to 0, counts are 0/1)"""
+    valid = np.ones(len(data), dtype=bool)
+    for key in key_series:
+        valid &= key.notna().to_numpy()
+
+    result = pd.DataFrame({key.name: key.to_numpy()[valid] for key in key_series})
+    for column, func in how.items():
+        values = data[column]
+        if func == "count":
+            result[column] = values.notna().to_numpy()[valid].astype(np.int64)
+        elif func == "sum":
+            result[column] = values.fillna(0).to_numpy()[valid]
+        else:
+            result[column] = values.to_numpy()[valid]
+
+    if len(key_series) == 1 and key_series[0].is_monotonic_increasing:
+        return result
+    return result.sort_values(list(result.columns[:len(key_series)]), kind="stable", ignore_index=True)
+
+
+def _aggregate_codes(data: pd.DataFrame, key: pd.Series, how: Dict[str, str]) -> Optional[pd.DataFrame]:
+    """NumPy fast path for one integer or categorical key, None when it does not apply"""
+    if len(key) == 0:
+        return None
+    for column in how:
+        dtype = data[column].dtype
+        if not isinstance(dtype, np.dtype) or dtype.kind not in "iuf":
+            return None
+
+    if isinstance(key.dtype, pd.CategoricalDtype):
+        codes = key.cat.codes.to_numpy().astype(np.intp)
+        n_groups = len(key.cat.categories)
+        low = 0
+    elif isinstance(key.dtype, np.dtype) and key.dtype.kind in "iu":
+        values = key.to_numpy()
+        low, high = int(values.min()), int(values.max())
+        n_groups = high - low + 1
+        if n_groups > max(MAX_BINCOUNT_SPAN, 4 * len(values)):
+            return None
+        codes = (values - low).astype(np.intp)
+    else:
+        return None
+
+    # Missing categorical keys (code -1) are dropped like groupby(dropna=True) does
+    valid = codes >= 0
+    if not valid.all():
+        codes = codes[valid]
+    rows = None if valid.all() else valid
+
+    counts = np.bincount(codes, minlength=n_groups)
+    present = np.flatnonzero(counts)
+
+    order = starts = None
+    result = {}
+    for column, func in how.items():
+        values = data[column].to_numpy()
+        if rows is not None:
+            values = values[rows]
+        notna = ~np.isnan(values) if values.dtype.kind == "f" else None
+
+        if func in ("sum", "mean", "count"):
+            non_null = counts if notna is None else np.bincount(codes[notna], minlength=n_groups)
+            if func == "count":
+                result[column] = non_null[present].astype(np.int64)
+                continue
+            if func == "sum" and values.dtype.kind in "iu":
+                # bincount adds up in float64: exact integer sums need an integer accumulator
+                sums = np.zeros(n_groups, dtype=np.uint64 if values.dtype.kind == "u" else np.int64)
+                np.add.at(sums, codes, values)
+                result[column] = sums[present]
+                continue
+            sums = np.bincount(codes, weights=values if notna is None else np.where(notna, values, 0), minlength=n_groups)[present]
+            if func == "sum":
+                result[column] = sums
+            else:
+                non_null = non_null[present]
+                result[column] = np.divide(sums, non_null, out=np.full(len(present), np.nan), where=non_null > 0)
+        else:
+            if starts is None:
+                # reduceat needs the rows of a group next to each other
+                if len(codes) > 1 and (codes[1:] < codes[:-1]).any():
+                    order = np.argsort(codes, kind="stable")
+                sorted_codes = codes if order is None else codes[order]
+                starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            ordered = values if order is None else values[order]
+            reduce = np.fmax if func == "max" else np.fmin
+            result[column] = reduce.reduceat(ordered, starts)
+
+    if isinstance(key.dtype, pd.CategoricalDtype):
+        key_values = pd.Categorical.from_codes(present, dtype=key.dtype)
+    else:
+        key_values = (present + low).astype(key.dtype)
+    return pd.DataFrame({key.name: key_values, **result})
@@ -0,0 +1,440 @@
+# src/chart/components/base.py
+# This file defines a base Chart class that provides common functionality for chart components.
+
+from chart.models.chart_model import ChartModel, model_to_json
+from chart.aggregate import aggregate
+from chart.executor import run_in_prep_executor
+from chart.instrument import NOOP_SPAN, Instrumentation, Span, get_instrumentation, traced
+from chart.memory import get_memory_policy
+from chart.native import aggregate_native, empty_frame, is_arrow_table, is_native_frame, is_polars_frame
+from chart.sql import SqlSource
+from chart.stream import ChunkedData, is_chunked
+from chart.resample import time_bucket_keys
+from chart.snapshot import snapshot_html, snapshot_html_async
+from pyecharts import options as opts
+from pyecharts.charts.base import default
+from pyecharts.commons.utils import JsCode, replace_placeholder
+from typing import List, Optional
+import base64
+import numpy as np
+import pandas as pd
+import simplejson
+
+# K/M/B number formatters used in chart options (a dashboard page defines them only once)
+AXIS_LABEL_FORMATTER_JS = "function(value){return value>=1000000000?(value/1000000000).toFixed(1)+'B':value>=1000000?(value/1000000).toFixed(1)+'M':value>=1000?(value/1000).toFixed(1)+'K':value}"
+BAR_LABEL_FORMATTER_JS = "function(params) { var value = Array.isArray(params.value) ? params.value[params.encode.y[0]] : params.value; if (value >= 1000000000) { return (value / 1000000000).toFixed(1) + 'B'; } else if (value >= 1000000) { return (value / 1000000).toFixed(1) + 'M'; } else if (value >= 1000) { return (value / 1000).toFixed(1) + 'K'; } else { return value.toString(); } }"
+TOOLTIP_FORMATTER_JS = "function(params) { var result = params[0].name + '<br/>'; params.forEach(function(param) { var value = Array.isArray(param.value) ? param.value[param.encode.y[0]] : param.value; if (value >= 1000000000) { value = (value / 1000000000).toFixed(1) + 'B'; } else if (value >= 1000000) { value = (value / 1000000).toFixed(1) + 'M'; } else if (value >= 1000) { value = (value / 1000).toFixed(1) + 'K'; } else { value = value.toString(); } result += param.marker + ' ' + param.seriesName + ': ' + value + '<br/>'; }); return result; }"
+
+# Image backends: "browser" snapshots the ECharts page, "svg" draws in pure Python
+IMAGE_BACKENDS = ("browser", "svg")
+
+CATEGORY_SEPARATOR = " - "
+
+# Large-data mode (chart_model.large_threshold): series drawn progressively in chunks of this many points
+PROGRESSIVE_CHUNK = 5000
+
+# renderer="auto": interactive charts with at most this many points in total use SVG (crisp,
+# little memory), larger ones canvas. Browser snapshots are always canvas (PNG data URL).
+RENDERERS = ("auto", "canvas", "svg")
+SVG_RENDERER_MAX_POINTS = 1000
+
+
+def category_labels(df: pd.DataFrame, columns: List[str]) -> list:
+    """x-axis labels of the (aggregated) rows, joining multi-column keys with " - ".
+
+    Columnar: each column is factorized, only its distinct values are converted to
+    str, and the labels are concatenated as whole arrays instead of row by row."""
+    labels = None
+    for column in columns:
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        column_labels = np.asarray(uniques.astype(str), dtype=object)[codes]
+        labels = column_labels if labels is None else labels + CATEGORY_SEPARATOR + column_labels
+    return [] if labels is None else labels.tolist()
+
+
+def input_row_count(data) -> Optional[int]:
+    """Rows of the chart input, None when unknown without reading it (SQL, chunks, lazy frames)"""
+    if isinstance(data, pd.DataFrame):
+        return len(data)
+    if is_arrow_table(data):
+        return data.num_rows
+    if is_polars_frame(data) and hasattr(data, "height"):
+        return data.height
+    return None
+
+
+class BaseChart:
+
+    def __init__(self, chart_model: ChartModel, data: pd.DataFrame, 
+                 colors: List[str]=  ["#009953", "#00F284", "#F2B950", "#F28444", "#F2D8CE"]):
+        self._prepared_data = {}
+        self._prepared_model_json = None
+        self.chart_model = chart_model
+        self.data = data
+        self.html = None
+        # None: the process-wide chart.instrument.get_instrumentation()
+        self.instrumentation = None
+
+        # Allow overriding colors from chart_model if provided
+        self.colors = colors
+
+    @property
+    def chart_model(self) -> ChartModel:
+        return self._chart_model
+
+    @chart_model.setter
+    def chart_model(self, chart_model: ChartModel):
+        self._chart_model = chart_model
+        self.invalidate_prepared_data()
+
+    @property
+    def data(self) -> pd.DataFrame:
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame):
+        # An iterator of DataFrame chunks is read once, by the first aggregation
+        self._data = ChunkedData(data) if is_chunked(data) and not isinstance(data, ChunkedData) else data
+        self.invalidate_prepared_data()
+
+    def set_colors(self, colors: List[str]):
+        self.colors = colors
+
+    def set_instrumentation(self, instrumentation: Instrumentation):
+        self.instrumentation = instrumentation
+
+    def span(self, stage: str, **stats):
+        """Context manager timing ``stage`` for the instrumentation (a shared no-op when disabled)"""
+        instrumentation = self.instrumentation or get_instrumentation()
+        if not instrumentation.enabled:
+            return NOOP_SPAN
+        return Span(instrumentation, getattr(self.chart_model, "id", None), stage, stats)
+
+    def invalidate_prepared_data(self):
+        """Forget memoized _prepare_chart_data results (call it after mutating data in place)"""
+        self._prepared_data = {}
+        self._prepared_model_json = None
+
+    def get_prepared_data(self, *args):
+        """Return _prepare_chart_data(*args), computed once per model/data/arguments"""
+        if self._prepared_model_json != model_to_json(self.chart_model):
+            self._prepared_data = {}
+
+        if args not in self._prepared_data:
+            with self.span("prepare") as span:
+                prepared = self._prepare_chart_data(*args)
+                if span is not NOOP_SPAN:
+                    series = len(self.chart_model.y_axis or [])
+                    # Line/bar: (data, categories); pie: [[name, value], ...]
+                    points = len(prepared[1]) * series if isinstance(prepared, tuple) else len(prepared)
+                    span.set(series=series, points=points)
+            self._prepared_data[args] = prepared
+            # After preparing: set_default_axis may have filled the model axes
+            self._prepared_model_json = model_to_json(self.chart_model)
+
+        return self._prepared_data[args]
+
+    def _prepare_chart_data(self, *args):
+        raise NotImplementedError("Need implement this method in subclass")
+
+    @traced("set_default_axis")
+    def set_default_axis(self):
+        try:
+            # Only the dtypes are needed: select on an empty slice instead of copying the data
+            df = self.data.empty_frame() if isinstance(self.data, (ChunkedData, SqlSource)) else empty_frame(self.data)
+            if not self.chart_model.x_axis:
+                datetime_cols = df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).columns.tolist()
+                if datetime_cols:
+                    self.chart_model.x_axis = datetime_cols
+                else:
+                    self.chart_model.x_axis = df.select_dtypes(exclude="number").columns.tolist()
+
+            if not self.chart_model.y_axis:
+                self.chart_model.y_axis = df.select_dtypes(include="number").columns.tolist()
+
+            del df
+
+        except Exception as e:
+            raise ValueError(f"Failed to set default axis.\nError: {str(e)}")
+
+
+    def group_keys(self) -> list:
+        """Groupby keys of the x-axis, with datetime columns bucketed by chart_model.time_bucket"""
+        # "auto" aims at about one bucket per horizontal pixel of the chart
+        return time_bucket_keys(
+            self.data, self.chart_model.x_axis, getattr(self.chart_model, "time_bucket", None),
+            max_buckets=self.chart_model.size.width,
+        )
+
+    def aggregate_data(self, keys: list = None, y_columns: List[str] = None, top_n: int = None) -> pd.DataFrame:
+        """Group the data by the x-axis and aggregate the y columns (chart_model.aggregations, sum by default).
+
+        ``top_n`` is only a hint for SQL sources, which then fetch the largest groups only."""
+        with self.span("aggregate") as span:
+            result = self._aggregate_data(keys, y_columns, top_n)
+            if span is not NOOP_SPAN:
+                span.set(input_rows=input_row_count(self.data), groups=len(result))
+            return result
+
+    def _aggregate_data(self, keys: list, y_columns: List[str], top_n: int) -> pd.DataFrame:
+        if isinstance(self.data, SqlSource):
+            # GROUP BY runs in the database, only the aggregated rows are fetched
+            return self.data.aggregate(
+                self.chart_model.x_axis if keys is None else keys,
+                self.chart_model.y_axis if y_columns is None else y_columns,
+                getattr(self.chart_model, "aggregations", None),
+                time_bucket=getattr(self.chart_model, "time_bucket", None) if keys is None else None,
+                max_buckets=self.chart_model.size.width,
+                top_n=top_n,
+            )
+        if isinstance(self.data, ChunkedData):
+            # Aggregated chunk by chunk, the raw rows are never held together
+            return self.data.aggregate(
+                self.chart_model.x_axis if keys is None else keys,
+                self.chart_model.y_axis if y_columns is None else y_columns,
+                getattr(self.chart_model, "aggregations", None),
+                time_bucket=getattr(self.chart_model, "time_bucket", None) if keys is None else None,
+                max_buckets=self.chart_model.size.width,
+            )
+        if is_native_frame(self.data):
+            # Grouped by pyarrow / Polars, only the aggregated rows become a pandas DataFrame
+            return aggregate_native(
+                self.data,
+                self.chart_model.x_axis if keys is None else keys,
+                self.chart_model.y_axis if y_columns is None else y_columns,
+                getattr(self.chart_model, "aggregations", None),
+                time_bucket=getattr(self.chart_model, "time_bucket", None) if keys is None else None,
+                max_buckets=self.chart_model.size.width,
+            )
+        return aggregate(
+            self.data,
+            self.group_keys() if keys is None else keys,
+            self.chart_model.y_axis if y_columns is None else y_columns,
+            getattr(self.chart_model, "aggregations", None),
+        )
+
+    def get_tooltip_opts(self) -> opts.TooltipOpts:
+        """Get tooltip options
+            Tooltip default for all charts (can be overridden in subclass)"""
+        tooltip_type = getattr(self.chart_model, "tooltip_type", "cross")
+        
+        # Add formatter for K/M/B formatting in tooltip
+        formatter = None
+        if getattr(self.chart_model, "y_axis_format_large_numbers", True):
+            formatter = JsCode(TOOLTIP_FORMATTER_JS)
+        
+        return opts.TooltipOpts(
+            is_show=self.chart_model.show_tooltip,
+            trigger="axis",
+            axis_pointer_type=tooltip_type,
+            formatter=formatter,
+        )
+
+    def get_common_global_opts(self, include_axis: bool = True, include_toolbox: bool = True, include_datazoom: bool = True):
+        """Create global options for all charts"""
+        opts_dict = {
+            "title_opts": opts.TitleOpts(
+                title=(
+                    self.chart_model.title.upper()
+                    if getattr(self.chart_model, "show_title", True)
+                    else ""
+                )
+            ),
+            "legend_opts": opts.LegendOpts(
+                is_show=self.chart_model.show_legend, pos_top="20px"
+            ),
+            "tooltip_opts": self.get_tooltip_opts(),
+        }
+
+        if include_axis:
+            opts_dict.update(
+                {
+                    "xaxis_opts": opts.AxisOpts(
+                        is_show=self.chart_model.show_x_axis,
+                        axislabel_opts=opts.LabelOpts(
+                            is_show=getattr(self.chart_model, "show_x_label", True)
+                        ),
+                        splitline_opts=opts.SplitLineOpts(
+                            is_show=getattr(self.chart_model, "show_grid", False)
+                        ),
+                    ),
+                    "yaxis_opts": opts.AxisOpts(
+                        is_show=self.chart_model.show_y_axis,
+                        axislabel_opts=opts.LabelOpts(
+                            is_show=getattr(self.chart_model, "show_y_label", True),
+                            font_size=getattr(self.chart_model, "y_axis_font_size", 10),
+                            margin=getattr(self.chart_model, "y_axis_margin", 8),
+                            formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                        ),
+                        splitline_opts=opts.SplitLineOpts(
+                            is_show=getattr(self.chart_model, "show_grid", False)
+                        ),
+                        axisline_opts=opts.AxisLineOpts(
+                            linestyle_opts=opts.LineStyleOpts(width=1)
+                        ),
+                        axistick_opts=opts.AxisTickOpts(
+                            is_align_with_label=True
+                        ),
+                    ),
+                }
+            )
+
+        if include_toolbox:
+            opts_dict["toolbox_opts"] = opts.ToolboxOpts(
+                is_show=True,
+                feature={
+                    "magicType": {
+                        "show": True,
+                        "type": ["line", "bar", "stack"],
+                    },
+                    "saveAsImage": {"show": True},
+                },
+            )
+
+        if include_datazoom:
+            range_start, range_end = getattr(self.chart_model, "datazoom_range", (10, 70))
+            opts_dict["datazoom_opts"] = [
+                opts.DataZoomOpts(
+                    type_="slider",
+                    orient="horizontal",
+                    range_start=range_start,
+                    range_end=range_end,
+                    pos_bottom="5%",
+                    pos_top="88%",
+                    pos_left="10%",
+                    pos_right="10%",
+                ),
+                opts.DataZoomOpts(type_="inside"),
+            ]
+
+        return opts_dict
+
+    def extend_opts(self, opts_dict: dict, extra_opts: dict) -> dict:
+        """Merge additional options into opts_dict (subclass can override)"""
+        opts_dict.update(extra_opts)
+        return opts_dict
+
+    def cleanup(self, *objs):
+        """Cleanup memory for dataframe/temporary variables"""
+        for obj in objs:
+            try:
+                del obj
+            except:
+                pass
+
+    def category_labels(self, df: pd.DataFrame, columns: List[str]) -> list:
+        """category_labels() of the aggregated rows, timed as the "category_labels" stage"""
+        with self.span("category_labels") as span:
+            labels = category_labels(df, columns)
+            span.set(points=len(labels))
+            return labels
+
+    def embed(self, chart) -> str:
+        """chart.render_embed(), timed as the "render_embed" stage"""
+        with self.span("render_embed") as span:
+            html = chart.render_embed()
+            if span is not NOOP_SPAN:
+                span.set(html_bytes=len(html.encode("utf-8")))
+            return html
+
+    def encode_base64(self, image: bytes) -> str:
+        with self.span("base64"):
+            return base64.b64encode(image).decode("utf-8")
+
+    def release_memory(self):
+        """End of a render: collect garbage according to the memory policy (chart.memory)"""
+        get_memory_policy().after_render()
+
+    def series_values(self, df: pd.DataFrame, column: str) -> list:
+        """Values of one y column for the chart options, rounded to chart_model.y_precision"""
+        values = df[column]
+        precision = getattr(self.chart_model, "y_precision", None)
+        if precision is not None:
+            values = values.round(precision)
+        return values.to_list()
+
+    def is_large(self, points: int) -> bool:
+        threshold = getattr(self.chart_model, "large_threshold", None)
+        return threshold is not None and points >= threshold
+
+    def large_series_opts(self, points: int, series_type: str) -> dict:
+        """ECharts series keys for a ``series_type`` series of ``points`` points: above
+        chart_model.large_threshold progressive rendering, LTTB sampling of what does not fit
+        the pixels and no hover effects (plus ``large`` batching for bars); nothing below"""
+        if not self.is_large(points):
+            return {}
+        threshold = self.chart_model.large_threshold
+        series_opts = {
+            "progressive": PROGRESSIVE_CHUNK,
+            "progressiveThreshold": threshold,
+            "sampling": "lttb",
+            "emphasis": {"disabled": True},
+        }
+        if series_type == "bar":
+            series_opts.update({"large": True, "largeThreshold": threshold})
+        else:
+            series_opts.update({"showSymbol": False, "hoverAnimation": False})
+        return series_opts
+
+    def init_renderer(self, points: int, for_image: bool = False) -> str:
+        """InitOpts renderer for a chart of ``points`` points in total (chart_model.renderer)"""
+        renderer = getattr(self.chart_model, "renderer", None) or "auto"
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unsupported renderer: {renderer}. Use one of {RENDERERS}")
+        if for_image:
+            return "canvas"
+        if renderer != "auto":
+            return renderer
+        return "svg" if points <= SVG_RENDERER_MAX_POINTS else "canvas"
+
+    def use_compact_output(self) -> bool:
+        return bool(getattr(self.chart_model, "compact_output", False))
+
+    def add_series_data(self, chart, df: pd.DataFrame, categories: list, horizontal: bool = False) -> dict:
+        """Attach the categories to the chart and return the add_yaxis data kwargs of each y column.
+
+        With chart_model.compact_output the values go into one column-oriented ECharts
+        dataset that the series reference through ``encode``."""
+        if not self.use_compact_output():
+            chart.add_xaxis(categories)
+            return {column: {"y_axis": self.series_values(df, column)} for column in self.chart_model.y_axis}
+
+        source = {"_category": list(categories)}
+        for column in self.chart_model.y_axis:
+            source[column] = self.series_values(df, column)
+        chart.add_dataset(source=source)
+
+        category_dim, value_dim = ("y", "x") if horizontal else ("x", "y")
+        return {
+            column: {"y_axis": [], "encode": {category_dim: "_category", value_dim: column}}
+            for column in self.chart_model.y_axis
+        }
+
+    def minify_options(self, chart):
+        """Make render_embed write the option JSON without indentation"""
+        chart.dump_options = lambda: replace_placeholder(
+            simplejson.dumps(chart.get_options(), default=default, ignore_nan=True, separators=(",", ":"))
+        )
+
+    def check_backend(self, backend: str):
+        if backend not in IMAGE_BACKENDS:
+            raise ValueError(f"Unsupported image backend: {backend}. Use one of {IMAGE_BACKENDS}")
+
+    def snapshot(self, chart) -> bytes:
+        """Snapshot a built pyecharts chart to PNG bytes in memory (no temp files)"""
+        html = self.embed(chart)
+        with self.span("snapshot") as span:
+            image = snapshot_html(html, [chart.chart_id])[0]
+            span.set(png_bytes=len(image))
+            return image
+
+    async def snapshot_async(self, chart) -> bytes:
+        """Awaitable snapshot: the event loop is not blocked while the browser draws"""
+        html = await run_in_prep_executor(self.embed, chart)
+        with self.span("snapshot") as span:
+            image = (await snapshot_html_async(html, [chart.chart_id]))[0]
+            span.set(png_bytes=len(image))
+            return image
+
+    def render(self):
+        raise NotImplementedError("Need implement this method in subclass")
@@ -0,0 +1,318 @@
+# src/chart/components/bar_chart.py
+# This file defines a BarChart class that extends the Chart base class.
+
+import os
+from pyecharts.charts import Bar
+from pyecharts import options as opts
+from pyecharts.commons.utils import JsCode
+from chart.base import BaseChart, AXIS_LABEL_FORMATTER_JS, BAR_LABEL_FORMATTER_JS
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import bar_svg, svg_to_png
+
+
+class BarChart(BaseChart):
+
+    def render(self, horizontal=False, show_label: bool = False):
+        try:
+            bar = self._build_bar_chart(
+                horizontal=horizontal, show_label=show_label, for_image=False
+            )
+
+            bar.add_js_funcs(
+                f"""
+                var chartDom = document.getElementById('{bar.chart_id}');
+                var chartInstance = echarts.getInstanceByDom(chartDom);
+                chartInstance.on('magictypechanged', function(params) {{
+                    if (params.currentType === 'line') {{
+                        const option = chartInstance.getOption();
+                        if (option.series) {{
+                            option.series.forEach(series => {{
+                                series.showSymbol = true;      
+                                series.symbolSize = 0;         
+                                series.emphasis = {{
+                                    focus: 'series',
+                                    scale: true,
+                                    symbolSize: 8        
+                                }};
+                            }});
+                            chartInstance.setOption(option);
+                        }}
+                    }}
+                }});
+                """
+            )
+
+            self.html = self.embed(bar)
+
+            # Release memory
+            del bar
+            self.release_memory()
+
+            return self.html
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders to HTML failed.\nError: {str(e)}")
+
+    def render_svg(self, horizontal=False, show_label: bool = False) -> str:
+        try:
+            if horizontal:
+                raise ValueError("SVG backend does not support horizontal charts.")
+            new_df, categories = self.get_prepared_data()
+            series = {column: new_df[column].to_list() for column in self.chart_model.y_axis}
+            return bar_svg(self.chart_model, categories, series, self.colors, show_label=show_label)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders SVG failed.\nError: {str(e)}")
+
+    def render_bytes(self, horizontal=False, show_label: bool = False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(horizontal=horizontal, show_label=show_label))
+
+            bar = self._build_bar_chart(
+                horizontal=horizontal, show_label=show_label, for_image=True
+            )
+            image = self.snapshot(bar)
+
+            # Release memory
+            del bar
+            self.release_memory()
+
+            return image
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders bytes failed.\nError: {str(e)}")
+
+    def render_base64(self, horizontal=False, show_label: bool = False, backend: str = "browser"):
+        try:
+            image = self.render_bytes(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders base64 failed.\nError: {str(e)}")
+
+    def render_png(
+        self,
+        output_path: str = None,
+        image_name: str = "chart.png",
+        horizontal=False,
+        show_label: bool = False,
+        backend: str = "browser",
+    ):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, "wb") as f:
+                f.write(self.render_bytes(horizontal=horizontal, show_label=show_label, backend=backend))
+
+            return image_path
+
+        except Exception as e:
+            raise RuntimeError(f"BarChart render PNG failed.\nError: {str(e)}")
+
+    async def render_async(self, horizontal=False, show_label: bool = False):
+        return await run_in_prep_executor(
+            self.render, horizontal=horizontal, show_label=show_label
+        )
+
+    async def render_bytes_async(self, horizontal=False, show_label: bool = False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(
+                    self.render_bytes, horizontal=horizontal, show_label=show_label, backend=backend
+                )
+
+            bar = await run_in_prep_executor(
+                self._build_bar_chart,
+                horizontal=horizontal,
+                show_label=show_label,
+                for_image=True,
+            )
+            return await self.snapshot_async(bar)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders bytes failed.\nError: {str(e)}")
+
+    async def render_base64_async(self, horizontal=False, show_label: bool = False, backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders base64 failed.\nError: {str(e)}")
+
+    async def render_png_async(
+        self,
+        output_path: str = None,
+        image_name: str = "chart.png",
+        horizontal=False,
+        show_label: bool = False,
+        backend: str = "browser",
+    ):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, "wb") as f:
+                f.write(await self.render_bytes_async(horizontal=horizontal, show_label=show_label, backend=backend))
+
+            return image_path
+
+        except Exception as e:
+            raise RuntimeError(f"BarChart render PNG failed.\nError: {str(e)}")
+
+    def _prepare_chart_data(self):
+        new_df = self.aggregate_data()
+
+        categories = self.category_labels(new_df, self.chart_model.x_axis)
+
+        return new_df, categories
+
+
+    def _format_large_numbers(self, value):
+        """Format large numbers with K/M/B suffixes"""
+        if value >= 1000000000:
+            return f"{(value / 1000000000):.1f}B"
+        elif value >= 1000000:
+            return f"{(value / 1000000):.1f}M"
+        elif value >= 1000:
+            return f"{(value / 1000):.1f}K"
+        else:
+            return str(value)
+
+    def _format_data_for_display(self, df):
+        """Format data values for display if K/M/B formatting is enabled"""
+        if getattr(self.chart_model, "y_axis_format_large_numbers", True):
+            # Create a copy of the data to avoid modifying the original
+            formatted_df = df.copy()
+            
+            # Format y-axis columns
+            for col in self.chart_model.y_axis:
+                if col in formatted_df.columns:
+                    formatted_df[col] = formatted_df[col].apply(self._format_large_numbers)
+            
+            return formatted_df
+        return df
+
+    @traced("build_options")
+    def _build_bar_chart(self, horizontal=False, show_label=False, for_image=False, render_path: str = None) -> Bar:
+        # Calculate width to accommodate large numbers
+        chart_width = "1200px" if for_image else "100%"
+        chart_height = f"{self.chart_model.size.height}px"
+        
+        new_df, categories = self.get_prepared_data()
+        points = len(categories)
+
+        bar = Bar(
+            init_opts=opts.InitOpts(
+                width=chart_width,
+                height=chart_height,
+                renderer=self.init_renderer(points * len(self.chart_model.y_axis), for_image=for_image),
+                animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
+            )
+        )
+
+        series_data = self.add_series_data(bar, new_df, categories, horizontal=horizontal)
+        large_opts = self.large_series_opts(points, "bar")
+
+        for column in self.chart_model.y_axis:
+            # Add formatter for bar labels if K/M/B formatting is enabled
+            label_formatter = None
+            if show_label and getattr(self.chart_model, "y_axis_format_large_numbers", True):
+                label_formatter = JsCode(BAR_LABEL_FORMATTER_JS)
+            
+            bar.add_yaxis(
+                column,
+                **series_data[column],
+                label_opts=opts.LabelOpts(
+                    is_show=show_label,
+                    formatter=label_formatter
+                ),
+            )
+            if large_opts:
+                bar.options["series"][-1].update(large_opts)
+
+        if horizontal:
+            bar.reversal_axis()
+
+        opts_dict = self.get_common_global_opts(
+            include_axis=False,  # Don't include axis from base to avoid formatter override
+            include_datazoom=not for_image,
+            include_toolbox=not for_image,
+        )
+
+        # Add axis options manually to ensure our formatter is used
+        opts_dict["xaxis_opts"] = opts.AxisOpts(
+            is_show=self.chart_model.show_x_axis,
+            axislabel_opts=opts.LabelOpts(
+                is_show=getattr(self.chart_model, "show_x_label", True)
+            ),
+            splitline_opts=opts.SplitLineOpts(
+                is_show=getattr(self.chart_model, "show_grid", False)
+            ),
+        )
+        
+        # Add y-axis with our custom formatter
+        opts_dict["yaxis_opts"] = opts.AxisOpts(
+            is_show=self.chart_model.show_y_axis,
+            axislabel_opts=opts.LabelOpts(
+                is_show=getattr(self.chart_model, "show_y_label", True),
+                font_size=getattr(self.chart_model, "y_axis_font_size", 14),
+                margin=getattr(self.chart_model, "y_axis_margin", 8),
+                formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+            ),
+            splitline_opts=opts.SplitLineOpts(
+                is_show=getattr(self.chart_model, "show_grid", False)
+            ),
+            axisline_opts=opts.AxisLineOpts(
+                linestyle_opts=opts.LineStyleOpts(width=1)
+            ),
+            axistick_opts=opts.AxisTickOpts(
+                is_align_with_label=True
+            ),
+            min_=0,  # Set minimum to 0
+            max_=None,  # Let ECharts auto-calculate max based on data
+        )
+
+        if for_image:
+            opts_dict["datazoom_opts"] = [opts.DataZoomOpts(is_show=False)]
+            # Override y-axis options for better PNG rendering with K/M/B formatting
+            opts_dict["yaxis_opts"] = opts.AxisOpts(
+                is_show=self.chart_model.show_y_axis,
+                axislabel_opts=opts.LabelOpts(
+                    is_show=getattr(self.chart_model, "show_y_label", True),
+                    font_size=max(getattr(self.chart_model, "y_axis_font_size", 14), 14),  # Ensure minimum 14 for PNG
+                    margin=max(getattr(self.chart_model, "y_axis_margin", 8), 25),  # Ensure minimum 25 for PNG
+                    rotate=0,  # No rotation to prevent truncation
+                    formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                ),
+                splitline_opts=opts.SplitLineOpts(
+                    is_show=getattr(self.chart_model, "show_grid", False)
+                ),
+                axisline_opts=opts.AxisLineOpts(
+                    linestyle_opts=opts.LineStyleOpts(width=1)
+                ),
+                axistick_opts=opts.AxisTickOpts(
+                    is_align_with_label=True
+                ),
+                min_=0,  # Set minimum to 0
+                max_=None,  # Let ECharts auto-calculate max based on data
+            )
+            
+
+            
+
+
+        bar.set_global_opts(**opts_dict)
+        bar.set_colors(self.colors)
+
+        if self.use_compact_output():
+            self.minify_options(bar)
+
+        if for_image and render_path:
+            bar.render(render_path)
+
+        self.cleanup(new_df, categories, series_data, opts_dict)
+        return bar
@@ -0,0 +1,284 @@
+# src/chart/components/line_chart.py
+# This file defines a LineChart class that extends the Chart base class.
+
+import os
+from pyecharts.charts import Line
+from pyecharts import options as opts
+from pyecharts.commons.utils import JsCode
+from chart.base import BaseChart, AXIS_LABEL_FORMATTER_JS
+from chart.downsample import downsample_frame
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import line_svg, svg_to_png
+import pandas as pd
+
+class LineChart(BaseChart):
+
+    def render(self, horizontal=False):
+        try:
+            line = self._build_line_chart(horizontal=horizontal, for_image=False)
+            self.html = self.embed(line)
+
+            del line
+            self.release_memory()
+
+            return self.html
+
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders to HTML failed.\nError: {str(e)}")
+
+    def render_svg(self, horizontal=False) -> str:
+        try:
+            if horizontal:
+                raise ValueError("SVG backend does not support horizontal charts.")
+            new_df, categories = self.get_prepared_data()
+            series = {column: new_df[column].to_list() for column in self.chart_model.y_axis}
+            return line_svg(self.chart_model, categories, series, self.colors)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders SVG failed.\nError: {str(e)}")
+
+    def render_bytes(self, horizontal=False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(horizontal=horizontal))
+
+            line = self._build_line_chart(horizontal=horizontal, for_image=True)
+            image = self.snapshot(line)
+
+            del line
+            self.release_memory()
+
+            return image
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders bytes failed.\nError: {str(e)}")
+
+    def render_base64(self, horizontal=False, backend: str = "browser"):
+        try:
+            return self.encode_base64(self.render_bytes(horizontal=horizontal, backend=backend))
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders base64 failed.\nErorr: {str(e)}")
+
+    def render_png(
+        self, output_path: str = None, image_name: str = "chart.png", horizontal=False,
+        backend: str = "browser",
+    ):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, "wb") as f:
+                f.write(self.render_bytes(horizontal=horizontal, backend=backend))
+
+            return image_path
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders PNG failed.\nError: {str(e)}")
+
+    async def render_async(self, horizontal=False):
+        return await run_in_prep_executor(self.render, horizontal=horizontal)
+
+    async def render_bytes_async(self, horizontal=False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(self.render_bytes, horizontal=horizontal, backend=backend)
+
+            line = await run_in_prep_executor(
+                self._build_line_chart, horizontal=horizontal, for_image=True
+            )
+            return await self.snapshot_async(line)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders bytes failed.\nError: {str(e)}")
+
+    async def render_base64_async(self, horizontal=False, backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders base64 failed.\nError: {str(e)}")
+
+    async def render_png_async(
+        self, output_path: str = None, image_name: str = "chart.png", horizontal=False,
+        backend: str = "browser",
+    ):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, "wb") as f:
+                f.write(await self.render_bytes_async(horizontal=horizontal, backend=backend))
+
+            return image_path
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders PNG failed.\nError: {str(e)}")
+
+    def _prepare_chart_data(self):
+        try:
+            self.set_default_axis()
+            new_df = self.aggregate_data()
+
+            max_points = getattr(self.chart_model, "max_points", None)
+            if max_points:
+                new_df = downsample_frame(
+                    new_df, self.chart_model.y_axis, max_points,
+                    method=getattr(self.chart_model, "downsample_method", "lttb"),
+                )
+
+            x_axis = [self.chart_model.x_axis] if isinstance(self.chart_model.x_axis, str) else self.chart_model.x_axis
+            categories = self.category_labels(new_df, x_axis)
+
+            return new_df, categories
+        except Exception as e:
+            return pd.DataFrame(), []
+    
+
+
+    def _format_large_numbers(self, value):
+        """Format large numbers with K/M/B suffixes"""
+        if value >= 1000000000:
+            return f"{(value / 1000000000):.1f}B"
+        elif value >= 1000000:
+            return f"{(value / 1000000):.1f}M"
+        elif value >= 1000:
+            return f"{(value / 1000):.1f}K"
+        else:
+            return str(value)
+
+    def _format_data_for_display(self, df):
+        """Format data values for display if K/M/B formatting is enabled"""
+        if getattr(self.chart_model, "y_axis_format_large_numbers", True):
+            # Create a copy of the data to avoid modifying the original
+            formatted_df = df.copy()
+            
+            # Format y-axis columns
+            for col in self.chart_model.y_axis:
+                if col in formatted_df.columns:
+                    formatted_df[col] = formatted_df[col].apply(self._format_large_numbers)
+            
+            return formatted_df
+        return df
+
+    @traced("build_options")
+    def _build_line_chart(self, horizontal=False, for_image=False, render_path: str = None) -> Line:
+        # Calculate width to accommodate large numbers
+        chart_width = "1200px" if for_image else "100%"
+        chart_height = f"{self.chart_model.size.height}px"
+        
+        new_df, categories = self.get_prepared_data()
+        points = len(categories)
+
+        line = Line(
+            init_opts=opts.InitOpts(
+                width=chart_width,
+                height=chart_height,
+                renderer=self.init_renderer(points * len(self.chart_model.y_axis), for_image=for_image),
+                animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
+            )
+        )
+
+        series_data = self.add_series_data(line, new_df, categories, horizontal=horizontal)
+        large_opts = self.large_series_opts(points, "line")
+        for column in self.chart_model.y_axis:
+                line.add_yaxis(
+                    column,
+                    **series_data[column],
+                    is_symbol_show=False,
+                    symbol_size=8,
+                    is_hover_animation=True,
+                    label_opts=opts.LabelOpts(is_show=False),
+                    emphasis_opts=opts.EmphasisOpts(
+                        is_disabled=False,
+                        focus="series",
+                        linestyle_opts=opts.LineStyleOpts(width=3, opacity=1),
+                    ),
+                )
+                if large_opts:
+                    line.options["series"][-1].update(large_opts)
+
+        if horizontal:
+            line.reversal_axis()
+
+        # dùng helper từ class cha
+        opts_dict = self.get_common_global_opts(
+            include_axis=False,  # Don't include axis from base to avoid formatter override
+            include_datazoom=not for_image,
+            include_toolbox=not for_image,
+        )
+
+        # Add axis options manually to ensure our formatter is used
+        opts_dict["xaxis_opts"] = opts.AxisOpts(
+            is_show=self.chart_model.show_x_axis,
+            axislabel_opts=opts.LabelOpts(
+                is_show=getattr(self.chart_model, "show_x_label", True)
+            ),
+            splitline_opts=opts.SplitLineOpts(
+                is_show=getattr(self.chart_model, "show_grid", False)
+            ),
+        )
+        
+        # Add y-axis with our custom formatter
+        opts_dict["yaxis_opts"] = opts.AxisOpts(
+            is_show=self.chart_model.show_y_axis,
+            axislabel_opts=opts.LabelOpts(
+                is_show=getattr(self.chart_model, "show_y_label", True),
+                font_size=getattr(self.chart_model, "y_axis_font_size", 10),
+                margin=getattr(self.chart_model, "y_axis_margin", 8),
+                formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+            ),
+            splitline_opts=opts.SplitLineOpts(
+                is_show=getattr(self.chart_model, "show_grid", False)
+            ),
+            axisline_opts=opts.AxisLineOpts(
+                linestyle_opts=opts.LineStyleOpts(width=1)
+            ),
+            axistick_opts=opts.AxisTickOpts(
+                is_align_with_label=True
+            ),
+            min_=0,  # Set minimum to 0
+            max_=None,  # Let ECharts auto-calculate max based on data
+        )
+
+        if for_image:
+            opts_dict["datazoom_opts"] = [
+                opts.DataZoomOpts(type_="inside", range_start=0, range_end=100, is_show=False)
+            ]
+            # Override y-axis options for better PNG rendering with K/M/B formatting
+            opts_dict["yaxis_opts"] = opts.AxisOpts(
+                is_show=self.chart_model.show_y_axis,
+                axislabel_opts=opts.LabelOpts(
+                    is_show=getattr(self.chart_model, "show_y_label", True),
+                    font_size=max(getattr(self.chart_model, "y_axis_font_size", 10), 14),  # Ensure minimum 14 for PNG
+                    margin=max(getattr(self.chart_model, "y_axis_margin", 8), 25),  # Ensure minimum 25 for PNG
+                    rotate=0,  # No rotation to prevent truncation
+                    formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                ),
+                splitline_opts=opts.SplitLineOpts(
+                    is_show=getattr(self.chart_model, "show_grid", False)
+                ),
+                axisline_opts=opts.AxisLineOpts(
+                    linestyle_opts=opts.LineStyleOpts(width=1)
+                ),
+                axistick_opts=opts.AxisTickOpts(
+                    is_align_with_label=True
+                ),
+                min_=0,  # Set minimum to 0
+                max_=None,  # Let ECharts auto-calculate max based on data
+            )
+            
+
+            
+
+
+        line.set_global_opts(**opts_dict)
+        line.set_colors(self.colors)
+
+        if self.use_compact_output():
+            self.minify_options(line)
+
+        if for_image and render_path:
+            line.render(render_path)
+
+        self.cleanup(new_df, categories, series_data, opts_dict)
+        return line
\ No newline at end of file
@@ -0,0 +1,237 @@
+import os
+from typing import List
+import numpy as np
+import pandas as pd
+from pyecharts.charts import Pie
+from pyecharts import options as opts
+from chart.base import BaseChart
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import pie_svg, svg_to_png
+
+from chart.models.chart_model import ChartModel
+
+
+class PieChart(BaseChart):
+
+    def __init__(self, chart_model: ChartModel, data: pd.DataFrame, 
+                 colors: List[str]=  ['#BF9924', '#F2CC0F', '#F2A30F', '#D97D0D', '#733F12', '#7F6A51', '#FFB156', '#FFD4A2', '#7F582B', '#CCAA82']
+                 ):
+        super().__init__(chart_model, data, colors)
+
+    def render(self, threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False):
+        try:
+            data_present = self.get_prepared_data(threshold, group_other_name)
+            pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=False)
+
+            self.html = self.embed(pie)
+            
+            del data_present, pie  
+            self.release_memory()
+
+            return self.html
+
+        except Exception as e:
+            self.html = ""
+            raise RuntimeError(f"PieChart render to HTML failed.\nError: {str(e)}")
+        finally:
+            return self.html
+
+    def render_svg(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False) -> str:
+        try:
+            data_present = self.get_prepared_data(threshold, group_other_name)
+            return pie_svg(self.chart_model, data_present, self.colors, donut=donut, show_label=show_label)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders SVG failed.\nError: {str(e)}")
+
+    def render_bytes(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label))
+
+            data_present = self.get_prepared_data(threshold, group_other_name)
+            pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=True)
+            image = self.snapshot(pie)
+
+            del data_present, pie
+            self.release_memory()
+
+            return image
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders bytes failed.\nError: {str(e)}")
+
+    def render_base64(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser"):
+        try:
+            image = self.render_bytes(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders base64 failed.\nError: {str(e)}")
+
+    def render_png(self, output_path: str = None, image_name: str = 'chart.png',
+                threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False,
+                backend: str = "browser"):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, 'wb') as f:
+                f.write(self.render_bytes(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend))
+
+            return image_path
+        
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders PNG failed.\nError: {str(e)}")
+        
+    
+
+    async def render_async(self, threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False):
+        return await run_in_prep_executor(
+            self.render, threshold, donut=donut, group_other_name=group_other_name, show_label=show_label
+        )
+
+    async def render_bytes_async(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(
+                    self.render_bytes, threshold, donut=donut, group_other_name=group_other_name,
+                    show_label=show_label, backend=backend
+                )
+
+            data_present = await run_in_prep_executor(self.get_prepared_data, threshold, group_other_name)
+            pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=True)
+            return await self.snapshot_async(pie)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders bytes failed.\nError: {str(e)}")
+
+    async def render_base64_async(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders base64 failed.\nError: {str(e)}")
+
+    async def render_png_async(self, output_path: str = None, image_name: str = 'chart.png',
+                threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False,
+                backend: str = "browser"):
+        try:
+            output_dir = output_path or os.getcwd()
+            os.makedirs(output_dir, exist_ok=True)
+
+            image_path = os.path.join(output_dir, image_name)
+
+            with open(image_path, 'wb') as f:
+                f.write(await self.render_bytes_async(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend))
+
+            return image_path
+
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders PNG failed.\nError: {str(e)}")
+
+    def _prepare_chart_data(self, threshold: float = 0.05, group_other_name: str = "Others"):
+        if len(self.chart_model.y_axis) != 1:
+            raise ValueError("Pie chart requires exactly one y_axis (value).")
+
+        value_col = self.chart_model.y_axis[0]
+
+        # Aggregate the source frame as is (no copy), then work on the per-slice arrays only
+        max_slices = getattr(self.chart_model, "max_slices", None)
+        grouped_df = self.aggregate_data(keys=self.chart_model.x_axis, y_columns=[value_col], top_n=max_slices)
+        if len(self.chart_model.x_axis) == 1:
+            labels = grouped_df[self.chart_model.x_axis[0]].to_numpy(dtype=object)
+        else:
+            labels = np.asarray(self.category_labels(grouped_df, self.chart_model.x_axis), dtype=object)
+        values = grouped_df[value_col].to_numpy()
+
+        # A source that returned only the top groups reports the total of all of them
+        truncated = "total" in grouped_df.attrs
+        total = grouped_df.attrs["total"] if truncated else values.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keep = ~(values / total < threshold)
+
+        limited = False
+        others_value = (total - values[keep].sum()) if truncated else values[~keep].sum()
+        if max_slices and (keep.sum() > max_slices or (keep.sum() == max_slices and others_value > 0)):
+            # Top max_slices - 1 slices by value (partial sort), one more slice for Others
+            candidates = np.flatnonzero(keep)
+            top = max_slices - 1
+            keep = np.zeros(len(values), dtype=bool)
+            if top > 0:
+                keep[candidates[np.argpartition(values[candidates], -top)[-top:]]] = True
+            limited = True
+            others_value = (total - values[keep].sum()) if truncated else values[~keep].sum()
+
+        if others_value > 0:
+            data_present = [[label, value] for label, value in zip(labels[keep].tolist(), values[keep].tolist())]
+            data_present.append([group_other_name, others_value.item()])
+        elif limited:
+            data_present = [[label, value] for label, value in zip(labels[keep].tolist(), values[keep].tolist())]
+        else:
+            data_present = [[label, value] for label, value in zip(labels.tolist(), values.tolist())]
+
+        del grouped_df, labels, values, keep
+        return data_present
+
+    @traced("build_options")
+    def _build_pie_chart(self, data_present, donut=False, show_label=False, for_image=False, render_path: str = None) -> Pie:
+        precision = getattr(self.chart_model, "y_precision", None)
+        if precision is not None:
+            data_present = [[name, round(value, precision)] for name, value in data_present]
+
+        pie = Pie(init_opts=opts.InitOpts(
+            width="80%" if for_image else "100%",
+            height=f"{self.chart_model.size.height}px",
+            renderer=self.init_renderer(len(data_present), for_image=for_image),
+            animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
+        ))
+
+        pie.add(
+            series_name="",
+            data_pair=data_present,
+            radius=["40%", "75%"] if donut else "55%",
+            label_opts=opts.LabelOpts(
+                is_show=show_label,
+                formatter="{b}: {d}%"
+            )
+        )
+
+        pie.set_colors(self.colors)
+
+        opts_dict = self.get_common_global_opts(
+            include_axis=False,
+            include_datazoom=False,
+            include_toolbox=False
+        )
+
+        opts_dict["legend_opts"] = opts.LegendOpts(
+            is_show=self.chart_model.show_legend,
+            type_="scroll",
+            pos_left="80%",
+            orient="vertical"
+        )
+
+        pie.set_global_opts(**opts_dict)
+
+        if self.use_compact_output():
+            self.minify_options(pie)
+
+        if for_image and render_path:
+            pie.render(render_path)
+
+        return pie
@@ -0,0 +1,80 @@
+# src/chart/downsample.py
+# This file reduces long line series to a point budget while keeping their visual shape
+# (Largest-Triangle-Three-Buckets and min/max per bucket).
+
+from typing import List
+import numpy as np
+import pandas as pd
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    Points are evenly spaced on the category axis, so their position is used as x.
+    Each bucket is one vectorized argmax; only the walk over the buckets is a loop."""
+    n = len(values)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    y = np.nan_to_num(np.asarray(values, dtype=np.float64))
+    # First and last points are always kept, the others are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Average point of every bucket, used as the third triangle vertex
+    sums = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_y = np.append(sums / counts, y[n - 1])
+    avg_x = np.append((edges[:-1] + edges[1:] - 1) / 2, n - 1)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        ax, ay = a, y[a]
+        cx, cy = avg_x[bucket + 1], avg_y[bucket + 1]
+        bx = np.arange(start, end)
+        # Twice the triangle area, as a linear function of the candidate point b
+        area = np.abs((ax - cx) * (y[start:end] - ay) - (ax - bx) * (cy - ay))
+        a = start + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+
+
+def minmax_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the minimum and maximum of every bucket (plus first and last point)"""
+    n = len(values)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    y = np.nan_to_num(np.asarray(values, dtype=np.float64))
+    buckets = (n_out - 2) // 2
+    size = int(np.ceil(n / buckets))
+    padding = buckets * size - n
+    low = np.append(y, np.full(padding, np.inf)).reshape(buckets, size)
+    high = np.append(y, np.full(padding, -np.inf)).reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate((
+        [0, n - 1],
+        offsets + low.argmin(axis=1),
+        offsets + high.argmax(axis=1),
+    ))
+    return np.unique(indices[indices < n])
+
+
+def downsample_frame(df: pd.DataFrame, columns: List[str], max_points: int, method: str = "lttb") -> pd.DataFrame:
+    """Keep at most about ``max_points`` rows of ``df``.
+
+    The budget is split between the ``columns`` (one line series each), every series is
+    downsampled on its own and the rows selected by any series are kept so that all the
+    series still share one category axis."""
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsample method: {method}")
+    if max_points is None or len(df) <= max_points:
+        return df
+
+    per_series = max(max_points // max(len(columns), 1), 4)
+    pick = lttb_indices if method == "lttb" else minmax_indices
+    keep = np.unique(np.concatenate([pick(df[column].to_numpy(), per_series) for column in columns]))
+    return df.iloc[keep].reset_index(drop=True)
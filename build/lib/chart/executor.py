@@ -0,0 +1,42 @@
+# src/chart/executor.py
+# This file holds the executor used by the asyncio rendering API for pandas prep and option building.
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+_prep_executor: Optional[Executor] = None
+_prep_executor_lock = threading.Lock()
+
+
+def get_prep_executor() -> Executor:
+    """Return the executor running chart prep work, creating a thread pool on first use"""
+    global _prep_executor
+    with _prep_executor_lock:
+        if _prep_executor is None:
+            _prep_executor = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="chart-prep",
+            )
+        return _prep_executor
+
+
+def set_prep_executor(executor: Executor):
+    """Use a caller-owned executor (e.g. the service's own pool) for chart prep work"""
+    global _prep_executor
+    with _prep_executor_lock:
+        _prep_executor = executor
+
+
+async def run_in_prep_executor(func: Callable, *args, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    executor = get_prep_executor()
+    call = functools.partial(func, *args, **kwargs)
+    if not isinstance(executor, ProcessPoolExecutor):
+        # Like asyncio.to_thread: the call sees the caller's context (e.g. its open instrumentation span)
+        call = functools.partial(contextvars.copy_context().run, call)
+    return await loop.run_in_executor(executor, call)
@@ -0,0 +1,148 @@
+# src/chart/instrument.py
+# This file defines the render instrumentation: per-stage spans (set_default_axis, aggregate,
+# category_labels, prepare, build_options, render_embed, snapshot, base64, ...) with their duration
+# and stats, sent to a pluggable sink. The default sink is disabled and costs one attribute check.
+
+import contextvars
+import functools
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Stages of the open spans. A context variable rather than a thread-local: a span held open
+# across an await (snapshot_async) must not become the parent of another task's spans.
+_span_stack: contextvars.ContextVar = contextvars.ContextVar("orapy_span_stack", default=())
+
+
+class Instrumentation:
+    """Sink for render spans. Subclass it and override ``emit``; this base class is the
+    no-op default (``enabled = False``: no span is even created)."""
+
+    enabled = False
+
+    def emit(self, span: dict):
+        """Called when a span ends with ``{"chart", "stage", "parent", "seconds", "error", **stats}``.
+        Stats depend on the stage: input_rows, groups, series, points, html_bytes, png_bytes."""
+        pass
+
+
+class LoggingInstrumentation(Instrumentation):
+    """Logs one line per span"""
+
+    enabled = True
+
+    def __init__(self, log: logging.Logger = None, level: int = logging.INFO):
+        self.log = log or logger
+        self.level = level
+
+    def emit(self, span: dict):
+        fields = [f"chart={span['chart']}", f"stage={span['stage']}", f"parent={span['parent']}",
+                  f"seconds={span['seconds']:.6f}"]
+        fields += [f"{name}={value}" for name, value in span.items()
+                   if name not in ("chart", "stage", "parent", "seconds") and value is not None]
+        self.log.log(self.level, " ".join(fields))
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Keeps the spans in memory (benchmarks, debugging a slow chart)"""
+
+    enabled = True
+
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def emit(self, span: dict):
+        with self._lock:
+            self.spans.append(span)
+
+    def stage_seconds(self) -> dict:
+        """Total seconds per stage"""
+        with self._lock:
+            totals = {}
+            for span in self.spans:
+                totals[span["stage"]] = totals.get(span["stage"], 0.0) + span["seconds"]
+            return totals
+
+
+class Span:
+    """Context manager timing one stage; ``set(**stats)`` adds stats before it ends"""
+
+    __slots__ = ("instrumentation", "chart", "stage", "stats", "parent", "start", "token")
+
+    def __init__(self, instrumentation: Instrumentation, chart: Optional[str], stage: str, stats: dict):
+        self.instrumentation = instrumentation
+        self.chart = chart
+        self.stage = stage
+        self.stats = stats
+
+    def set(self, **stats):
+        self.stats.update(stats)
+
+    def __enter__(self):
+        stack: Tuple[str, ...] = _span_stack.get()
+        self.parent = stack[-1] if stack else None
+        self.token = _span_stack.set(stack + (self.stage,))
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - self.start
+        _span_stack.reset(self.token)
+        try:
+            self.instrumentation.emit({
+                "chart": self.chart,
+                "stage": self.stage,
+                "parent": self.parent,
+                "seconds": seconds,
+                "error": exc_type.__name__ if exc_type else None,
+                **self.stats,
+            })
+        except Exception as e:
+            # A failing sink must not fail the render
+            logger.debug(f"Instrumentation sink failed.\nError: {str(e)}")
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **stats):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def traced(stage: str):
+    """Decorator running a BaseChart method inside ``self.span(stage)``"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.span(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_instrumentation = Instrumentation()
+
+
+def configure_instrumentation(instrumentation: Instrumentation = None) -> Instrumentation:
+    """Replace the process-wide instrumentation used by charts without their own (None: no-op)"""
+    global _instrumentation
+    _instrumentation = instrumentation or Instrumentation()
+    return _instrumentation
+
+
+def get_instrumentation() -> Instrumentation:
+    return _instrumentation
@@ -0,0 +1,50 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class ChartSize(BaseModel):
+    width: int = 600
+    height: int = 300
+
+class ChartModel(BaseModel):
+    id: str
+    type: str 
+    title: str
+    x_axis: List[str]
+    y_axis: List[str]
+    x_label: Optional[str] = None
+    y_label: Optional[str] = None
+    show_vertical: float = 0
+    show_legend: bool  = True
+    show_grid: bool  = False
+    show_tooltip: bool = False
+    show_x_axis: bool = True
+    show_y_axis: bool = True
+    show_x_label: bool = False
+    show_y_label: bool = False
+    y_axis_font_size: Optional[int] = Field(default=10, description="Font size for y-axis labels")
+    y_axis_margin: Optional[int] = Field(default=8, description="Margin for y-axis labels")
+    y_axis_format_large_numbers: Optional[bool] = Field(default=True, description="Format large numbers with K/M/B suffixes")
+    compact_output: Optional[bool] = Field(default=False, description="Encode series as an ECharts dataset and minify the option JSON")
+    y_precision: Optional[int] = Field(default=None, description="Round y values to this many decimals in the chart options")
+    max_points: Optional[int] = Field(default=None, description="Downsample line charts to at most this many points")
+    downsample_method: Optional[str] = Field(default="lttb", description="Line downsampling method: 'lttb' or 'minmax'")
+    aggregations: Optional[Dict[str, str]] = Field(default=None, description="Aggregation per y column: sum, mean, max, min or count (default sum)")
+    max_slices: Optional[int] = Field(default=None, description="Maximum number of pie slices, the smallest ones are grouped into Others")
+    time_bucket: Optional[str] = Field(default=None, description="Bucket datetime x values by this interval ('1min', '15min', ...) or 'auto'")
+    large_threshold: Optional[int] = Field(default=2000, description="Points per series from which line/bar series use ECharts large-data mode (None disables it)")
+    renderer: Optional[str] = Field(default="auto", description="ECharts renderer: 'canvas', 'svg' or 'auto' (SVG for small charts, canvas for large ones)")
+
+    size: Optional[ChartSize] = Field(default=ChartSize(width=600, height=300))
+
+
+def copy_model(chart_model: ChartModel, **update) -> ChartModel:
+    """Copy the model with some fields replaced (pydantic v2 or v1)"""
+    copy = getattr(chart_model, "model_copy", None) or chart_model.copy
+    return copy(update=update, deep=True)
+
+
+def model_to_json(chart_model: ChartModel) -> str:
+    """Serialize the model (pydantic v2 or v1) to compare or hash its content"""
+    dump = getattr(chart_model, "model_dump_json", None) or chart_model.json
+    return dump()
+    
\ No newline at end of file
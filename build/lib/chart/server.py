@@ -0,0 +1,173 @@
+# src/chart/server.py
+# This file serves LiveCharts from Flask: a page with the full chart, then the data updates as
+# Server-Sent Events. Each chart is fed by one background thread, shared by every client.
+
+import collections
+import logging
+import queue
+import threading
+from typing import Callable, Dict, Optional
+import pandas as pd
+from flask import Blueprint, Response, abort, request, stream_with_context, url_for
+from chart.live import LiveChart, dump_delta
+
+logger = logging.getLogger(__name__)
+
+# Deltas kept per feed, so a client reconnecting (or loading the page mid-tick) catches up
+REPLAY_DELTAS = 100
+# Deltas waiting for a slow client before it is told to reload the page
+CLIENT_QUEUE_SIZE = 100
+# SSE comment sent when there was no delta for this many seconds (keeps proxies from closing)
+KEEPALIVE_SECONDS = 15.0
+
+RESET_EVENT = "event: reset\ndata: {}\n\n"
+
+# Connects the page's chart to the stream; orapyApplyDelta comes with LiveChart.render()
+LIVE_CLIENT_JS = """
+(function () {
+    var chartInstance = chart_%(chart_id)s;
+    var source = new EventSource("%(stream_url)s");
+    source.onmessage = function (event) { orapyApplyDelta(chartInstance, JSON.parse(event.data)); };
+    source.addEventListener("reset", function () { source.close(); window.location.reload(); });
+})();
+"""
+
+
+class LiveFeed:
+    """A LiveChart fed every ``interval`` seconds with the rows returned by ``fetch()``.
+
+    One thread per feed calls ``fetch``, appends the rows and serializes the delta once;
+    the same SSE message is then queued for every subscribed client."""
+
+    def __init__(self, live_chart: LiveChart, fetch: Callable[[], Optional[pd.DataFrame]], interval: float = 5.0):
+        self.live_chart = live_chart
+        self.fetch = fetch
+        self.interval = interval
+        self._recent = collections.deque(maxlen=REPLAY_DELTAS)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name="orapy-live-feed", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def tick(self) -> Optional[int]:
+        """Fetch, append and broadcast once; returns the delta seq (None when there were no rows)"""
+        rows = self.fetch()
+        if rows is None or len(rows) == 0:
+            return None
+        delta = self.live_chart.append(rows)
+        message = f"id: {delta['seq']}\ndata: {dump_delta(delta)}\n\n"
+        with self._lock:
+            self._recent.append((delta["seq"], message))
+            for client in list(self._subscribers):
+                try:
+                    client.put_nowait(message)
+                except queue.Full:
+                    # Too far behind to catch up with deltas: it has to reload the chart
+                    self._subscribers.discard(client)
+                    _drain(client)
+                    client.put_nowait(RESET_EVENT)
+        return delta["seq"]
+
+    def subscribe(self, since: Optional[int] = None) -> queue.Queue:
+        """Queue of the SSE messages after delta ``since`` (the seq the client's page is at)"""
+        client = queue.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        with self._lock:
+            if since is not None:
+                missed = [message for seq, message in self._recent if seq > since]
+                if self._recent and self._recent[0][0] > since + 1:
+                    # Older than the replay buffer
+                    client.put_nowait(RESET_EVENT)
+                    return client
+                for message in missed[-CLIENT_QUEUE_SIZE:]:
+                    client.put_nowait(message)
+            self._subscribers.add(client)
+        return client
+
+    def unsubscribe(self, client: queue.Queue):
+        with self._lock:
+            self._subscribers.discard(client)
+
+    def events(self, since: Optional[int] = None, keepalive: float = KEEPALIVE_SECONDS):
+        """SSE messages for one client, until it disconnects"""
+        client = self.subscribe(since)
+        try:
+            while True:
+                try:
+                    message = client.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield message
+                if message is RESET_EVENT:
+                    return
+        finally:
+            self.unsubscribe(client)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning(f"Live feed tick failed.\nError: {str(e)}")
+            self._stopped.wait(self.interval)
+
+
+def _drain(client: queue.Queue):
+    while True:
+        try:
+            client.get_nowait()
+        except queue.Empty:
+            return
+
+
+def create_live_blueprint(feeds: Dict[str, LiveFeed], name: str = "orapy_live", url_prefix: str = None,
+                          keepalive: float = KEEPALIVE_SECONDS) -> Blueprint:
+    """Blueprint serving ``/<chart_id>`` (the chart page) and ``/<chart_id>/stream`` (its SSE deltas)
+    for every feed in ``feeds``. The feeds are started on the first page request."""
+    blueprint = Blueprint(name, __name__, url_prefix=url_prefix)
+
+    def get_feed(chart_id: str) -> LiveFeed:
+        feed = feeds.get(chart_id)
+        if feed is None:
+            abort(404)
+        return feed
+
+    @blueprint.route("/<chart_id>")
+    def page(chart_id):
+        feed = get_feed(chart_id)
+        feed.start()
+        try:
+            html, instance_id, seq = feed.live_chart.render_state()
+        except Exception as e:
+            raise RuntimeError(f"Live chart page failed.\nError: {str(e)}")
+        stream_url = url_for(f"{name}.stream", chart_id=chart_id, since=seq)
+        script = LIVE_CLIENT_JS % {"chart_id": instance_id, "stream_url": stream_url}
+        html += f'<script type="text/javascript">{script}</script>'
+        return Response(html, mimetype="text/html")
+
+    @blueprint.route("/<chart_id>/stream")
+    def stream(chart_id):
+        feed = get_feed(chart_id)
+        # EventSource sends the id of the last message it got when it reconnects
+        since = request.headers.get("Last-Event-ID", type=int)
+        if since is None:
+            since = request.args.get("since", type=int)
+        return Response(
+            stream_with_context(feed.events(since, keepalive)),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return blueprint
@@ -0,0 +1,18 @@
+# src/chart/snapshot/__init__.py
+
+from chart.snapshot.browser_pool import (
+    BrowserPool,
+    configure_browser_pool,
+    get_browser_pool,
+    shutdown_browser_pool,
+)
+from chart.snapshot.render import snapshot_html, snapshot_html_async
+
+__all__ = [
+    "BrowserPool",
+    "configure_browser_pool",
+    "get_browser_pool",
+    "shutdown_browser_pool",
+    "snapshot_html",
+    "snapshot_html_async",
+]
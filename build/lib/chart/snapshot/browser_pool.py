@@ -0,0 +1,203 @@
+# src/chart/snapshot/browser_pool.py
+# This file defines a pool of warm headless browser sessions used for PNG/base64 snapshots.
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+from selenium.common.exceptions import WebDriverException
+from snapshot_selenium.snapshot import get_chrome_driver
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledBrowser:
+    """A WebDriver session plus the bookkeeping the pool needs to recycle it"""
+
+    def __init__(self, driver: Any):
+        self.driver = driver
+        self.renders = 0
+        self.last_used = time.monotonic()
+
+
+class BrowserPool:
+    """Keep a fixed number of headless browsers alive and hand them out per snapshot.
+
+    Browsers are created lazily (or all at once with ``prewarm()``), recycled after
+    ``max_renders`` snapshots or when the driver raises a WebDriverException, and
+    health-checked when they have been idle for longer than ``health_check_interval``.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_renders: int = 200,
+        health_check_interval: float = 30.0,
+        acquire_timeout: float = 60.0,
+        driver_factory: Callable[[], Any] = get_chrome_driver,
+    ):
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1.")
+
+        self.size = size
+        self.max_renders = max_renders
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self.driver_factory = driver_factory
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def prewarm(self):
+        """Start every browser of the pool up front instead of on first use"""
+        browsers = []
+        try:
+            while True:
+                with self._lock:
+                    if self._created >= self.size:
+                        break
+                    self._created += 1
+                browsers.append(self._spawn())
+        finally:
+            for browser in browsers:
+                self._idle.put(browser)
+
+    @contextmanager
+    def session(self):
+        """Borrow a driver for one snapshot and give it back (or recycle it) afterwards"""
+        browser = self._acquire()
+        try:
+            yield browser.driver
+        except WebDriverException:
+            # The session is in an unknown state (crashed tab, dead chromedriver...)
+            self._discard(browser)
+            raise
+        except BaseException:
+            self._release(browser)
+            raise
+        else:
+            browser.renders += 1
+            if self.max_renders and browser.renders >= self.max_renders:
+                self._discard(browser)
+            else:
+                self._release(browser)
+
+    def close(self):
+        """Quit every idle browser; browsers still in use are quit when returned"""
+        self._closed = True
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(browser)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "created": self._created,
+            "idle": self._idle.qsize(),
+        }
+
+    def _spawn(self) -> _PooledBrowser:
+        try:
+            return _PooledBrowser(self.driver_factory())
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _acquire(self) -> _PooledBrowser:
+        if self._closed:
+            raise RuntimeError("Browser pool is closed.")
+
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_spawn = self._created < self.size
+                    if can_spawn:
+                        self._created += 1
+                if can_spawn:
+                    return self._spawn()
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("Timed out waiting for a browser from the pool.")
+                try:
+                    browser = self._idle.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+
+            if self._is_healthy(browser):
+                return browser
+            self._discard(browser)
+
+    def _release(self, browser: _PooledBrowser):
+        browser.last_used = time.monotonic()
+        if self._closed:
+            self._discard(browser)
+        else:
+            self._idle.put(browser)
+
+    def _discard(self, browser: _PooledBrowser):
+        with self._lock:
+            self._created -= 1
+        try:
+            browser.driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit browser.\nError: {str(e)}")
+
+    def _is_healthy(self, browser: _PooledBrowser) -> bool:
+        if time.monotonic() - browser.last_used < self.health_check_interval:
+            return True
+        try:
+            return browser.driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+
+_default_pool: Optional[BrowserPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def configure_browser_pool(prewarm: bool = False, **kwargs) -> BrowserPool:
+    """Replace the shared pool used by the chart classes (e.g. at service startup)"""
+    global _default_pool
+    with _default_pool_lock:
+        old_pool = _default_pool
+        _default_pool = BrowserPool(**kwargs)
+        pool = _default_pool
+    if old_pool is not None:
+        old_pool.close()
+    if prewarm:
+        pool.prewarm()
+    return pool
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the shared pool, creating one with default settings on first use"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool()
+        return _default_pool
+
+
+def shutdown_browser_pool():
+    global _default_pool
+    with _default_pool_lock:
+        pool, _default_pool = _default_pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_browser_pool)
@@ -0,0 +1,5 @@
+# src/chart/svg/__init__.py
+
+from chart.svg.renderer import bar_svg, line_svg, pie_svg, svg_to_png
+
+__all__ = ["bar_svg", "line_svg", "pie_svg", "svg_to_png"]
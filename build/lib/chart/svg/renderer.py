@@ -0,0 +1,273 @@
+# src/chart/svg/renderer.py
+# This file draws line, bar and pie charts as SVG in pure Python (no browser needed).
+
+import math
+from typing import Dict, List, Sequence
+from xml.sax.saxutils import escape
+
+from chart.models.chart_model import ChartModel
+
+FONT_FAMILY = "sans-serif"
+IMAGE_WIDTH = 1200
+PIE_IMAGE_WIDTH = 960
+
+# Plot area margins, in px (left leaves room for K/M/B y-axis labels)
+MARGIN_LEFT = 80
+MARGIN_RIGHT = 40
+MARGIN_TOP = 70
+MARGIN_BOTTOM = 40
+
+
+def format_large_number(value: float) -> str:
+    """Same K/M/B formatting as the ECharts y-axis formatter"""
+    if value >= 1000000000:
+        return f"{(value / 1000000000):.1f}B"
+    elif value >= 1000000:
+        return f"{(value / 1000000):.1f}M"
+    elif value >= 1000:
+        return f"{(value / 1000):.1f}K"
+    return f"{value:g}"
+
+
+def _nice_step(span: float, ticks: int = 5) -> float:
+    raw = span / ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 2.5, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def _is_number(value) -> bool:
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _text(x: float, y: float, content: str, size: int = 12, anchor: str = "start",
+          weight: str = "normal", color: str = "#333") -> str:
+    return (
+        f'<text x="{x:.1f}" y="{y:.1f}" font-family="{FONT_FAMILY}" font-size="{size}" '
+        f'font-weight="{weight}" fill="{color}" text-anchor="{anchor}">{escape(str(content))}</text>'
+    )
+
+
+def _open_svg(width: int, height: int) -> List[str]:
+    return [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">',
+        f'<rect width="{width}" height="{height}" fill="#ffffff"/>',
+    ]
+
+
+def _title(chart_model: ChartModel) -> List[str]:
+    if not getattr(chart_model, "show_title", True) or not chart_model.title:
+        return []
+    return [_text(10, 22, chart_model.title.upper(), size=18, weight="bold", color="#464646")]
+
+
+def _horizontal_legend(chart_model: ChartModel, names: Sequence[str], colors: Sequence[str], width: int) -> List[str]:
+    if not chart_model.show_legend or not names:
+        return []
+    item_widths = [25 + 7 * len(str(name)) + 10 for name in names]
+    x = max((width - sum(item_widths)) / 2, 10)
+    parts = []
+    for index, name in enumerate(names):
+        color = colors[index % len(colors)]
+        parts.append(f'<rect x="{x:.1f}" y="26" width="20" height="12" rx="3" fill="{color}"/>')
+        parts.append(_text(x + 25, 36, name))
+        x += item_widths[index]
+    return parts
+
+
+def _value_axis(chart_model: ChartModel, values: List[float]):
+    """Return (min, max, step) of the y-axis, starting at 0 like the ECharts charts"""
+    finite = [value for value in values if _is_number(value)]
+    low = min([0.0] + finite)
+    high = max([0.0] + finite)
+    if high == low:
+        high = low + 1
+    step = _nice_step(high - low)
+    return math.floor(low / step) * step, math.ceil(high / step) * step, step
+
+
+def _axes(chart_model: ChartModel, categories: List[str], low: float, high: float, step: float,
+          left: float, top: float, plot_width: float, plot_height: float, band: bool) -> List[str]:
+    parts = []
+    bottom = top + plot_height
+    y_of = lambda value: bottom - (value - low) / (high - low) * plot_height
+    format_numbers = getattr(chart_model, "y_axis_format_large_numbers", True)
+
+    ticks = int(round((high - low) / step))
+    for tick in range(ticks + 1):
+        value = low + tick * step
+        y = y_of(value)
+        if chart_model.show_grid:
+            parts.append(f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_width}" y2="{y:.1f}" stroke="#e0e6f1"/>')
+        if chart_model.show_y_axis and chart_model.show_y_label:
+            label = format_large_number(value) if format_numbers else f"{value:g}"
+            margin = max(getattr(chart_model, "y_axis_margin", 8) or 8, 25)
+            font_size = max(getattr(chart_model, "y_axis_font_size", 10) or 10, 14)
+            parts.append(_text(left - margin, y + font_size / 3, label, size=font_size, anchor="end", color="#6e7079"))
+
+    if chart_model.show_y_axis:
+        parts.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{bottom}" stroke="#6e7079"/>')
+
+    if chart_model.show_x_axis:
+        parts.append(f'<line x1="{left}" y1="{bottom}" x2="{left + plot_width}" y2="{bottom}" stroke="#6e7079"/>')
+        if chart_model.show_x_label and categories:
+            slot = plot_width / max(len(categories), 1)
+            every = max(1, int(math.ceil(60 / slot)))
+            for index in range(0, len(categories), every):
+                x = left + slot * (index + 0.5) if band else left + slot * index
+                parts.append(_text(x, bottom + 16, categories[index], anchor="middle", color="#6e7079"))
+    return parts
+
+
+def _cartesian_layout(chart_model: ChartModel, series: Dict[str, List[float]]):
+    width = IMAGE_WIDTH
+    height = chart_model.size.height
+    plot_width = width - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = max(height - MARGIN_TOP - MARGIN_BOTTOM, 10)
+    values = [value for column in series.values() for value in column]
+    low, high, step = _value_axis(chart_model, values)
+    return width, height, plot_width, plot_height, low, high, step
+
+
+def line_svg(chart_model: ChartModel, categories: List[str], series: Dict[str, List[float]],
+             colors: Sequence[str]) -> str:
+    """Draw a line chart from prepared categories and {series name: values}"""
+    width, height, plot_width, plot_height, low, high, step = _cartesian_layout(chart_model, series)
+    left, top = MARGIN_LEFT, MARGIN_TOP
+    bottom = top + plot_height
+    slot = plot_width / max(len(categories), 1)
+
+    parts = _open_svg(width, height)
+    parts += _axes(chart_model, categories, low, high, step, left, top, plot_width, plot_height, band=False)
+
+    for index, (name, values) in enumerate(series.items()):
+        color = colors[index % len(colors)]
+        # NaN values break the line instead of being drawn at 0
+        segments, current = [], []
+        for position, value in enumerate(values):
+            if not _is_number(value):
+                if current:
+                    segments.append(current)
+                current = []
+                continue
+            x = left + slot * position
+            y = bottom - (value - low) / (high - low) * plot_height
+            current.append(f"{x:.1f},{y:.1f}")
+        if current:
+            segments.append(current)
+        for points in segments:
+            parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{" ".join(points)}"/>')
+
+    parts += _title(chart_model)
+    parts += _horizontal_legend(chart_model, list(series.keys()), colors, width)
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def bar_svg(chart_model: ChartModel, categories: List[str], series: Dict[str, List[float]],
+            colors: Sequence[str], show_label: bool = False) -> str:
+    """Draw a grouped bar chart from prepared categories and {series name: values}"""
+    width, height, plot_width, plot_height, low, high, step = _cartesian_layout(chart_model, series)
+    left, top = MARGIN_LEFT, MARGIN_TOP
+    bottom = top + plot_height
+    slot = plot_width / max(len(categories), 1)
+    bar_width = slot * 0.7 / max(len(series), 1)
+    zero_y = bottom - (0 - low) / (high - low) * plot_height
+    format_numbers = getattr(chart_model, "y_axis_format_large_numbers", True)
+
+    parts = _open_svg(width, height)
+    parts += _axes(chart_model, categories, low, high, step, left, top, plot_width, plot_height, band=True)
+
+    for index, (name, values) in enumerate(series.items()):
+        color = colors[index % len(colors)]
+        for position, value in enumerate(values):
+            if not _is_number(value):
+                continue
+            x = left + slot * position + slot * 0.15 + bar_width * index
+            y = bottom - (value - low) / (high - low) * plot_height
+            parts.append(
+                f'<rect x="{x:.1f}" y="{min(y, zero_y):.1f}" width="{bar_width:.1f}" '
+                f'height="{abs(zero_y - y):.1f}" fill="{color}"/>'
+            )
+            if show_label:
+                label = format_large_number(value) if format_numbers else f"{value:g}"
+                parts.append(_text(x + bar_width / 2, min(y, zero_y) - 4, label, size=10, anchor="middle"))
+
+    parts += _title(chart_model)
+    parts += _horizontal_legend(chart_model, list(series.keys()), colors, width)
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def pie_svg(chart_model: ChartModel, data_present: List[list], colors: Sequence[str],
+            donut: bool = False, show_label: bool = False) -> str:
+    """Draw a pie (or donut) chart from PieChart's [[name, value], ...] pairs"""
+    width = PIE_IMAGE_WIDTH
+    height = chart_model.size.height
+    center_x, center_y = width * 0.4, height / 2
+    half = min(width, height) / 2
+    outer = half * (0.75 if donut else 0.55)
+    inner = half * 0.4 if donut else 0
+
+    slices = [(str(name), float(value)) for name, value in data_present if _is_number(value) and value > 0]
+    total = sum(value for _, value in slices) or 1
+
+    parts = _open_svg(width, height)
+    angle = -math.pi / 2
+    for index, (name, value) in enumerate(slices):
+        color = colors[index % len(colors)]
+        sweep = value / total * 2 * math.pi
+        if len(slices) == 1:
+            # A full circle cannot be drawn with a single arc
+            parts.append(f'<circle cx="{center_x:.1f}" cy="{center_y:.1f}" r="{outer:.1f}" fill="{color}"/>')
+        else:
+            end = angle + sweep
+            large = 1 if sweep > math.pi else 0
+            ox1, oy1 = center_x + outer * math.cos(angle), center_y + outer * math.sin(angle)
+            ox2, oy2 = center_x + outer * math.cos(end), center_y + outer * math.sin(end)
+            ix1, iy1 = center_x + inner * math.cos(end), center_y + inner * math.sin(end)
+            ix2, iy2 = center_x + inner * math.cos(angle), center_y + inner * math.sin(angle)
+            path = (
+                f"M {ox1:.1f} {oy1:.1f} A {outer:.1f} {outer:.1f} 0 {large} 1 {ox2:.1f} {oy2:.1f} "
+                f"L {ix1:.1f} {iy1:.1f} "
+            )
+            if inner:
+                path += f"A {inner:.1f} {inner:.1f} 0 {large} 0 {ix2:.1f} {iy2:.1f} "
+            parts.append(f'<path d="{path}Z" fill="{color}" stroke="#ffffff" stroke-width="1"/>')
+
+        if show_label:
+            middle = angle + sweep / 2
+            label_x = center_x + (outer + 14) * math.cos(middle)
+            label_y = center_y + (outer + 14) * math.sin(middle)
+            anchor = "start" if math.cos(middle) >= 0 else "end"
+            parts.append(_text(label_x, label_y, f"{name}: {value / total * 100:.2f}%", anchor=anchor))
+        angle += sweep
+
+    if inner and len(slices) == 1:
+        parts.append(f'<circle cx="{center_x:.1f}" cy="{center_y:.1f}" r="{inner:.1f}" fill="#ffffff"/>')
+
+    parts += _title(chart_model)
+    if chart_model.show_legend:
+        y = 40
+        for index, (name, _) in enumerate(slices):
+            if y > height - 10:
+                break
+            color = colors[index % len(colors)]
+            parts.append(f'<rect x="{width * 0.8:.1f}" y="{y - 10}" width="20" height="12" rx="3" fill="{color}"/>')
+            parts.append(_text(width * 0.8 + 25, y, name))
+            y += 22
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def svg_to_png(svg: str, scale: float = 2) -> bytes:
+    """Rasterize an SVG string to PNG bytes (needs the optional cairosvg package)"""
+    try:
+        import cairosvg
+    except ImportError:
+        raise ImportError("PNG output of the SVG backend requires cairosvg: pip install cairosvg")
+    return cairosvg.svg2png(bytestring=svg.encode("utf-8"), scale=scale)
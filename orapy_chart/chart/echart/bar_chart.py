@@ -1,8 +1,7 @@
 from pyecharts.charts import Bar
 from pyecharts import options as opts
 from orapy_chart.chart.echart.base import Chart
-from pyecharts.render import make_snapshot
-from snapshot_selenium import snapshot
+from orapy_chart.chart.echart.browser_pool import snapshot_file
 import base64
 import uuid
 import os
@@ -90,7 +89,7 @@ class BarChart(Chart):
 
             self._build_bar_chart(horizontal=horizontal, show_label=show_label, for_image=True, render_path=tmp_html)
 
-            make_snapshot(snapshot, tmp_html, tmp_png)
+            snapshot_file(tmp_html, tmp_png)
 
             with open(tmp_png, "rb") as f:
                 img_base64 = base64.b64encode(f.read()).decode("utf-8")
@@ -113,7 +112,7 @@ class BarChart(Chart):
 
             self._build_bar_chart(horizontal=horizontal, show_label=show_label, for_image=True, render_path=html_path)
 
-            make_snapshot(snapshot, html_path, image_path)
+            snapshot_file(html_path, image_path)
             os.remove(html_path)
 
         except Exception as e:
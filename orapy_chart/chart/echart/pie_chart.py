@@ -1,8 +1,7 @@
 from pyecharts.charts import Pie
 from pyecharts import options as opts
 from orapy_chart.chart.echart.base import Chart
-from pyecharts.render import make_snapshot
-from snapshot_selenium import snapshot
+from orapy_chart.chart.echart.browser_pool import snapshot_file
 import pandas as pd
 import base64
 import uuid
@@ -110,7 +109,7 @@ class PieChart(Chart):
             self._build_pie_chart(data_present, donut=donut, show_label=show_label,
                                 for_image=True, render_path=tmp_html)
 
-            make_snapshot(snapshot, tmp_html, tmp_png)
+            snapshot_file(tmp_html, tmp_png)
 
             with open(tmp_png, "rb") as f:
                 img_base64 = base64.b64encode(f.read()).decode("utf-8")
@@ -137,7 +136,7 @@ class PieChart(Chart):
             self._build_pie_chart(data_present, donut=donut, show_label=show_label,
                                 for_image=True, render_path=html_path)
 
-            make_snapshot(snapshot, html_path, image_path)
+            snapshot_file(html_path, image_path)
             os.remove(html_path)
         except Exception as e:
             raise RuntimeError(f"Lỗi render PNG (PieChart): {str(e)}")
\ No newline at end of file
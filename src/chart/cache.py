@@ -0,0 +1,93 @@
+# src/chart/cache.py
+# This file defines a content-addressed LRU cache for rendered charts (HTML, base64, PNG bytes, SVG).
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+import pandas as pd
+from chart.models.chart_model import ChartModel, model_to_json
+from chart.native import is_native_frame, native_fingerprint
+
+
+def render_fingerprint(chart_model: ChartModel, data: pd.DataFrame, **render_args) -> str:
+    """Stable hash of the chart model, the renderer arguments and the data contents
+    (pandas DataFrame, pyarrow.Table or Polars frame)"""
+    digest = hashlib.sha256()
+    digest.update(model_to_json(chart_model).encode("utf-8"))
+    digest.update(json.dumps(render_args, sort_keys=True, default=str).encode("utf-8"))
+    if is_native_frame(data):
+        native_fingerprint(digest, data)
+        return digest.hexdigest()
+    digest.update(json.dumps([str(column) for column in data.columns]).encode("utf-8"))
+    digest.update(json.dumps([str(dtype) for dtype in data.dtypes]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """LRU cache of render outputs bounded by the total size of the cached values"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Union[str, bytes]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Union[str, bytes]):
+        size = len(value)
+        if size > self.max_bytes:
+            # Would evict everything and still not fit
+            return
+        with self._lock:
+            old_value = self._entries.pop(key, None)
+            if old_value is not None:
+                self.current_bytes -= len(old_value)
+            self._entries[key] = value
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_default_cache: Optional[RenderCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """Return the process-wide render cache, creating it on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = RenderCache()
+        return _default_cache
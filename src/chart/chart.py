@@ -1,13 +1,22 @@
 # src/chart/chart.py
 # This file defines a Chart class that extends the BaseChart class.
 
-from typing import List
+import base64
+import os
+from typing import List, Optional, Tuple
 import pandas as pd
+from pyecharts.charts import Page
 from chart.base import BaseChart
-from chart.models.chart_model import ChartModel
+from chart.cache import RenderCache, render_fingerprint
+from chart.models.chart_model import ChartModel, copy_model
 from chart.components.line_chart import LineChart
 from chart.components.pie_chart import PieChart
 from chart.components.bar_chart import BarChart
+from chart.executor import run_in_prep_executor
+from chart.instrument import Instrumentation, traced
+from chart.snapshot import snapshot_html
+from chart.sql import SqlSource
+from chart.stream import ChunkedData
 
 
 class Chart(BaseChart):
@@ -16,65 +25,113 @@ class Chart(BaseChart):
                  colors: List[str]=  ["#009953", "#00F284", "#F2B950", "#F28444", "#F2D8CE"],
                  show_label: bool = False,
                  donut_pie: bool = True,
+                 cache: Optional[RenderCache] = None,
+                 instrumentation: Optional[Instrumentation] = None,
                  ):
         super().__init__(chart_model, data, colors)
+        # Spans of this chart's renders (default: the process-wide chart.instrument sink)
+        self.instrumentation = instrumentation
         self.show_label = show_label
         self.donut_pie = donut_pie
+        # Opt-in: pass a RenderCache (e.g. chart.cache.get_render_cache()) to reuse outputs
+        self.cache = cache
 
+    @traced("render_html")
     def render_html(self):
         '''Render the chart to HTML'''
         try:
-            html = ''
+            cache_key = self._cache_key("html")
+            html = self._cache_get(cache_key)
+            if html is not None:
+                return html
+
             if self.chart_model.type == "line":
-                chart = LineChart(self.chart_model, self.data)
+                chart = self._component(LineChart)
                 html = chart.render(horizontal=False,)
             elif self.chart_model.type == "bar":
-                chart = BarChart(self.chart_model, self.data)
+                chart = self._component(BarChart)
                 html = chart.render(horizontal=False, show_label=self.show_label)
             elif self.chart_model.type == "pie":
-                chart = PieChart(self.chart_model, self.data)
+                chart = self._component(PieChart)
                 html = chart.render(donut=self.donut_pie, show_label=self.show_label)
             else:
                 raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
             
             self.cleanup(chart)
+            self._cache_put(cache_key, html)
             return html
         except Exception as e:
             raise RuntimeError(f"Chart render to HTML failed.\nError: {str(e)}")
 
-    def render_base64(self):
+    @traced("render_base64")
+    def render_base64(self, backend: str = "browser"):
         '''Render the chart to base64'''
         try:
-            base64 = ''
+            cache_key = self._cache_key("base64", backend=backend)
+            base64 = self._cache_get(cache_key)
+            if base64 is not None:
+                return base64
+
             if self.chart_model.type == "line":
-                chart = LineChart(self.chart_model, self.data)
-                base64 = chart.render_base64(horizontal=False,)
+                chart = self._component(LineChart)
+                base64 = chart.render_base64(horizontal=False, backend=backend)
             elif self.chart_model.type == "bar":
-                chart = BarChart(self.chart_model, self.data)
-                base64 = chart.render_base64(horizontal=False, show_label=self.show_label)
+                chart = self._component(BarChart)
+                base64 = chart.render_base64(horizontal=False, show_label=self.show_label, backend=backend)
             elif self.chart_model.type == "pie":
-                chart = PieChart(self.chart_model, self.data)
-                base64 = chart.render_base64(donut=self.donut_pie, show_label=self.show_label)
+                chart = self._component(PieChart)
+                base64 = chart.render_base64(donut=self.donut_pie, show_label=self.show_label, backend=backend)
             else:
                 raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
             self.cleanup(chart)
+            self._cache_put(cache_key, base64)
             return base64
         except Exception as e:
             raise RuntimeError(f"Chart render to base64 failed.\nError: {str(e)}")
 
-    def render_png(self, output_path: str = None, image_name: str = "chart.png"):
+    @traced("render_bytes")
+    def render_bytes(self, backend: str = "browser"):
+        '''Render the chart to PNG bytes in memory'''
+        try:
+            cache_key = self._cache_key("bytes", backend=backend)
+            image = self._cache_get(cache_key)
+            if image is not None:
+                return image
+
+            if self.chart_model.type == "line":
+                chart = self._component(LineChart)
+                image = chart.render_bytes(horizontal=False, backend=backend)
+            elif self.chart_model.type == "bar":
+                chart = self._component(BarChart)
+                image = chart.render_bytes(horizontal=False, show_label=self.show_label, backend=backend)
+            elif self.chart_model.type == "pie":
+                chart = self._component(PieChart)
+                image = chart.render_bytes(donut=self.donut_pie, show_label=self.show_label, backend=backend)
+            else:
+                raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
+            self.cleanup(chart)
+            self._cache_put(cache_key, image)
+            return image
+        except Exception as e:
+            raise RuntimeError(f"Chart render to bytes failed.\nError: {str(e)}")
+
+    @traced("render_png")
+    def render_png(self, output_path: str = None, image_name: str = "chart.png", backend: str = "browser"):
         '''Render the chart to PNG'''
         try:
-            png = ''
+            if self.cache is not None:
+                # The cached PNG bytes only need to be written to the requested path
+                return self.write_png(self.render_bytes(backend=backend), output_path, image_name)
+
             if self.chart_model.type == "line":
-                chart = LineChart(self.chart_model, self.data)
-                png = chart.render_png(output_path=output_path, image_name=image_name, horizontal=False)
+                chart = self._component(LineChart)
+                png = chart.render_png(output_path=output_path, image_name=image_name, horizontal=False, backend=backend)
             elif self.chart_model.type == "bar":
-                chart = BarChart(self.chart_model, self.data)
-                png = chart.render_png(output_path=output_path, image_name=image_name, horizontal=False, show_label=self.show_label)
+                chart = self._component(BarChart)
+                png = chart.render_png(output_path=output_path, image_name=image_name, horizontal=False, show_label=self.show_label, backend=backend)
             elif self.chart_model.type == "pie":
-                chart = PieChart(self.chart_model, self.data)
-                png = chart.render_png(output_path=output_path, image_name=image_name, donut=self.donut_pie, show_label=self.show_label)
+                chart = self._component(PieChart)
+                png = chart.render_png(output_path=output_path, image_name=image_name, donut=self.donut_pie, show_label=self.show_label, backend=backend)
             else:
                 raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
             
@@ -82,5 +139,170 @@ class Chart(BaseChart):
             return png
         except Exception as e:
             raise RuntimeError(f"Chart render to PNG failed.\nError: {str(e)}")
-        
-    
\ No newline at end of file
+
+    @traced("render_svg")
+    def render_svg(self):
+        '''Render the chart to SVG in pure Python (no browser)'''
+        try:
+            cache_key = self._cache_key("svg")
+            svg = self._cache_get(cache_key)
+            if svg is not None:
+                return svg
+
+            if self.chart_model.type == "line":
+                chart = self._component(LineChart)
+                svg = chart.render_svg(horizontal=False)
+            elif self.chart_model.type == "bar":
+                chart = self._component(BarChart)
+                svg = chart.render_svg(horizontal=False, show_label=self.show_label)
+            elif self.chart_model.type == "pie":
+                chart = self._component(PieChart)
+                svg = chart.render_svg(donut=self.donut_pie, show_label=self.show_label)
+            else:
+                raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
+            self.cleanup(chart)
+            self._cache_put(cache_key, svg)
+            return svg
+        except Exception as e:
+            raise RuntimeError(f"Chart render to SVG failed.\nError: {str(e)}")
+
+    def payload_sizes(self) -> dict:
+        '''HTML size in bytes of the chart with the default and the compact option encoding'''
+        try:
+            sizes = {}
+            for name, compact in (("default", False), ("compact", True)):
+                chart_model = copy_model(self.chart_model, compact_output=compact)
+                chart = Chart(chart_model, self.data, self.colors, show_label=self.show_label, donut_pie=self.donut_pie)
+                sizes[name] = len(chart.render_html().encode("utf-8"))
+            sizes["saved_ratio"] = round(1 - sizes["compact"] / sizes["default"], 4) if sizes["default"] else 0.0
+            return sizes
+        except Exception as e:
+            raise RuntimeError(f"Chart payload size report failed.\nError: {str(e)}")
+
+    async def render_html_async(self):
+        '''Render the chart to HTML without blocking the event loop'''
+        return await run_in_prep_executor(self.render_html)
+
+    async def render_bytes_async(self, backend: str = "browser"):
+        '''Render the chart to PNG bytes without blocking the event loop'''
+        try:
+            cache_key = self._cache_key("bytes", backend=backend)
+            image = self._cache_get(cache_key)
+            if image is not None:
+                return image
+
+            if self.chart_model.type == "line":
+                chart = self._component(LineChart)
+                image = await chart.render_bytes_async(horizontal=False, backend=backend)
+            elif self.chart_model.type == "bar":
+                chart = self._component(BarChart)
+                image = await chart.render_bytes_async(horizontal=False, show_label=self.show_label, backend=backend)
+            elif self.chart_model.type == "pie":
+                chart = self._component(PieChart)
+                image = await chart.render_bytes_async(donut=self.donut_pie, show_label=self.show_label, backend=backend)
+            else:
+                raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
+
+            self._cache_put(cache_key, image)
+            return image
+        except Exception as e:
+            raise RuntimeError(f"Chart render to bytes failed.\nError: {str(e)}")
+
+    async def render_base64_async(self, backend: str = "browser"):
+        '''Render the chart to base64 without blocking the event loop'''
+        try:
+            return base64.b64encode(await self.render_bytes_async(backend=backend)).decode("utf-8")
+        except Exception as e:
+            raise RuntimeError(f"Chart render to base64 failed.\nError: {str(e)}")
+
+    async def render_png_async(self, output_path: str = None, image_name: str = "chart.png", backend: str = "browser"):
+        '''Render the chart to PNG without blocking the event loop'''
+        try:
+            # Await the bytes before touching the file: a failed render leaves any previous PNG in place
+            image = await self.render_bytes_async(backend=backend)
+            return self.write_png(image, output_path, image_name)
+        except Exception as e:
+            raise RuntimeError(f"Chart render to PNG failed.\nError: {str(e)}")
+
+    def set_instrumentation(self, instrumentation: Optional[Instrumentation]):
+        super().set_instrumentation(instrumentation)
+        for chart in self._components.values():
+            chart.set_instrumentation(instrumentation)
+
+    def invalidate_prepared_data(self):
+        super().invalidate_prepared_data()
+        self._components = {}
+
+    def _component(self, chart_class):
+        '''Reuse one component per chart class so its prepared data is shared across render_* calls'''
+        chart = self._components.get(chart_class)
+        if chart is None:
+            chart = chart_class(self.chart_model, self.data)
+            chart.set_instrumentation(self.instrumentation)
+            self._components[chart_class] = chart
+        return chart
+
+    def _cache_key(self, format: str, **render_args) -> Optional[str]:
+        if self.cache is None or isinstance(self.data, (ChunkedData, SqlSource)):
+            # Chunked and SQL input cannot be fingerprinted without reading it
+            return None
+        return render_fingerprint(
+            self.chart_model, self.data, format=format, show_label=self.show_label,
+            donut_pie=self.donut_pie, colors=self.colors, **render_args
+        )
+
+    def _cache_get(self, cache_key: Optional[str]):
+        if cache_key is None:
+            return None
+        return self.cache.get(cache_key)
+
+    def _cache_put(self, cache_key: Optional[str], value):
+        if cache_key is not None:
+            self.cache.put(cache_key, value)
+
+    def _build_chart(self, for_image: bool = False):
+        '''Build the pyecharts object of the chart without rendering it'''
+        if self.chart_model.type == "line":
+            return self._component(LineChart)._build_line_chart(horizontal=False, for_image=for_image)
+        elif self.chart_model.type == "bar":
+            return self._component(BarChart)._build_bar_chart(horizontal=False, show_label=self.show_label, for_image=for_image)
+        elif self.chart_model.type == "pie":
+            chart = self._component(PieChart)
+            return chart._build_pie_chart(chart.get_prepared_data(0.05, "Others"), donut=self.donut_pie, show_label=self.show_label, for_image=for_image)
+        else:
+            raise ValueError(f"Unsupported chart type: {self.chart_model.type}")
+
+
+def render_many(charts: List[Tuple[ChartModel, pd.DataFrame]], format: str = "png",
+                output_path: str = None, show_label: bool = False, donut_pie: bool = True) -> List[str]:
+    '''Render many charts in one browser page load.
+
+    Returns the PNG paths (``<chart_model.id>.png`` in ``output_path``) or the base64
+    strings, in the same order as ``charts``.'''
+    if format not in ("png", "base64"):
+        raise ValueError(f"Unsupported render format: {format}")
+
+    try:
+        page = Page()
+        chart_ids = []
+        for chart_model, data in charts:
+            pyechart = Chart(chart_model, data, show_label=show_label, donut_pie=donut_pie)._build_chart(for_image=True)
+            page.add(pyechart)
+            chart_ids.append(pyechart.chart_id)
+
+        images = snapshot_html(page.render_embed(), chart_ids)
+
+        if format == "base64":
+            return [base64.b64encode(image).decode("utf-8") for image in images]
+
+        output_dir = output_path or os.getcwd()
+        os.makedirs(output_dir, exist_ok=True)
+        image_paths = []
+        for (chart_model, _), image in zip(charts, images):
+            image_path = os.path.join(output_dir, f"{chart_model.id}.png")
+            with open(image_path, "wb") as f:
+                f.write(image)
+            image_paths.append(image_path)
+        return image_paths
+    except Exception as e:
+        raise RuntimeError(f"Chart render many failed.\nError: {str(e)}")
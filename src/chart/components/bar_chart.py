@@ -1,14 +1,13 @@
 # src/chart/components/bar_chart.py
 # This file defines a BarChart class that extends the Chart base class.
 
-import gc
-import os
 from pyecharts.charts import Bar
 from pyecharts import options as opts
 from pyecharts.commons.utils import JsCode
-from chart.base import BaseChart
-from pyecharts.render import make_snapshot
-from snapshot_selenium import snapshot
+from chart.base import BaseChart, AXIS_LABEL_FORMATTER_JS, BAR_LABEL_FORMATTER_JS
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import bar_svg, svg_to_png
 
 
 class BarChart(BaseChart):
@@ -43,47 +42,49 @@ class BarChart(BaseChart):
                 """
             )
 
-            self.html = bar.render_embed()
+            self.html = self.embed(bar)
 
             # Release memory
             del bar
-            gc.collect()
+            self.release_memory()
 
             return self.html
         except Exception as e:
             raise RuntimeError(f"BarChart renders to HTML failed.\nError: {str(e)}")
 
-    def render_base64(self, horizontal=False, show_label: bool = False):
-        import base64
-        import uuid
-
+    def render_svg(self, horizontal=False, show_label: bool = False) -> str:
         try:
+            if horizontal:
+                raise ValueError("SVG backend does not support horizontal charts.")
+            new_df, categories = self.get_prepared_data()
+            series = {column: new_df[column].to_list() for column in self.chart_model.y_axis}
+            return bar_svg(self.chart_model, categories, series, self.colors, show_label=show_label)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders SVG failed.\nError: {str(e)}")
 
-            unique_id = uuid.uuid4().hex
-            tmp_html = f"_tmp_chart_{unique_id}.html"
-            tmp_png = f"_tmp_chart_{unique_id}.png"
+    def render_bytes(self, horizontal=False, show_label: bool = False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(horizontal=horizontal, show_label=show_label))
 
-            self._build_bar_chart(
-                horizontal=horizontal,
-                show_label=show_label,
-                for_image=True,
-                render_path=tmp_html,
+            bar = self._build_bar_chart(
+                horizontal=horizontal, show_label=show_label, for_image=True
             )
-
-            make_snapshot(snapshot, tmp_html, tmp_png)
-
-            with open(tmp_png, "rb") as f:
-                img_base64 = base64.b64encode(f.read()).decode("utf-8")
-
-            os.remove(tmp_html)
-            os.remove(tmp_png)
+            image = self.snapshot(bar)
 
             # Release memory
-            del tmp_html, tmp_png
-            gc.collect()
+            del bar
+            self.release_memory()
 
-            # Return the base64 encoded image
-            return img_base64
+            return image
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders bytes failed.\nError: {str(e)}")
+
+    def render_base64(self, horizontal=False, show_label: bool = False, backend: str = "browser"):
+        try:
+            image = self.render_bytes(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
         except Exception as e:
             raise RuntimeError(f"BarChart renders base64 failed.\nError: {str(e)}")
 
@@ -93,50 +94,65 @@ class BarChart(BaseChart):
         image_name: str = "chart.png",
         horizontal=False,
         show_label: bool = False,
+        backend: str = "browser",
     ):
         try:
-            output_dir = output_path or os.getcwd()
-            os.makedirs(output_dir, exist_ok=True)
+            # Render before touching the file: a failed render leaves any previous PNG in place
+            image = self.render_bytes(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.write_png(image, output_path, image_name)
 
-            image_path = os.path.join(output_dir, image_name)
-            html_path = image_path.rsplit(".", 1)[0] + ".html"
+        except Exception as e:
+            raise RuntimeError(f"BarChart render PNG failed.\nError: {str(e)}")
+
+    async def render_async(self, horizontal=False, show_label: bool = False):
+        return await run_in_prep_executor(
+            self.render, horizontal=horizontal, show_label=show_label
+        )
 
-            self._build_bar_chart(
+    async def render_bytes_async(self, horizontal=False, show_label: bool = False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(
+                    self.render_bytes, horizontal=horizontal, show_label=show_label, backend=backend
+                )
+
+            bar = await run_in_prep_executor(
+                self._build_bar_chart,
                 horizontal=horizontal,
                 show_label=show_label,
                 for_image=True,
-                render_path=html_path,
             )
+            return await self.snapshot_async(bar)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders bytes failed.\nError: {str(e)}")
 
-            make_snapshot(snapshot, html_path, image_path)
-            # Don't delete HTML file for testing
-            # os.remove(html_path)
-
-            # Release memory
-            # del html_path
-            # gc.collect()
+    async def render_base64_async(self, horizontal=False, show_label: bool = False, backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"BarChart renders base64 failed.\nError: {str(e)}")
 
-            return image_path
+    async def render_png_async(
+        self,
+        output_path: str = None,
+        image_name: str = "chart.png",
+        horizontal=False,
+        show_label: bool = False,
+        backend: str = "browser",
+    ):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, show_label=show_label, backend=backend)
+            return self.write_png(image, output_path, image_name)
 
         except Exception as e:
             raise RuntimeError(f"BarChart render PNG failed.\nError: {str(e)}")
 
     def _prepare_chart_data(self):
-        new_df = (
-            self.data.groupby(self.chart_model.x_axis)[self.chart_model.y_axis]
-            .sum()
-            .reset_index()
-        )
+        new_df = self.aggregate_data()
 
-        if len(self.chart_model.x_axis) == 1:
-            categories = new_df[self.chart_model.x_axis[0]].astype(str).to_list()
-        else:
-            categories = (
-                new_df[self.chart_model.x_axis]
-                .astype(str)
-                .agg(" - ".join, axis=1)
-                .to_list()
-            )
+        categories = self.category_labels(new_df, self.chart_model.x_axis)
 
         return new_df, categories
 
@@ -166,36 +182,43 @@ class BarChart(BaseChart):
             return formatted_df
         return df
 
+    @traced("build_options")
     def _build_bar_chart(self, horizontal=False, show_label=False, for_image=False, render_path: str = None) -> Bar:
         # Calculate width to accommodate large numbers
         chart_width = "1200px" if for_image else "100%"
         chart_height = f"{self.chart_model.size.height}px"
         
+        new_df, categories = self.get_prepared_data()
+        points = len(categories)
+
         bar = Bar(
             init_opts=opts.InitOpts(
                 width=chart_width,
                 height=chart_height,
+                renderer=self.init_renderer(points * len(self.chart_model.y_axis), for_image=for_image),
+                animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
             )
         )
 
-        new_df, categories = self._prepare_chart_data()
-
-        bar.add_xaxis(categories)
+        series_data = self.add_series_data(bar, new_df, categories, horizontal=horizontal)
+        large_opts = self.large_series_opts(points, "bar")
 
         for column in self.chart_model.y_axis:
             # Add formatter for bar labels if K/M/B formatting is enabled
             label_formatter = None
             if show_label and getattr(self.chart_model, "y_axis_format_large_numbers", True):
-                label_formatter = JsCode("function(params) { var value = params.value; if (value >= 1000000000) { return (value / 1000000000).toFixed(1) + 'B'; } else if (value >= 1000000) { return (value / 1000000).toFixed(1) + 'M'; } else if (value >= 1000) { return (value / 1000).toFixed(1) + 'K'; } else { return value.toString(); } }")
+                label_formatter = JsCode(BAR_LABEL_FORMATTER_JS)
             
             bar.add_yaxis(
                 column,
-                new_df[column].to_list(),
+                **series_data[column],
                 label_opts=opts.LabelOpts(
                     is_show=show_label,
                     formatter=label_formatter
                 ),
             )
+            if large_opts:
+                bar.options["series"][-1].update(large_opts)
 
         if horizontal:
             bar.reversal_axis()
@@ -224,7 +247,7 @@ class BarChart(BaseChart):
                 is_show=getattr(self.chart_model, "show_y_label", True),
                 font_size=getattr(self.chart_model, "y_axis_font_size", 14),
                 margin=getattr(self.chart_model, "y_axis_margin", 8),
-                formatter=JsCode("function(value){return value>=1000000000?(value/1000000000).toFixed(1)+'B':value>=1000000?(value/1000000).toFixed(1)+'M':value>=1000?(value/1000).toFixed(1)+'K':value}") if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
             ),
             splitline_opts=opts.SplitLineOpts(
                 is_show=getattr(self.chart_model, "show_grid", False)
@@ -249,7 +272,7 @@ class BarChart(BaseChart):
                     font_size=max(getattr(self.chart_model, "y_axis_font_size", 14), 14),  # Ensure minimum 14 for PNG
                     margin=max(getattr(self.chart_model, "y_axis_margin", 8), 25),  # Ensure minimum 25 for PNG
                     rotate=0,  # No rotation to prevent truncation
-                    formatter=JsCode("function(value){return value>=1000000000?(value/1000000000).toFixed(1)+'B':value>=1000000?(value/1000000).toFixed(1)+'M':value>=1000?(value/1000).toFixed(1)+'K':value}") if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                    formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
                 ),
                 splitline_opts=opts.SplitLineOpts(
                     is_show=getattr(self.chart_model, "show_grid", False)
@@ -271,8 +294,11 @@ class BarChart(BaseChart):
         bar.set_global_opts(**opts_dict)
         bar.set_colors(self.colors)
 
+        if self.use_compact_output():
+            self.minify_options(bar)
+
         if for_image and render_path:
             bar.render(render_path)
 
-        self.cleanup(new_df, categories, opts_dict)
+        self.cleanup(new_df, categories, series_data, opts_dict)
         return bar
@@ -1,105 +1,122 @@
 # src/chart/components/line_chart.py
 # This file defines a LineChart class that extends the Chart base class.
 
-import os
-import gc
 from pyecharts.charts import Line
 from pyecharts import options as opts
 from pyecharts.commons.utils import JsCode
-from chart.base import BaseChart
-from pyecharts.render import make_snapshot
-from snapshot_selenium import snapshot
-import pandas as pd
+from chart.base import BaseChart, AXIS_LABEL_FORMATTER_JS
+from chart.downsample import downsample_frame
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import line_svg, svg_to_png
 
 class LineChart(BaseChart):
 
     def render(self, horizontal=False):
         try:
             line = self._build_line_chart(horizontal=horizontal, for_image=False)
-            self.html = line.render_embed()
+            self.html = self.embed(line)
 
             del line
-            gc.collect()
+            self.release_memory()
 
             return self.html
 
         except Exception as e:
             raise RuntimeError(f"LineChart renders to HTML failed.\nError: {str(e)}")
 
-    def render_base64(self, horizontal=False):
+    def render_svg(self, horizontal=False) -> str:
         try:
-            import uuid
-            import base64
+            if horizontal:
+                raise ValueError("SVG backend does not support horizontal charts.")
+            new_df, categories = self.get_prepared_data()
+            series = {column: new_df[column].to_list() for column in self.chart_model.y_axis}
+            return line_svg(self.chart_model, categories, series, self.colors)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders SVG failed.\nError: {str(e)}")
 
-            unique_id = uuid.uuid4().hex
-            tmp_html = f"_tmp_chart_{unique_id}.html"
-            tmp_png = f"_tmp_chart_{unique_id}.png"
+    def render_bytes(self, horizontal=False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(horizontal=horizontal))
 
-            # Gọi _build_line_chart có render ra HTML nếu cần
-            self._build_line_chart(
-                horizontal=horizontal, for_image=True, render_path=tmp_html
-            )
-            make_snapshot(snapshot, tmp_html, tmp_png)
-            with open(tmp_png, "rb") as f:
-                img_base64 = base64.b64encode(f.read()).decode("utf-8")
+            line = self._build_line_chart(horizontal=horizontal, for_image=True)
+            image = self.snapshot(line)
 
-            # Xóa file tạm (chỉ khi không lỗi)
-            os.remove(tmp_html)
-            os.remove(tmp_png)
+            del line
+            self.release_memory()
 
-            del tmp_html, tmp_png
-            gc.collect()
+            return image
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders bytes failed.\nError: {str(e)}")
 
-            return img_base64
+    def render_base64(self, horizontal=False, backend: str = "browser"):
+        try:
+            return self.encode_base64(self.render_bytes(horizontal=horizontal, backend=backend))
         except Exception as e:
             raise RuntimeError(f"LineChart renders base64 failed.\nErorr: {str(e)}")
 
     def render_png(
-        self, output_path: str = None, image_name: str = "chart.png", horizontal=False
+        self, output_path: str = None, image_name: str = "chart.png", horizontal=False,
+        backend: str = "browser",
     ):
         try:
-            output_dir = output_path or os.getcwd()
-            os.makedirs(output_dir, exist_ok=True)
-            image_path = os.path.join(output_dir, image_name)
-            html_path = image_path.rsplit(".", 1)[0] + ".html"
-            self._build_line_chart(
-                horizontal=horizontal, for_image=True, render_path=html_path
+            # Render before touching the file: a failed render leaves any previous PNG in place
+            image = self.render_bytes(horizontal=horizontal, backend=backend)
+            return self.write_png(image, output_path, image_name)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders PNG failed.\nError: {str(e)}")
+
+    async def render_async(self, horizontal=False):
+        return await run_in_prep_executor(self.render, horizontal=horizontal)
+
+    async def render_bytes_async(self, horizontal=False, backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(self.render_bytes, horizontal=horizontal, backend=backend)
+
+            line = await run_in_prep_executor(
+                self._build_line_chart, horizontal=horizontal, for_image=True
             )
-            make_snapshot(snapshot, html_path, image_path)
+            return await self.snapshot_async(line)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders bytes failed.\nError: {str(e)}")
 
-            os.remove(html_path)
-            del html_path
-            gc.collect()
+    async def render_base64_async(self, horizontal=False, backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"LineChart renders base64 failed.\nError: {str(e)}")
 
-            return image_path
+    async def render_png_async(
+        self, output_path: str = None, image_name: str = "chart.png", horizontal=False,
+        backend: str = "browser",
+    ):
+        try:
+            image = await self.render_bytes_async(horizontal=horizontal, backend=backend)
+            return self.write_png(image, output_path, image_name)
         except Exception as e:
             raise RuntimeError(f"LineChart renders PNG failed.\nError: {str(e)}")
 
     def _prepare_chart_data(self):
-        try:
-            self.set_default_axis()
-            new_df = (
-                self.data.groupby(self.chart_model.x_axis)[self.chart_model.y_axis]
-                .sum()
-                .reset_index()
+        # Errors (a failing SQL source, a bad column) propagate to the render_* caller
+        self.set_default_axis()
+        new_df = self.aggregate_data()
+
+        max_points = getattr(self.chart_model, "max_points", None)
+        if max_points:
+            new_df = downsample_frame(
+                new_df, self.chart_model.y_axis, max_points,
+                method=getattr(self.chart_model, "downsample_method", None) or "lttb",
             )
 
-            if (isinstance(self.chart_model.x_axis, str) or len(self.chart_model.x_axis) == 1 ):
-                x_key = (self.chart_model.x_axis[0] if isinstance(self.chart_model.x_axis, list) else self.chart_model.x_axis )
-                categories = new_df[x_key].astype(str).to_list()
-            else:
-                categories = (
-                    new_df[self.chart_model.x_axis]
-                    .astype(str)
-                    .agg(" - ".join, axis=1)
-                    .to_list()
-                )
-            
+        x_axis = [self.chart_model.x_axis] if isinstance(self.chart_model.x_axis, str) else self.chart_model.x_axis
+        categories = self.category_labels(new_df, x_axis)
 
-            
-            return new_df, categories
-        except Exception as e:
-            return pd.DataFrame(), []
+        return new_df, categories
     
 
 
@@ -128,25 +145,30 @@ class LineChart(BaseChart):
             return formatted_df
         return df
 
+    @traced("build_options")
     def _build_line_chart(self, horizontal=False, for_image=False, render_path: str = None) -> Line:
         # Calculate width to accommodate large numbers
         chart_width = "1200px" if for_image else "100%"
         chart_height = f"{self.chart_model.size.height}px"
         
+        new_df, categories = self.get_prepared_data()
+        points = len(categories)
+
         line = Line(
             init_opts=opts.InitOpts(
                 width=chart_width,
                 height=chart_height,
+                renderer=self.init_renderer(points * len(self.chart_model.y_axis), for_image=for_image),
                 animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
             )
         )
-        new_df, categories = self._prepare_chart_data()
-        
-        line.add_xaxis(categories)
+
+        series_data = self.add_series_data(line, new_df, categories, horizontal=horizontal)
+        large_opts = self.large_series_opts(points, "line")
         for column in self.chart_model.y_axis:
                 line.add_yaxis(
                     column,
-                    new_df[column].to_list(),
+                    **series_data[column],
                     is_symbol_show=False,
                     symbol_size=8,
                     is_hover_animation=True,
@@ -157,6 +179,8 @@ class LineChart(BaseChart):
                         linestyle_opts=opts.LineStyleOpts(width=3, opacity=1),
                     ),
                 )
+                if large_opts:
+                    line.options["series"][-1].update(large_opts)
 
         if horizontal:
             line.reversal_axis()
@@ -186,7 +210,7 @@ class LineChart(BaseChart):
                 is_show=getattr(self.chart_model, "show_y_label", True),
                 font_size=getattr(self.chart_model, "y_axis_font_size", 10),
                 margin=getattr(self.chart_model, "y_axis_margin", 8),
-                formatter=JsCode("function(value){return value>=1000000000?(value/1000000000).toFixed(1)+'B':value>=1000000?(value/1000000).toFixed(1)+'M':value>=1000?(value/1000).toFixed(1)+'K':value}") if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
             ),
             splitline_opts=opts.SplitLineOpts(
                 is_show=getattr(self.chart_model, "show_grid", False)
@@ -213,7 +237,7 @@ class LineChart(BaseChart):
                     font_size=max(getattr(self.chart_model, "y_axis_font_size", 10), 14),  # Ensure minimum 14 for PNG
                     margin=max(getattr(self.chart_model, "y_axis_margin", 8), 25),  # Ensure minimum 25 for PNG
                     rotate=0,  # No rotation to prevent truncation
-                    formatter=JsCode("function(value){return value>=1000000000?(value/1000000000).toFixed(1)+'B':value>=1000000?(value/1000000).toFixed(1)+'M':value>=1000?(value/1000).toFixed(1)+'K':value}") if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
+                    formatter=JsCode(AXIS_LABEL_FORMATTER_JS) if getattr(self.chart_model, "y_axis_format_large_numbers", True) else None,
                 ),
                 splitline_opts=opts.SplitLineOpts(
                     is_show=getattr(self.chart_model, "show_grid", False)
@@ -235,8 +259,11 @@ class LineChart(BaseChart):
         line.set_global_opts(**opts_dict)
         line.set_colors(self.colors)
 
+        if self.use_compact_output():
+            self.minify_options(line)
+
         if for_image and render_path:
             line.render(render_path)
 
-        self.cleanup(new_df, categories, opts_dict)
+        self.cleanup(new_df, categories, series_data, opts_dict)
         return line
\ No newline at end of file
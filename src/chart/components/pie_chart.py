@@ -1,12 +1,12 @@
-import gc
-import os
 from typing import List
+import numpy as np
 import pandas as pd
 from pyecharts.charts import Pie
 from pyecharts import options as opts
 from chart.base import BaseChart
-from pyecharts.render import make_snapshot
-from snapshot_selenium import snapshot
+from chart.executor import run_in_prep_executor
+from chart.instrument import traced
+from chart.svg import pie_svg, svg_to_png
 
 from chart.models.chart_model import ChartModel
 
@@ -21,13 +21,13 @@ class PieChart(BaseChart):
     def render(self, threshold: float = 0.05, donut: bool = False,
                 group_other_name: str = "Others", show_label: bool = False):
         try:
-            data_present = self._prepare_chart_data(threshold, group_other_name)
+            data_present = self.get_prepared_data(threshold, group_other_name)
             pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=False)
 
-            self.html = pie.render_embed()
+            self.html = self.embed(pie)
             
             del data_present, pie  
-            gc.collect()
+            self.release_memory()
 
             return self.html
 
@@ -37,103 +37,154 @@ class PieChart(BaseChart):
         finally:
             return self.html
 
-    def render_base64(self, threshold: float = 0.05, donut: bool = False,
-                    group_other_name: str = "Others", show_label: bool = False):
-        import base64
-        import uuid
+    def render_svg(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False) -> str:
         try:
-            data_present = self._prepare_chart_data(threshold, group_other_name)
+            data_present = self.get_prepared_data(threshold, group_other_name)
+            return pie_svg(self.chart_model, data_present, self.colors, donut=donut, show_label=show_label)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders SVG failed.\nError: {str(e)}")
 
-            unique_id = uuid.uuid4().hex
-            tmp_html = f"_tmp_chart_{unique_id}.html"
-            tmp_png = f"_tmp_chart_{unique_id}.png"
+    def render_bytes(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return svg_to_png(self.render_svg(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label))
 
-            self._build_pie_chart(data_present, donut=donut, show_label=show_label,
-                                for_image=True, render_path=tmp_html)
+            data_present = self.get_prepared_data(threshold, group_other_name)
+            pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=True)
+            image = self.snapshot(pie)
 
-            make_snapshot(snapshot, tmp_html, tmp_png)
+            del data_present, pie
+            self.release_memory()
 
-            with open(tmp_png, "rb") as f:
-                img_base64 = base64.b64encode(f.read()).decode("utf-8")
+            return image
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders bytes failed.\nError: {str(e)}")
 
-            os.remove(tmp_html)
-            os.remove(tmp_png)
-            
-            del data_present, tmp_html, tmp_png 
-            gc.collect() 
-            
-            return img_base64
+    def render_base64(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser"):
+        try:
+            image = self.render_bytes(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
         except Exception as e:
             raise RuntimeError(f"PieChart renders base64 failed.\nError: {str(e)}")
 
     def render_png(self, output_path: str = None, image_name: str = 'chart.png',
                 threshold: float = 0.05, donut: bool = False,
-                group_other_name: str = "Others", show_label: bool = False):
+                group_other_name: str = "Others", show_label: bool = False,
+                backend: str = "browser"):
         try:
-            data_present = self._prepare_chart_data(threshold, group_other_name)
+            # Render before touching the file: a failed render leaves any previous PNG in place
+            image = self.render_bytes(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.write_png(image, output_path, image_name)
+        
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders PNG failed.\nError: {str(e)}")
+        
+    
+
+    async def render_async(self, threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False):
+        return await run_in_prep_executor(
+            self.render, threshold, donut=donut, group_other_name=group_other_name, show_label=show_label
+        )
 
-            output_dir = output_path or os.getcwd()
-            os.makedirs(output_dir, exist_ok=True)
+    async def render_bytes_async(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser") -> bytes:
+        try:
+            self.check_backend(backend)
+            if backend == "svg":
+                return await run_in_prep_executor(
+                    self.render_bytes, threshold, donut=donut, group_other_name=group_other_name,
+                    show_label=show_label, backend=backend
+                )
+
+            data_present = await run_in_prep_executor(self.get_prepared_data, threshold, group_other_name)
+            pie = self._build_pie_chart(data_present, donut=donut, show_label=show_label, for_image=True)
+            return await self.snapshot_async(pie)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders bytes failed.\nError: {str(e)}")
 
-            image_path = os.path.join(output_dir, image_name)
-            html_path = image_path.rsplit('.', 1)[0] + '.html'
+    async def render_base64_async(self, threshold: float = 0.05, donut: bool = False,
+                    group_other_name: str = "Others", show_label: bool = False,
+                    backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.encode_base64(image)
+        except Exception as e:
+            raise RuntimeError(f"PieChart renders base64 failed.\nError: {str(e)}")
 
-            self._build_pie_chart(data_present, donut=donut, show_label=show_label,
-                                for_image=True, render_path=html_path)
+    async def render_png_async(self, output_path: str = None, image_name: str = 'chart.png',
+                threshold: float = 0.05, donut: bool = False,
+                group_other_name: str = "Others", show_label: bool = False,
+                backend: str = "browser"):
+        try:
+            image = await self.render_bytes_async(threshold, donut=donut, group_other_name=group_other_name, show_label=show_label, backend=backend)
+            return self.write_png(image, output_path, image_name)
 
-            make_snapshot(snapshot, html_path, image_path)
-        
-            os.remove(html_path)
-            del data_present, html_path
-            gc.collect()
-        
-            return image_path
-        
         except Exception as e:
             raise RuntimeError(f"PieChart renders PNG failed.\nError: {str(e)}")
-        
-    
 
     def _prepare_chart_data(self, threshold: float = 0.05, group_other_name: str = "Others"):
         if len(self.chart_model.y_axis) != 1:
             raise ValueError("Pie chart requires exactly one y_axis (value).")
 
         value_col = self.chart_model.y_axis[0]
-        working_df = self.data.copy()
 
+        # Aggregate the source frame as is (no copy), then work on the per-slice arrays only
+        max_slices = getattr(self.chart_model, "max_slices", None)
+        grouped_df = self.aggregate_data(keys=self.chart_model.x_axis, y_columns=[value_col], top_n=max_slices)
         if len(self.chart_model.x_axis) == 1:
-            category_col = self.chart_model.x_axis[0]
-            grouped_df = working_df.groupby(category_col)[value_col].sum().reset_index()
+            labels = grouped_df[self.chart_model.x_axis[0]].to_numpy(dtype=object)
         else:
-            category_col = "_combined_key"
-            working_df[category_col] = working_df[self.chart_model.x_axis].astype(str).agg(" - ".join, axis=1)
-            grouped_df = working_df.groupby(category_col)[value_col].sum().reset_index()
-
-        total = grouped_df[value_col].sum()
-        grouped_df["_percentage"] = grouped_df[value_col] / total
+            labels = np.asarray(self.category_labels(grouped_df, self.chart_model.x_axis), dtype=object)
+        values = grouped_df[value_col].to_numpy()
+
+        # A source that returned only the top groups reports the total of all of them
+        truncated = "total" in grouped_df.attrs
+        total = grouped_df.attrs["total"] if truncated else values.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keep = ~(values / total < threshold)
+
+        limited = False
+        others_value = (total - values[keep].sum()) if truncated else values[~keep].sum()
+        if max_slices and (keep.sum() > max_slices or (keep.sum() == max_slices and others_value > 0)):
+            # Top max_slices - 1 slices by value (partial sort), one more slice for Others
+            candidates = np.flatnonzero(keep)
+            top = max_slices - 1
+            keep = np.zeros(len(values), dtype=bool)
+            if top > 0:
+                keep[candidates[np.argpartition(values[candidates], -top)[-top:]]] = True
+            limited = True
+            others_value = (total - values[keep].sum()) if truncated else values[~keep].sum()
 
-        mask = grouped_df["_percentage"] < threshold
-        others_value = grouped_df.loc[mask, value_col].sum()
         if others_value > 0:
-            grouped_df = grouped_df.loc[~mask]
-            others_df = pd.DataFrame({
-                category_col: [group_other_name],
-                value_col: [others_value]
-            })
-            grouped_df = pd.concat([grouped_df, others_df], ignore_index=True)
-
-        data_present = grouped_df[[category_col, value_col]].values.tolist()
-        
-        # Release memory
-        del working_df, grouped_df, total, mask, others_value, others_df
-        gc.collect()
+            data_present = [[label, value] for label, value in zip(labels[keep].tolist(), values[keep].tolist())]
+            data_present.append([group_other_name, others_value.item()])
+        elif limited:
+            data_present = [[label, value] for label, value in zip(labels[keep].tolist(), values[keep].tolist())]
+        else:
+            data_present = [[label, value] for label, value in zip(labels.tolist(), values.tolist())]
 
+        del grouped_df, labels, values, keep
         return data_present
 
+    @traced("build_options")
     def _build_pie_chart(self, data_present, donut=False, show_label=False, for_image=False, render_path: str = None) -> Pie:
+        precision = getattr(self.chart_model, "y_precision", None)
+        if precision is not None:
+            data_present = [[name, round(value, precision)] for name, value in data_present]
+
         pie = Pie(init_opts=opts.InitOpts(
             width="80%" if for_image else "100%",
-            height=f"{self.chart_model.size.height}px"
+            height=f"{self.chart_model.size.height}px",
+            renderer=self.init_renderer(len(data_present), for_image=for_image),
+            animation_opts=opts.AnimationOpts(animation=False) if for_image else opts.AnimationOpts(),
         ))
 
         pie.add(
@@ -163,6 +214,9 @@ class PieChart(BaseChart):
 
         pie.set_global_opts(**opts_dict)
 
+        if self.use_compact_output():
+            self.minify_options(pie)
+
         if for_image and render_path:
             pie.render(render_path)
 
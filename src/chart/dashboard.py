@@ -0,0 +1,158 @@
+# src/chart/dashboard.py
+# This file renders many charts into one dashboard page that shares the ECharts runtime,
+# the K/M/B formatter functions and the toolbox config, and initializes charts lazily.
+
+import html
+import os
+from typing import List, Optional, Tuple, Union
+import pandas as pd
+import simplejson
+from pyecharts.charts.base import default
+from pyecharts.commons.utils import replace_placeholder
+from pyecharts.globals import CurrentConfig
+from chart.base import AXIS_LABEL_FORMATTER_JS, BAR_LABEL_FORMATTER_JS, TOOLTIP_FORMATTER_JS
+from chart.chart import Chart
+from chart.models.chart_model import ChartModel
+
+# Bundled runtime (Apache-2.0, the npm echarts@6.0.0 dist/echarts.min.js, the major version pyecharts
+# targets), shipped as package data and inlined so that dashboards work offline
+ECHARTS_VERSION = "6.0.0"
+DEFAULT_ECHARTS_PATH = os.path.join(os.path.dirname(__file__), "assets", "echarts.min.js")
+
+# Pass as echarts_url to load the runtime from the pyecharts host (the page then needs network access)
+ONLINE_ECHARTS_URL = f"{CurrentConfig.ONLINE_HOST}echarts.min.js"
+
+# Formatter bodies emitted once per page, referenced as orapyShared.<name> by every chart
+SHARED_FORMATTERS = {
+    AXIS_LABEL_FORMATTER_JS: "axisLabel",
+    TOOLTIP_FORMATTER_JS: "tooltip",
+    BAR_LABEL_FORMATTER_JS: "barLabel",
+}
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    {echarts_script}
+    <style>.orapy-chart {{ margin: 0 auto 16px auto; }}</style>
+</head>
+<body>
+{containers}
+<script type="text/javascript">
+var orapyShared = {shared};
+var orapyCharts = [{specs}];
+(function () {{
+    var instances = [];
+    var specsById = {{}};
+    orapyCharts.forEach(function (spec) {{ specsById[spec.id] = spec; }});
+
+    function initChart(spec) {{
+        var chartInstance = echarts.init(document.getElementById(spec.id), spec.theme, {{renderer: spec.renderer}});
+        if (spec.sharedToolbox) {{ spec.option.toolbox = orapyShared.toolbox; }}
+        chartInstance.setOption(spec.option);
+        instances.push(chartInstance);
+    }}
+
+    if ('IntersectionObserver' in window) {{
+        // Only charts close to the viewport are drawn
+        var observer = new IntersectionObserver(function (entries) {{
+            entries.forEach(function (entry) {{
+                if (entry.isIntersecting) {{
+                    observer.unobserve(entry.target);
+                    initChart(specsById[entry.target.id]);
+                }}
+            }});
+        }}, {{rootMargin: '200px'}});
+        orapyCharts.forEach(function (spec) {{ observer.observe(document.getElementById(spec.id)); }});
+    }} else {{
+        orapyCharts.forEach(initChart);
+    }}
+
+    window.addEventListener('resize', function () {{
+        instances.forEach(function (chartInstance) {{ chartInstance.resize(); }});
+    }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def _to_js(value) -> str:
+    js = replace_placeholder(simplejson.dumps(value, default=default, ignore_nan=True, separators=(",", ":")))
+    for code, name in SHARED_FORMATTERS.items():
+        js = js.replace(code, f"orapyShared.{name}")
+    # Category names must not be able to close the inline <script>
+    return js.replace("</", "<\\/")
+
+
+def _echarts_script(echarts_path: Optional[str], echarts_url: Optional[str]) -> str:
+    if echarts_url:
+        return f'<script type="text/javascript" src="{html.escape(echarts_url)}"></script>'
+
+    path = echarts_path or DEFAULT_ECHARTS_PATH
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return f'<script type="text/javascript">{f.read()}</script>'
+
+    # Falling back to the online host would render a blank page offline: make it the caller's choice
+    raise FileNotFoundError(
+        f"ECharts runtime not found: {path}. Put echarts.min.js there, pass echarts_path=, "
+        f"or echarts_url=chart.dashboard.ONLINE_ECHARTS_URL to load it online."
+    )
+
+
+def render_dashboard(charts: List[Union[Chart, Tuple[ChartModel, pd.DataFrame]]], title: str = "Dashboard",
+                     echarts_path: str = None, echarts_url: str = None,
+                     show_label: bool = False, donut_pie: bool = True) -> str:
+    '''Render many charts into one HTML page.
+
+    The ECharts runtime is included once: inlined from ``echarts_path`` (default: the
+    bundled ``chart/assets/echarts.min.js``) or referenced from ``echarts_url``. Without
+    either a FileNotFoundError is raised rather than silently loading it online.'''
+    # Checked before building any chart
+    echarts_script = _echarts_script(echarts_path, echarts_url)
+    try:
+        containers, specs = [], []
+        shared = {}
+        for item in charts:
+            chart = item if isinstance(item, Chart) else Chart(item[0], item[1], show_label=show_label, donut_pie=donut_pie)
+            pyechart = chart._build_chart(for_image=False)
+
+            options = pyechart.get_options()
+            toolbox = options.pop("toolbox", None)
+            shared_toolbox = False
+            if toolbox is not None:
+                toolbox_js = _to_js(toolbox)
+                shared.setdefault("toolbox", toolbox_js)
+                if toolbox_js == shared["toolbox"]:
+                    shared_toolbox = True
+                else:
+                    options["toolbox"] = toolbox
+
+            containers.append(
+                f'<div id="{pyechart.chart_id}" class="orapy-chart" '
+                f'style="width:{pyechart.width}; height:{pyechart.height};"></div>'
+            )
+            specs.append(
+                "{"
+                f'id:"{pyechart.chart_id}",theme:"{pyechart.theme}",renderer:"{pyechart.renderer}",'
+                f"sharedToolbox:{'true' if shared_toolbox else 'false'},option:{_to_js(options)}"
+                "}"
+            )
+
+        shared_js = ",".join(
+            [f"{name}:{code}" for code, name in SHARED_FORMATTERS.items()]
+            + [f"{name}:{code}" for name, code in shared.items()]
+        )
+
+        return DASHBOARD_TEMPLATE.format(
+            title=html.escape(title),
+            echarts_script=echarts_script,
+            containers="\n".join(containers),
+            shared="{" + shared_js + "}",
+            specs=",\n".join(specs),
+        )
+    except Exception as e:
+        raise RuntimeError(f"Dashboard render failed.\nError: {str(e)}")
@@ -0,0 +1,220 @@
+# src/chart/live.py
+# This file defines LiveChart: a line/bar chart that keeps its aggregated state and turns
+# appended rows into small JSON deltas the page merges, instead of re-rendering the chart.
+
+import threading
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+import simplejson
+from chart.aggregate import aggregate, resolve_aggregations
+from chart.base import category_labels
+from chart.components.bar_chart import BarChart
+from chart.components.line_chart import LineChart
+from chart.models.chart_model import ChartModel, copy_model
+from chart.resample import resolve_bucket
+from chart.stream import COMBINE_STATS, PARTIAL_STATS
+
+LIVE_CHART_TYPES = {"line": LineChart, "bar": BarChart}
+
+
+def insert_script(html: str, script: str) -> str:
+    """Add ``<script>script</script>`` at the end of the page body (appended if there is no ``</body>``)"""
+    tag = f'<script type="text/javascript">{script}</script>\n'
+    position = html.rfind("</body>")
+    if position < 0:
+        return html + tag
+    return html[:position] + tag + html[position:]
+
+# Merges a delta from LiveChart.append() into a chart created from LiveChart.build_chart().
+# The page keeps the categories and series values; only the changed points cross the wire.
+APPLY_DELTA_JS = """
+function orapyApplyDelta(chartInstance, delta) {
+    var state = chartInstance.__orapyLive;
+    if (!state) {
+        var option = chartInstance.getOption();
+        state = {categories: (option.xAxis[0].data || []).slice(), series: {}, names: []};
+        option.series.forEach(function (series) {
+            state.names.push(series.name);
+            state.series[series.name] = (series.data || []).map(function (point) {
+                if (Array.isArray(point)) { return point[point.length - 1]; }
+                if (point !== null && typeof point === 'object') { return point.value; }
+                return point;
+            });
+        });
+        chartInstance.__orapyLive = state;
+    }
+    delta.inserts.index.forEach(function (position, i) {
+        state.categories.splice(position, 0, delta.inserts.categories[i]);
+        state.names.forEach(function (name) { state.series[name].splice(position, 0, delta.inserts.values[name][i]); });
+    });
+    delta.updates.index.forEach(function (position, i) {
+        state.names.forEach(function (name) { state.series[name][position] = delta.updates.values[name][i]; });
+    });
+    chartInstance.setOption({
+        xAxis: [{data: state.categories}],
+        series: state.names.map(function (name) { return {name: name, data: state.series[name]}; })
+    });
+    state.seq = delta.seq;
+}
+"""
+
+
+def dump_delta(delta: dict) -> str:
+    """Minified JSON of a LiveChart delta (NaN written as null)"""
+    return simplejson.dumps(delta, ignore_nan=True, separators=(",", ":"))
+
+
+class LiveChart:
+    """Line or bar chart fed incrementally with ``append(new_rows)``.
+
+    The per-group partial sums, counts, maxima and minima are kept, so an append only
+    aggregates the new rows and touches the buckets they fall into. With
+    ``time_bucket="auto"`` the interval is picked from the first rows and then kept."""
+
+    def __init__(self, chart_model: ChartModel, data: pd.DataFrame = None, colors: List[str] = None):
+        if chart_model.type not in LIVE_CHART_TYPES:
+            raise ValueError(f"Unsupported live chart type: {chart_model.type}")
+        if not chart_model.x_axis or not chart_model.y_axis:
+            raise ValueError("Live charts need explicit x_axis and y_axis.")
+
+        self.chart_model = chart_model
+        self.colors = colors
+        self.seq = 0
+        self._how = resolve_aggregations(chart_model.y_axis, getattr(chart_model, "aggregations", None))
+        self._stats = {f"{column}__{stat}": (column, stat) for column, func in self._how.items() for stat in PARTIAL_STATS[func]}
+        self._freqs = None
+        self._state = None
+        self._lock = threading.RLock()
+        if data is not None and len(data):
+            self._merge(data)
+
+    def append(self, new_rows: pd.DataFrame) -> dict:
+        """Aggregate ``new_rows`` into the chart and return the delta for the page:
+        ``{"seq", "inserts": {"index", "categories", "values"}, "updates": {"index", "values"}}``
+        with positions in the category list after the merge."""
+        try:
+            with self._lock:
+                inserted, updated = self._merge(new_rows) if new_rows is not None and len(new_rows) else ([], [])
+                self.seq += 1
+                positions_inserted = self._state.index.get_indexer(inserted) if len(inserted) else np.array([], dtype=np.int64)
+                positions_updated = self._state.index.get_indexer(updated) if len(updated) else np.array([], dtype=np.int64)
+                order = np.argsort(positions_inserted)
+                inserted_rows = self._state.iloc[positions_inserted[order]]
+                updated_rows = self._state.iloc[positions_updated]
+                return {
+                    "seq": self.seq,
+                    "inserts": {
+                        "index": positions_inserted[order].tolist(),
+                        "categories": category_labels(inserted_rows.reset_index(), self.chart_model.x_axis),
+                        "values": self._values(inserted_rows),
+                    },
+                    "updates": {
+                        "index": positions_updated.tolist(),
+                        "values": self._values(updated_rows),
+                    },
+                }
+        except Exception as e:
+            raise RuntimeError(f"LiveChart append failed.\nError: {str(e)}")
+
+    def frame(self) -> pd.DataFrame:
+        """Current aggregated data, one row per x key"""
+        with self._lock:
+            if self._state is None:
+                return pd.DataFrame({column: [] for column in list(self.chart_model.x_axis) + list(self._how)})
+            result = self._state.reset_index()[list(self.chart_model.x_axis)]
+            for column, values in self._values(self._state, as_list=False).items():
+                result[column] = values
+            return result
+
+    def build_chart(self, for_image: bool = False):
+        """pyecharts chart of the current state (full option, e.g. for the first page load)"""
+        # The state is already aggregated and bucketed: the component only passes it through
+        chart_model = copy_model(
+            self.chart_model, aggregations=None, time_bucket=None, max_points=None, compact_output=False,
+        )
+        chart_class = LIVE_CHART_TYPES[self.chart_model.type]
+        colors = {} if self.colors is None else {"colors": self.colors}
+        component = chart_class(chart_model, self.frame(), **colors)
+        if chart_class is LineChart:
+            return component._build_line_chart(for_image=for_image)
+        return component._build_bar_chart(for_image=for_image)
+
+    def render(self) -> str:
+        """HTML of the current chart plus the orapyApplyDelta helper"""
+        return self.render_state()[0]
+
+    def render_state(self) -> Tuple[str, str, int]:
+        """(HTML, chart id, seq) of the current chart: the page is up to date with delta ``seq``"""
+        try:
+            with self._lock:
+                chart = self.build_chart()
+                html = insert_script(chart.render_embed(), APPLY_DELTA_JS)
+                return html, chart.chart_id, self.seq
+        except Exception as e:
+            raise RuntimeError(f"LiveChart render failed.\nError: {str(e)}")
+
+    def _merge(self, rows: pd.DataFrame):
+        keys = list(self.chart_model.x_axis)
+        if self._freqs is None:
+            self._freqs = self._resolve_freqs(rows)
+
+        partial_input = pd.DataFrame({key: rows[key] for key in keys})
+        for name, (column, _) in self._stats.items():
+            partial_input[name] = rows[column]
+        partial_keys = [partial_input[key].dt.floor(self._freqs[key]) if key in self._freqs else key for key in keys]
+        partial = aggregate(partial_input, partial_keys, list(self._stats), {name: stat for name, (_, stat) in self._stats.items()})
+        partial = partial.set_index(keys)
+
+        if self._state is None:
+            self._state = partial
+            return list(partial.index), []
+
+        existing = partial.index.isin(self._state.index)
+        updated = partial[existing]
+        for name, (_, stat) in self._stats.items():
+            current = self._state.loc[updated.index, name].to_numpy()
+            incoming = updated[name].to_numpy()
+            if COMBINE_STATS[stat] == "sum":
+                merged = current + incoming
+            elif COMBINE_STATS[stat] == "max":
+                merged = np.fmax(current, incoming)
+            else:
+                merged = np.fmin(current, incoming)
+            self._state.loc[updated.index, name] = merged
+
+        inserted = partial[~existing]
+        if len(inserted):
+            at_end = inserted.index.min() > self._state.index.max()
+            self._state = pd.concat([self._state, inserted])
+            if not at_end:
+                self._state = self._state.sort_index()
+        return list(inserted.index), list(updated.index)
+
+    def _resolve_freqs(self, rows: pd.DataFrame) -> Dict[str, str]:
+        time_bucket = getattr(self.chart_model, "time_bucket", None)
+        if not time_bucket:
+            return {}
+        freqs = {}
+        for key in self.chart_model.x_axis:
+            values = rows[key]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                freq = resolve_bucket(values.min(), values.max(), time_bucket, self.chart_model.size.width)
+                if freq:
+                    freqs[key] = freq
+        return freqs
+
+    def _values(self, rows: pd.DataFrame, as_list: bool = True) -> Dict[str, list]:
+        precision = getattr(self.chart_model, "y_precision", None)
+        values = {}
+        for column, func in self._how.items():
+            if func == "mean":
+                sums = rows[f"{column}__sum"].to_numpy(dtype=np.float64)
+                counts = rows[f"{column}__count"].to_numpy(dtype=np.float64)
+                column_values = np.divide(sums, counts, out=np.full(len(sums), np.nan), where=counts > 0)
+            else:
+                column_values = rows[f"{column}__{PARTIAL_STATS[func][0]}"].to_numpy()
+            if precision is not None and column_values.dtype.kind == "f":
+                column_values = column_values.round(precision)
+            values[column] = column_values.tolist() if as_list else column_values
+        return values
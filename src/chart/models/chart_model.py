@@ -1,6 +1,12 @@
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
+import pandas as pd
 from pydantic import BaseModel, Field
 
+try:
+    from pydantic import field_validator
+except ImportError:  # pydantic v1
+    from pydantic import validator as field_validator
+
 class ChartSize(BaseModel):
     width: int = 600
     height: int = 300
@@ -24,6 +30,42 @@ class ChartModel(BaseModel):
     y_axis_font_size: Optional[int] = Field(default=10, description="Font size for y-axis labels")
     y_axis_margin: Optional[int] = Field(default=8, description="Margin for y-axis labels")
     y_axis_format_large_numbers: Optional[bool] = Field(default=True, description="Format large numbers with K/M/B suffixes")
+    compact_output: Optional[bool] = Field(default=False, description="Encode series as an ECharts dataset and minify the option JSON")
+    y_precision: Optional[int] = Field(default=None, description="Round y values to this many decimals in the chart options")
+    max_points: Optional[int] = Field(default=None, gt=0, description="Downsample line charts to at most this many points")
+    downsample_method: Optional[Literal["lttb", "minmax"]] = Field(default="lttb", description="Line downsampling method: 'lttb' or 'minmax' (None: 'lttb')")
+    aggregations: Optional[Dict[str, str]] = Field(default=None, description="Aggregation per y column: sum, mean, max, min or count (default sum)")
+    max_slices: Optional[int] = Field(default=None, description="Maximum number of pie slices, the smallest ones are grouped into Others")
+    time_bucket: Optional[str] = Field(default=None, description="Bucket datetime x values by this interval ('1min', '15min', ...) or 'auto'")
+    large_threshold: Optional[int] = Field(default=2000, description="Points per series from which line/bar series use ECharts large-data mode (None disables it)")
+    renderer: Optional[str] = Field(default="auto", description="ECharts renderer: 'canvas', 'svg' or 'auto' (SVG for small charts, canvas for large ones)")
 
     size: Optional[ChartSize] = Field(default=ChartSize(width=600, height=300))
+
+    @field_validator("time_bucket")
+    @classmethod
+    def check_time_bucket(cls, value):
+        """Fail on a bad interval when the model is built, not on the first render"""
+        if value is None or value == "auto":
+            return value
+        try:
+            # Months, weeks, ...: not a fixed interval, timestamps cannot be floored to them
+            nanos = pd.tseries.frequencies.to_offset(value).nanos
+        except ValueError as e:
+            raise ValueError(f"Invalid time_bucket {value!r}: use 'auto' or a fixed interval such as '1min', '15min' or '1h'.\nError: {str(e)}")
+        if nanos <= 0:
+            raise ValueError(f"Invalid time_bucket {value!r}: the interval must be positive.")
+        return value
+
+
+def copy_model(chart_model: ChartModel, **update) -> ChartModel:
+    """Copy the model with some fields replaced (pydantic v2 or v1)"""
+    copy = getattr(chart_model, "model_copy", None) or chart_model.copy
+    return copy(update=update, deep=True)
+
+
+def model_to_json(chart_model: ChartModel) -> str:
+    """Serialize the model (pydantic v2 or v1) to compare or hash its content"""
+    dump = getattr(chart_model, "model_dump_json", None) or chart_model.json
+    return dump()
     
\ No newline at end of file
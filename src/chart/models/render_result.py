@@ -0,0 +1,13 @@
+from typing import Dict, Optional
+from pydantic import BaseModel, Field
+
+class RenderResult(BaseModel):
+    index: int
+    chart_id: str
+    output: Optional[str] = Field(default=None, description="HTML, base64 string or PNG path depending on the format")
+    error: Optional[str] = Field(default=None, description="Error message when the job failed")
+    timings: Dict[str, float] = Field(default_factory=dict, description="Seconds spent per stage (build, snapshot, total)")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,177 @@
+# src/chart/native.py
+# This file lets the charts take pyarrow.Table and Polars frames: grouping runs in Arrow or Polars
+# and only the aggregated rows are turned into a pandas DataFrame.
+
+import sys
+from typing import Dict, List, Optional
+import pandas as pd
+from chart.aggregate import resolve_aggregations
+from chart.resample import resolve_bucket
+
+
+def is_arrow_table(data) -> bool:
+    # pyarrow is optional: a Table can only exist if the caller already imported it
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(data, pa.Table)
+
+
+def is_polars_frame(data) -> bool:
+    pl = sys.modules.get("polars")
+    return pl is not None and isinstance(data, (pl.DataFrame, pl.LazyFrame))
+
+
+def is_native_frame(data) -> bool:
+    return is_arrow_table(data) or is_polars_frame(data)
+
+
+def empty_frame(data) -> pd.DataFrame:
+    """Empty pandas frame with the columns of ``data`` and comparable dtypes
+    (datetime, number or object), enough for BaseChart.set_default_axis"""
+    if not is_native_frame(data):
+        return data.iloc[:0]
+
+    columns = {}
+    for name, kind in _column_kinds(data).items():
+        dtype = {"datetime": "datetime64[ns]", "int": "int64", "float": "float64"}.get(kind, object)
+        columns[name] = pd.Series(dtype=dtype)
+    return pd.DataFrame(columns)
+
+
+def _column_kinds(data) -> Dict[str, str]:
+    kinds = {}
+    if is_polars_frame(data):
+        pl = sys.modules["polars"]
+        for name, dtype in data.collect_schema().items():
+            if isinstance(dtype, pl.Datetime):
+                kinds[name] = "datetime"
+            elif dtype.is_integer():
+                kinds[name] = "int"
+            elif dtype.is_float():
+                kinds[name] = "float"
+            else:
+                kinds[name] = "other"
+        return kinds
+
+    pa = sys.modules["pyarrow"]
+    for field in data.schema:
+        if pa.types.is_timestamp(field.type):
+            kinds[field.name] = "datetime"
+        elif pa.types.is_integer(field.type):
+            kinds[field.name] = "int"
+        elif pa.types.is_floating(field.type):
+            kinds[field.name] = "float"
+        else:
+            kinds[field.name] = "other"
+    return kinds
+
+
+def aggregate_native(data, keys: List[str], y_columns: List[str], aggregations: Optional[Dict[str, str]] = None,
+                     time_bucket: Optional[str] = None, max_buckets: int = 600) -> pd.DataFrame:
+    """Same result as chart.aggregate.aggregate for a pyarrow.Table or a Polars frame:
+    one row per group, the key columns first, sorted by key, rows with a missing key dropped"""
+    how = resolve_aggregations(y_columns, aggregations)
+    if is_polars_frame(data):
+        return _aggregate_polars(data, keys, how, time_bucket, max_buckets)
+    return _aggregate_arrow(data, keys, how, time_bucket, max_buckets)
+
+
+def _bucket_seconds(start, end, time_bucket: str, max_buckets: int) -> Optional[int]:
+    freq = resolve_bucket(pd.Timestamp(start), pd.Timestamp(end), time_bucket, max_buckets)
+    if not freq:
+        return None
+    return int(pd.Timedelta(freq).total_seconds())
+
+
+def _aggregate_polars(data, keys: List[str], how: Dict[str, str], time_bucket: Optional[str],
+                      max_buckets: int) -> pd.DataFrame:
+    pl = sys.modules["polars"]
+    frame = data.lazy()
+    kinds = _column_kinds(data)
+
+    key_exprs = []
+    for key in keys:
+        expr = pl.col(key)
+        if time_bucket and kinds.get(key) == "datetime":
+            bounds = frame.select(pl.col(key).min().alias("start"), pl.col(key).max().alias("end")).collect()
+            seconds = _bucket_seconds(bounds["start"][0], bounds["end"][0], time_bucket, max_buckets)
+            if seconds:
+                expr = expr.dt.truncate(f"{seconds}s")
+        key_exprs.append(expr.alias(key))
+
+    agg_exprs = []
+    for column, func in how.items():
+        expr = pl.col(column)
+        if func == "sum":
+            expr = expr.sum()
+        elif func == "mean":
+            expr = expr.mean()
+        elif func == "max":
+            expr = expr.max()
+        elif func == "min":
+            expr = expr.min()
+        else:
+            expr = expr.count()
+        agg_exprs.append(expr.alias(column))
+
+    result = (
+        frame.drop_nulls(subset=keys)
+        .group_by(key_exprs)
+        .agg(agg_exprs)
+        .sort(keys)
+        .collect()
+    )
+    # Built column by column from NumPy so that no pyarrow is needed for the small result
+    return pd.DataFrame({column: result[column].to_numpy() for column in result.columns})
+
+
+def _aggregate_arrow(table, keys: List[str], how: Dict[str, str], time_bucket: Optional[str],
+                     max_buckets: int) -> pd.DataFrame:
+    pa = sys.modules["pyarrow"]
+    import pyarrow.compute as pc
+
+    table = table.select(list(dict.fromkeys(keys + list(how))))
+    valid = None
+    for key in keys:
+        key_valid = pc.is_valid(table[key])
+        valid = key_valid if valid is None else pc.and_(valid, key_valid)
+    if valid is not None and table.num_rows and not pc.all(valid).as_py():
+        table = table.filter(valid)
+
+    if time_bucket:
+        for key in keys:
+            if not pa.types.is_timestamp(table.schema.field(key).type) or table.num_rows == 0:
+                continue
+            bounds = pc.min_max(table[key]).as_py()
+            seconds = _bucket_seconds(bounds["min"], bounds["max"], time_bucket, max_buckets)
+            if seconds:
+                bucketed = pc.floor_temporal(table[key], multiple=seconds, unit="second")
+                table = table.set_column(table.schema.get_field_index(key), key, bucketed)
+
+    grouped = table.group_by(keys).aggregate([(column, func) for column, func in how.items()])
+    grouped = grouped.sort_by([(key, "ascending") for key in keys])
+
+    result = {key: grouped[key].to_pandas() for key in keys}
+    for column, func in how.items():
+        values = grouped[f"{column}_{func}"]
+        if func == "sum":
+            # Arrow sums an all-null group to null, pandas to 0
+            values = pc.fill_null(values, 0)
+        result[column] = values.to_pandas()
+    return pd.DataFrame(result)
+
+
+def native_fingerprint(digest, data):
+    """Feed the schema and the column buffers of an Arrow or Polars frame into ``digest``"""
+    if is_polars_frame(data):
+        frame = data.lazy().collect()
+        digest.update(str(frame.schema).encode("utf-8"))
+        digest.update(frame.hash_rows(seed=0).to_numpy().tobytes())
+        return
+
+    digest.update(str(data.schema).encode("utf-8"))
+    for column in data.columns:
+        for chunk in column.chunks:
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode("utf-8"))
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(memoryview(buffer))
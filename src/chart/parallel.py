@@ -0,0 +1,87 @@
+# src/chart/parallel.py
+# This file fans (ChartModel, DataFrame) render jobs out to a process pool, one warm browser per worker.
+
+import base64
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple
+import pandas as pd
+from chart.chart import Chart
+from chart.models.chart_model import ChartModel
+from chart.models.render_result import RenderResult
+from chart.snapshot import configure_browser_pool, snapshot_html
+
+
+def _init_worker(prewarm: bool):
+    # Each worker process owns exactly one browser
+    configure_browser_pool(size=1, prewarm=prewarm)
+
+
+def _render_job(index: int, chart_model: ChartModel, data: pd.DataFrame, format: str,
+                output_path: str, show_label: bool, donut_pie: bool) -> RenderResult:
+    timings = {}
+    start = time.perf_counter()
+    try:
+        chart = Chart(chart_model, data, show_label=show_label, donut_pie=donut_pie)
+
+        if format == "html":
+            output = chart.render_html()
+            timings["build"] = time.perf_counter() - start
+        else:
+            pyechart = chart._build_chart(for_image=True)
+            html = pyechart.render_embed()
+            built = time.perf_counter()
+            timings["build"] = built - start
+
+            image = snapshot_html(html, [pyechart.chart_id])[0]
+            timings["snapshot"] = time.perf_counter() - built
+
+            if format == "base64":
+                output = base64.b64encode(image).decode("utf-8")
+            else:
+                output_dir = output_path or os.getcwd()
+                os.makedirs(output_dir, exist_ok=True)
+                output = os.path.join(output_dir, f"{chart_model.id}.png")
+                with open(output, "wb") as f:
+                    f.write(image)
+
+        timings["total"] = time.perf_counter() - start
+        return RenderResult(index=index, chart_id=chart_model.id, output=output, timings=timings)
+    except Exception as e:
+        timings["total"] = time.perf_counter() - start
+        return RenderResult(index=index, chart_id=chart_model.id, error=str(e), timings=timings)
+
+
+def render_parallel(jobs: Sequence[Tuple[ChartModel, pd.DataFrame]], format: str = "base64",
+                    max_workers: int = None, output_path: str = None,
+                    show_label: bool = False, donut_pie: bool = True,
+                    prewarm: bool = True) -> List[RenderResult]:
+    '''Render many charts across CPU cores.
+
+    Results come back in the order of ``jobs``. A failing job is reported through
+    ``RenderResult.error`` and does not stop the rest of the batch.'''
+    if format not in ("html", "base64", "png"):
+        raise ValueError(f"Unsupported render format: {format}")
+
+    results: List[RenderResult] = [None] * len(jobs)
+    # spawn: workers must not inherit the parent's browser sessions
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(prewarm and format != "html",),
+    ) as executor:
+        futures = [
+            executor.submit(_render_job, index, chart_model, data, format, output_path, show_label, donut_pie)
+            for index, (chart_model, data) in enumerate(jobs)
+        ]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. BrokenProcessPool)
+                results[index] = RenderResult(index=index, chart_id=jobs[index][0].id, error=str(e))
+
+    return results
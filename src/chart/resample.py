@@ -0,0 +1,43 @@
+# src/chart/resample.py
+# This file buckets datetime x-axis columns into fixed time intervals before grouping.
+
+from typing import List, Optional, Union
+import pandas as pd
+
+# Candidate intervals for time_bucket="auto", from the finest to the coarsest
+AUTO_BUCKETS = ("1s", "5s", "10s", "30s", "1min", "5min", "10min", "15min", "30min",
+                "1h", "3h", "6h", "12h", "1D", "7D")
+
+
+def resolve_bucket(start: pd.Timestamp, end: pd.Timestamp, bucket: str, max_buckets: int) -> Optional[str]:
+    """Return the pandas frequency to floor the timestamps to ("auto" picks the finest
+    interval giving at most ``max_buckets`` buckets over [start, end])"""
+    if bucket != "auto":
+        pd.tseries.frequencies.to_offset(bucket)  # Raises ValueError on an invalid interval
+        return bucket
+
+    if pd.isna(start) or pd.isna(end):
+        return None
+    span = end - start
+    for freq in AUTO_BUCKETS:
+        if span / pd.Timedelta(freq) <= max_buckets:
+            return freq
+    return AUTO_BUCKETS[-1]
+
+
+def time_bucket_keys(data: pd.DataFrame, x_axis: List[str], bucket: Optional[str],
+                     max_buckets: int) -> List[Union[str, pd.Series]]:
+    """Groupby keys for ``x_axis``: datetime columns are floored to the bucket interval
+    (a vectorized resample that leaves the other columns and the frame itself untouched)"""
+    if not bucket:
+        return list(x_axis)
+
+    keys = []
+    for column in x_axis:
+        values = data[column]
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            keys.append(column)
+            continue
+        freq = resolve_bucket(values.min(), values.max(), bucket, max_buckets)
+        keys.append(values.dt.floor(freq) if freq else column)
+    return keys
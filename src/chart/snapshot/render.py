@@ -0,0 +1,131 @@
+# src/chart/snapshot/render.py
+# This file takes image snapshots of rendered chart HTML using the shared browser pool.
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from pyecharts.render.snapshot import decode_base64
+
+from chart.snapshot.browser_pool import get_browser_pool
+
+logger = logging.getLogger(__name__)
+
+_snapshot_executor: Optional[ThreadPoolExecutor] = None
+_snapshot_executor_lock = threading.Lock()
+
+# Upper bound on how long a snapshot waits for ECharts to finish drawing
+DEFAULT_READY_TIMEOUT = 10
+
+# Injected right after the ECharts dependency: every chart created on the page
+# reports its first 'finished' event (render done, animation included)
+READY_HOOK_JS = """
+<script type="text/javascript">
+    (function () {
+        var ready = window.__chartReady = {finished: {}, waiters: []};
+        if (typeof echarts === 'undefined') { return; }
+        var init = echarts.init;
+        echarts.init = function (dom) {
+            var chartInstance = init.apply(this, arguments);
+            chartInstance.on('finished', function () {
+                if (ready.finished[dom.id]) { return; }
+                ready.finished[dom.id] = true;
+                ready.waiters.slice().forEach(function (waiter) { waiter(); });
+            });
+            return chartInstance;
+        };
+    })();
+</script>
+"""
+
+# Resolve once every requested chart has finished, or when the timeout expires
+WAIT_READY_JS = """
+    var chartIds = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+    var settled = false;
+    function allFinished() {
+        var ready = window.__chartReady;
+        return !!ready && chartIds.every(function (chartId) { return ready.finished[chartId]; });
+    }
+    function settle(result) {
+        if (!settled) { settled = true; done(result); }
+    }
+    function watch() {
+        if (allFinished()) { return settle(true); }
+        if (window.__chartReady) {
+            window.__chartReady.waiters.push(function () { if (allFinished()) { settle(true); } });
+        } else {
+            // The page is still parsing: the hook has not run yet
+            setTimeout(watch, 5);
+        }
+    }
+    setTimeout(function () { settle(false); }, timeoutMs);
+    watch();
+"""
+
+# Replace the blank page with the chart HTML without going through a file or URL
+LOAD_HTML_JS = """
+    document.open();
+    document.write(arguments[0]);
+    document.close();
+"""
+
+# Capture every requested chart of the page in one round trip
+SNAPSHOT_CHARTS_JS = """
+    var chartIds = arguments[0], fileType = arguments[1], pixelRatio = arguments[2];
+    return chartIds.map(function(chartId) {
+        var chartInstance = echarts.getInstanceByDom(document.getElementById(chartId));
+        return chartInstance.getDataURL({
+            type: fileType,
+            pixelRatio: pixelRatio,
+            excludeComponents: ['toolbox']
+        });
+    });
+"""
+
+
+def inject_ready_hook(html: str) -> str:
+    """Insert the readiness hook after the page dependencies (end of <head>)"""
+    head_end = html.find("</head>")
+    if head_end == -1:
+        return html
+    return html[:head_end] + READY_HOOK_JS + html[head_end:]
+
+
+def snapshot_html(html: str, chart_ids: List[str], file_type: str = "png",
+                  pixel_ratio: int = 2, timeout: float = DEFAULT_READY_TIMEOUT) -> List[bytes]:
+    """Load chart HTML from memory into a pooled browser and return the image bytes of each chart, in order.
+
+    The capture happens as soon as every chart fired ECharts' 'finished' event;
+    ``timeout`` (seconds) only bounds the wait for heavy or broken pages."""
+    with get_browser_pool().session() as driver:
+        driver.set_script_timeout(timeout + 5)
+        driver.get("about:blank")
+        driver.execute_script(LOAD_HTML_JS, inject_ready_hook(html))
+        if not driver.execute_async_script(WAIT_READY_JS, chart_ids, int(timeout * 1000)):
+            logger.warning(f"Charts not finished after {timeout}s, capturing anyway: {chart_ids}")
+        data_urls = driver.execute_script(SNAPSHOT_CHARTS_JS, chart_ids, file_type, pixel_ratio)
+
+    return [decode_base64(data_url.split(",", 1)[1]) for data_url in data_urls]
+
+
+def _get_snapshot_executor() -> ThreadPoolExecutor:
+    # One thread per pooled browser: WebDriver calls block, but only these threads wait on them
+    global _snapshot_executor
+    with _snapshot_executor_lock:
+        if _snapshot_executor is None:
+            _snapshot_executor = ThreadPoolExecutor(
+                max_workers=get_browser_pool().size,
+                thread_name_prefix="chart-snapshot",
+            )
+        return _snapshot_executor
+
+
+async def snapshot_html_async(html: str, chart_ids: List[str], **kwargs) -> List[bytes]:
+    """Awaitable snapshot_html: the event loop stays free while the browser draws"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_snapshot_executor(), functools.partial(snapshot_html, html, chart_ids, **kwargs)
+    )
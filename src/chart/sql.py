@@ -0,0 +1,187 @@
+# src/chart/sql.py
+# This file pushes the chart aggregation (GROUP BY x-axis, SUM/AVG/... of the y-axis, time buckets,
+# top-N) down to the database through a DB-API connection, so only the aggregated rows are fetched.
+
+import datetime
+import re
+import sys
+import threading
+from typing import Dict, List, Optional
+import pandas as pd
+from chart.aggregate import resolve_aggregations
+from chart.resample import resolve_bucket
+
+SQL_DIALECTS = ("oracle", "sqlite")
+SQL_AGGREGATIONS = {"sum": "SUM", "mean": "AVG", "max": "MAX", "min": "MIN", "count": "COUNT"}
+
+# Unquoted identifiers only: column names are written into the generated SQL
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_$#]*$")
+
+DEFAULT_ARRAYSIZE = 5000
+
+# Text values only count as timestamps in ISO form (SQLite has no datetime type): a string key
+# such as "1001" would otherwise parse as a year and be time bucketed
+ISO_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?$")
+
+
+def detect_dialect(connection) -> str:
+    module = type(connection).__module__.split(".")[0]
+    if module == "sqlite3":
+        return "sqlite"
+    return "oracle"
+
+
+class SqlSource:
+    """Chart data read from ``query`` on a DB-API ``connection``.
+
+    The query is wrapped as a subquery, aggregated by the database and only the
+    grouped rows are fetched (``arraysize`` rows per round trip). The datetime columns
+    (time bucketed with chart_model.time_bucket) are taken from ``datetime_columns`` when
+    given, else from the driver's column types, else from ISO-formatted sample values."""
+
+    def __init__(self, connection, query: str, params=None, dialect: str = None,
+                 arraysize: int = DEFAULT_ARRAYSIZE, datetime_columns: List[str] = None):
+        self.connection = connection
+        self.query = query.strip().rstrip(";")
+        self.params = params
+        self.dialect = dialect or detect_dialect(connection)
+        if self.dialect not in SQL_DIALECTS:
+            raise ValueError(f"Unsupported SQL dialect: {self.dialect}")
+        self.arraysize = arraysize
+        self.last_sql = None
+        self._datetime_columns = list(datetime_columns) if datetime_columns is not None else None
+        self._sample = None
+        self._type_codes = None
+        self._lock = threading.Lock()
+
+    def empty_frame(self) -> pd.DataFrame:
+        """Columns of the query with dtypes inferred from its first row"""
+        sample = self._sample_frame()
+        return sample.iloc[:0]
+
+    def datetime_columns(self) -> List[str]:
+        if self._datetime_columns is not None:
+            return self._datetime_columns
+        sample = self._sample_frame()
+        # DB-API drivers with typed columns (python-oracledb) compare equal to module.DATETIME
+        module = sys.modules.get(type(self.connection).__module__.split(".")[0])
+        datetime_type = getattr(module, "DATETIME", None)
+        columns = []
+        for column, type_code in zip(sample.columns, self._type_codes):
+            values = sample[column]
+            first = values.iloc[0] if len(values) else None
+            if datetime_type is not None and type_code is not None and type_code == datetime_type:
+                columns.append(column)
+            elif pd.api.types.is_datetime64_any_dtype(values) or isinstance(first, (datetime.date, datetime.datetime)):
+                columns.append(column)
+            elif isinstance(first, str) and ISO_TIMESTAMP.match(first):
+                # SQLite stores timestamps as ISO text
+                columns.append(column)
+        return columns
+
+    def aggregate(self, keys: List[str], y_columns: List[str], aggregations: Optional[Dict[str, str]] = None,
+                  time_bucket: Optional[str] = None, max_buckets: int = 600, top_n: int = None) -> pd.DataFrame:
+        """GROUP BY ``keys`` in the database. With ``top_n`` only the groups with the largest
+        first y value are returned, and ``result.attrs["total"]`` holds the total of all groups."""
+        how = resolve_aggregations(y_columns, aggregations)
+        for column in list(keys) + list(how):
+            if not IDENTIFIER.match(column):
+                raise ValueError(f"Unsupported column name for SQL pushdown: {column}")
+
+        bucketed = {}
+        if time_bucket:
+            # Oracle reports unquoted column names in upper case
+            datetime_columns = {column.lower() for column in self.datetime_columns()}
+            for key in keys:
+                if key.lower() in datetime_columns:
+                    freq = self._resolve_bucket(key, time_bucket, max_buckets)
+                    if freq:
+                        bucketed[key] = int(pd.Timedelta(freq).total_seconds())
+
+        key_exprs = [self._bucket_expr(key, bucketed[key]) if key in bucketed else key for key in keys]
+        value_exprs = []
+        for column, func in how.items():
+            expr = f"{SQL_AGGREGATIONS[func]}({column})"
+            # SUM of only NULLs is NULL in SQL, 0 in pandas
+            value_exprs.append(f"COALESCE({expr}, 0)" if func == "sum" else expr)
+
+        select = [f"{expr} AS k{index}" for index, expr in enumerate(key_exprs)]
+        select += [f"{expr} AS v{index}" for index, expr in enumerate(value_exprs)]
+        if top_n:
+            select.append(f"SUM({value_exprs[0]}) OVER () AS total")
+
+        sql = (
+            f"SELECT {', '.join(select)} FROM ({self.query}) src"
+            f" WHERE {' AND '.join(f'{key} IS NOT NULL' for key in keys)}"
+            f" GROUP BY {', '.join(key_exprs)}"
+        )
+        if top_n:
+            sql += " ORDER BY v0 DESC" + (f" LIMIT {int(top_n)}" if self.dialect == "sqlite" else f" FETCH FIRST {int(top_n)} ROWS ONLY")
+        else:
+            sql += f" ORDER BY {', '.join(f'k{index}' for index in range(len(keys)))}"
+
+        rows = self._fetch(sql)
+        columns = list(keys) + list(how) + (["_total"] if top_n else [])
+        result = pd.DataFrame.from_records(rows, columns=columns)
+
+        for key in bucketed:
+            result[key] = pd.to_datetime(result[key])
+        if top_n:
+            total = result.pop("_total")
+            result = result.sort_values(list(keys), kind="stable", ignore_index=True)
+            result.attrs["total"] = total.iloc[0] if len(total) else 0
+        return result
+
+    def _resolve_bucket(self, key: str, time_bucket: str, max_buckets: int) -> Optional[str]:
+        if time_bucket != "auto":
+            return resolve_bucket(None, None, time_bucket, max_buckets)
+        rows = self._fetch(f"SELECT MIN({key}), MAX({key}) FROM ({self.query}) src")
+        start, end = rows[0] if rows else (None, None)
+        if start is None or end is None:
+            return None
+        return resolve_bucket(pd.Timestamp(start), pd.Timestamp(end), time_bucket, max_buckets)
+
+    def _bucket_expr(self, key: str, seconds: int) -> str:
+        """Floor ``key`` to a multiple of ``seconds`` since the epoch, like pandas dt.floor"""
+        if self.dialect == "sqlite":
+            return f"datetime((CAST(strftime('%s', {key}) AS INTEGER) / {seconds}) * {seconds}, 'unixepoch')"
+        epoch = "DATE '1970-01-01'"
+        return f"({epoch} + FLOOR((CAST({key} AS DATE) - {epoch}) * 86400 / {seconds}) * {seconds} / 86400)"
+
+    def _sample_frame(self) -> pd.DataFrame:
+        with self._lock:
+            if self._sample is None:
+                limit = "LIMIT 1" if self.dialect == "sqlite" else "FETCH FIRST 1 ROWS ONLY"
+                cursor = self.connection.cursor()
+                try:
+                    self._execute(cursor, f"SELECT * FROM ({self.query}) src {limit}")
+                    columns = [description[0] for description in cursor.description]
+                    self._type_codes = [description[1] for description in cursor.description]
+                    self._sample = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+                finally:
+                    cursor.close()
+            return self._sample
+
+    def _fetch(self, sql: str) -> list:
+        cursor = self.connection.cursor()
+        try:
+            cursor.arraysize = self.arraysize
+            if hasattr(cursor, "prefetchrows"):
+                # python-oracledb: fill the first round trip as well
+                cursor.prefetchrows = self.arraysize + 1
+            self._execute(cursor, sql)
+            rows = []
+            while True:
+                batch = cursor.fetchmany(self.arraysize)
+                if not batch:
+                    return rows
+                rows.extend(batch)
+        finally:
+            cursor.close()
+
+    def _execute(self, cursor, sql: str):
+        self.last_sql = sql
+        if self.params is None:
+            cursor.execute(sql)
+        else:
+            cursor.execute(sql, self.params)
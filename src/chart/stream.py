@@ -0,0 +1,203 @@
+# src/chart/stream.py
+# This file aggregates chart data given as an iterator of DataFrame chunks (e.g. cursor.fetchmany
+# batches) incrementally, so only the running per-group result is kept in memory.
+
+import itertools
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from chart.aggregate import aggregate, resolve_aggregations
+from chart.native import is_native_frame
+from chart.resample import AUTO_BUCKETS, resolve_bucket
+
+# Partial statistics kept per group for each aggregation, and how partials combine
+PARTIAL_STATS = {
+    "sum": ("sum",),
+    "mean": ("sum", "count"),
+    "max": ("max",),
+    "min": ("min",),
+    "count": ("count",),
+}
+COMBINE_STATS = {"sum": "sum", "count": "sum", "max": "max", "min": "min"}
+
+# With time_bucket="auto" the running buckets are coarsened once there are this many
+# times more of them than the final chart needs
+AUTO_BUCKET_HEADROOM = 4
+
+
+def is_chunked(data) -> bool:
+    """True for DataFrame chunks: an iterator/generator, or a list/tuple of DataFrames.
+    False for a frame or a non-iterable source (SqlSource, ...); any other iterable
+    (Series, ndarray, list of records, dict, str, ...) raises a TypeError."""
+    if isinstance(data, (ChunkedData, Iterator)):
+        return True
+    if isinstance(data, pd.DataFrame) or is_native_frame(data) or not isinstance(data, Iterable):
+        return False
+    if isinstance(data, (list, tuple)) and all(isinstance(chunk, pd.DataFrame) for chunk in data):
+        return True
+    raise TypeError(
+        f"Unsupported chart data: {type(data).__name__}. "
+        "Pass a DataFrame, an iterator of DataFrame chunks or a list of DataFrames."
+    )
+
+
+def _check_chunk(chunk):
+    # An iterator's items are only seen when it is read
+    if chunk is not None and not isinstance(chunk, pd.DataFrame):
+        raise TypeError(f"Unsupported chart data chunk: {type(chunk).__name__}. Every chunk must be a DataFrame.")
+    return chunk
+
+
+class ChunkedData:
+    """Chart data read once from an iterator of DataFrame chunks.
+
+    The chunks are consumed by the first aggregation; its result is kept so that every
+    render of the chart (and every chart sharing this object) reuses it."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._first = _check_chunk(next(self._chunks, None))
+        self._results = {}
+        self._consumed = False
+        self._lock = threading.Lock()
+
+    def empty_frame(self) -> pd.DataFrame:
+        if self._first is None:
+            return pd.DataFrame()
+        return self._first.iloc[:0]
+
+    def aggregate(self, keys: List[str], y_columns: List[str], aggregations: Optional[Dict[str, str]] = None,
+                  time_bucket: Optional[str] = None, max_buckets: int = 600) -> pd.DataFrame:
+        spec = (tuple(keys), tuple(y_columns), tuple(sorted((aggregations or {}).items())), time_bucket, max_buckets)
+        with self._lock:
+            if spec not in self._results:
+                if self._consumed:
+                    raise ValueError("Chunked data was already aggregated with other axes; pass a new iterator.")
+                self._consumed = True
+                chunks = self._chunks if self._first is None else itertools.chain([self._first], self._chunks)
+                self._first = self._first.iloc[:0] if self._first is not None else None
+                self._results[spec] = aggregate_chunks(chunks, keys, y_columns, aggregations, time_bucket, max_buckets)
+            return self._results[spec]
+
+
+def aggregate_chunks(chunks, keys: List[str], y_columns: List[str], aggregations: Optional[Dict[str, str]] = None,
+                     time_bucket: Optional[str] = None, max_buckets: int = 600) -> pd.DataFrame:
+    """Same result as chart.aggregate.aggregate over the concatenated chunks, computed one
+    chunk at a time: each chunk is reduced to partial statistics (sum, count, max, min) per
+    group and merged into the running result."""
+    how = resolve_aggregations(y_columns, aggregations)
+    stats = {f"{column}__{stat}": (column, stat) for column, func in how.items() for stat in PARTIAL_STATS[func]}
+    combine = {name: COMBINE_STATS[stat] for name, (_, stat) in stats.items()}
+
+    running = None
+    freqs = None
+    bounds = {}
+    for chunk in chunks:
+        if _check_chunk(chunk) is None or len(chunk) == 0:
+            continue
+        if freqs is None:
+            freqs = _initial_freqs(chunk, keys, time_bucket)
+
+        # One column per partial statistic (a y column can feed several of them)
+        partial_input = pd.DataFrame({key: chunk[key] for key in keys})
+        for name, (column, _) in stats.items():
+            partial_input[name] = chunk[column]
+
+        if time_bucket == "auto":
+            _update_bounds(bounds, partial_input, freqs)
+        partial_keys = [partial_input[key].dt.floor(freqs[key]) if key in freqs else key for key in keys]
+        partial = aggregate(partial_input, partial_keys, list(stats), {name: stat for name, (_, stat) in stats.items()})
+        del partial_input
+
+        running = partial if running is None else aggregate(pd.concat([running, partial], ignore_index=True), keys, list(stats), combine)
+        if time_bucket == "auto":
+            running = _coarsen(running, keys, freqs, list(stats), combine, max_buckets)
+
+    if running is None:
+        # No rows at all
+        return pd.DataFrame({column: [] for column in list(keys) + list(how)})
+
+    if time_bucket == "auto":
+        running = _final_buckets(running, keys, freqs, bounds, list(stats), combine, max_buckets)
+
+    result = running[list(keys)].copy()
+    for column, func in how.items():
+        if func == "mean":
+            sums = running[f"{column}__sum"].to_numpy(dtype=np.float64)
+            counts = running[f"{column}__count"].to_numpy(dtype=np.float64)
+            result[column] = np.divide(sums, counts, out=np.full(len(sums), np.nan), where=counts > 0)
+        else:
+            result[column] = running[f"{column}__{PARTIAL_STATS[func][0]}"].to_numpy()
+    return result
+
+
+def _initial_freqs(chunk: pd.DataFrame, keys: List[str], time_bucket: Optional[str]) -> Dict[str, str]:
+    """Bucket interval of every datetime key (the finest one for "auto", refined later)"""
+    if not time_bucket:
+        return {}
+    freqs = {}
+    for key in keys:
+        if pd.api.types.is_datetime64_any_dtype(chunk[key]):
+            freqs[key] = AUTO_BUCKETS[0] if time_bucket == "auto" else resolve_bucket(None, None, time_bucket, 0)
+    return freqs
+
+
+def _update_bounds(bounds: dict, chunk: pd.DataFrame, freqs: Dict[str, str]):
+    """Track the overall time range of every bucketed key"""
+    for key in freqs:
+        low, high = chunk[key].min(), chunk[key].max()
+        if pd.isna(low):
+            continue
+        if key in bounds:
+            low, high = min(low, bounds[key][0]), max(high, bounds[key][1])
+        bounds[key] = (low, high)
+
+
+def _coarser(freq: str) -> Optional[str]:
+    """Next "auto" interval that is a whole multiple of ``freq`` (buckets can then be merged exactly)"""
+    step = pd.Timedelta(freq)
+    for candidate in AUTO_BUCKETS[AUTO_BUCKETS.index(freq) + 1:]:
+        if pd.Timedelta(candidate) % step == pd.Timedelta(0):
+            return candidate
+    return None
+
+
+def _rebucket(running: pd.DataFrame, keys: List[str], freqs: Dict[str, str], names: List[str],
+              combine: Dict[str, str]) -> pd.DataFrame:
+    bucketed = [running[key].dt.floor(freqs[key]) if key in freqs else key for key in keys]
+    return aggregate(running, bucketed, names, combine)
+
+
+def _coarsen(running: pd.DataFrame, keys: List[str], freqs: Dict[str, str], names: List[str],
+             combine: Dict[str, str], max_buckets: int) -> pd.DataFrame:
+    for key in freqs:
+        while running[key].nunique() > AUTO_BUCKET_HEADROOM * max_buckets:
+            coarser = _coarser(freqs[key])
+            if coarser is None:
+                break
+            freqs[key] = coarser
+            running = _rebucket(running, keys, freqs, names, combine)
+    return running
+
+
+def _final_buckets(running: pd.DataFrame, keys: List[str], freqs: Dict[str, str], bounds: dict,
+                   names: List[str], combine: Dict[str, str], max_buckets: int) -> pd.DataFrame:
+    """Merge the running buckets into the interval "auto" picks for the whole range"""
+    changed = False
+    for key, freq in freqs.items():
+        low, high = bounds.get(key, (None, None))
+        if low is None:
+            continue
+        target = resolve_bucket(low, high, "auto", max_buckets)
+        if pd.Timedelta(target) <= pd.Timedelta(freq):
+            continue
+        # The running buckets can only merge into a multiple of their own interval:
+        # take the first such interval from the target up
+        for candidate in AUTO_BUCKETS[AUTO_BUCKETS.index(target):]:
+            if pd.Timedelta(candidate) % pd.Timedelta(freq) == pd.Timedelta(0):
+                freqs[key] = candidate
+                changed = True
+                break
+    return _rebucket(running, keys, freqs, names, combine) if changed else running
@@ -0,0 +1,60 @@
+# tests/test_aggregate.py
+# This file checks that chart.aggregate.aggregate matches pandas groupby on every fast path.
+
+import numpy as np
+import pandas as pd
+import pytest
+from chart.aggregate import AGGREGATIONS, aggregate
+
+VALUE_DTYPES = ["int64", "int32", "uint64", "uint8", "float64"]
+
+
+def make_frame(key_kind: str, dtype: str, rows: int = 5000) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    if key_kind == "int":
+        # snap_id-like: small integer span, bincount path
+        key = rng.integers(1000, 1050, rows)
+    elif key_kind == "categorical":
+        key = pd.Categorical(rng.choice(["CPU", "User I/O", "Commit", "Other"], rows))
+    elif key_kind == "unique":
+        key = np.arange(rows)[::-1]
+    else:
+        key = rng.choice(["CPU", "User I/O", "Commit", "Other"], rows).astype(object)
+    values = rng.integers(0, 100, rows).astype(dtype)
+    if dtype == "float64":
+        values[::7] = np.nan
+    return pd.DataFrame({"snap_id": key, "value": values})
+
+
+def expected(data: pd.DataFrame, func: str) -> pd.DataFrame:
+    return data.groupby("snap_id", observed=True)[["value"]].agg(func).reset_index()
+
+
+def assert_matches(result: pd.DataFrame, reference: pd.DataFrame, func: str):
+    assert list(result.columns) == list(reference.columns)
+    np.testing.assert_array_equal(np.asarray(result["snap_id"]), np.asarray(reference["snap_id"]))
+    if func == "mean":
+        np.testing.assert_allclose(result["value"].to_numpy(), reference["value"].to_numpy(), rtol=1e-12)
+    else:
+        np.testing.assert_array_equal(result["value"].to_numpy(), reference["value"].to_numpy())
+
+
+@pytest.mark.parametrize("key_kind", ["int", "categorical", "unique", "object"])
+@pytest.mark.parametrize("dtype", VALUE_DTYPES)
+@pytest.mark.parametrize("func", AGGREGATIONS)
+def test_matches_groupby(key_kind, dtype, func):
+    data = make_frame(key_kind, dtype)
+    assert_matches(aggregate(data, ["snap_id"], ["value"], {"value": func}), expected(data, func), func)
+
+
+def test_integer_sum_above_float_precision():
+    data = pd.DataFrame({"snap_id": np.repeat([1, 2], 100), "value": np.full(200, 10**15 + 1, dtype=np.int64)})
+    result = aggregate(data, ["snap_id"], ["value"])
+    assert result["value"].tolist() == [100000000000000100, 100000000000000100]
+    assert_matches(result, expected(data, "sum"), "sum")
+
+
+def test_uint64_sum_does_not_overflow_int64():
+    data = pd.DataFrame({"snap_id": [1, 1, 2], "value": np.array([2**63, 5, 7], dtype=np.uint64)})
+    result = aggregate(data, ["snap_id"], ["value"])
+    assert result["value"].tolist() == [2**63 + 5, 7]
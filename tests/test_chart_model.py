@@ -0,0 +1,45 @@
+# tests/test_chart_model.py
+# This file checks the ChartModel field validation.
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from chart.components.line_chart import LineChart
+from chart.models.chart_model import ChartModel
+
+
+def chart_model(**fields) -> ChartModel:
+    return ChartModel(id="load", type="line", title="Load", x_axis=["sample_time"], y_axis=["db_time"], **fields)
+
+
+@pytest.mark.parametrize("time_bucket", [None, "auto", "1s", "15min", "1h", "1D"])
+def test_valid_time_bucket(time_bucket):
+    assert chart_model(time_bucket=time_bucket).time_bucket == time_bucket
+
+
+@pytest.mark.parametrize("time_bucket", ["bogus", "15 minutes", "ME", "1W", "0min", "-5min"])
+def test_invalid_time_bucket_fails_at_construction(time_bucket):
+    with pytest.raises(ValidationError, match="time_bucket"):
+        chart_model(time_bucket=time_bucket)
+
+
+@pytest.mark.parametrize("downsample_method", ["lttb", "minmax", None])
+def test_valid_downsample_method(downsample_method):
+    assert chart_model(downsample_method=downsample_method).downsample_method == downsample_method
+
+
+def test_invalid_downsample_method_fails_at_construction():
+    with pytest.raises(ValidationError, match="downsample_method"):
+        chart_model(downsample_method="average")
+
+
+@pytest.mark.parametrize("max_points", [0, -10])
+def test_max_points_must_be_positive(max_points):
+    with pytest.raises(ValidationError, match="max_points"):
+        chart_model(max_points=max_points)
+
+
+def test_unset_downsample_method_uses_lttb():
+    data = pd.DataFrame({"sample_time": pd.date_range("2024-01-01", periods=500, freq="s"), "db_time": range(500)})
+    chart = LineChart(chart_model(max_points=50, downsample_method=None), data)
+    assert len(chart.get_prepared_data()[1]) <= 50
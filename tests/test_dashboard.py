@@ -0,0 +1,47 @@
+# tests/test_dashboard.py
+# This file checks how render_dashboard includes the ECharts runtime.
+
+import os
+import pandas as pd
+import pytest
+from chart import dashboard
+from chart.dashboard import ONLINE_ECHARTS_URL, render_dashboard
+from chart.models.chart_model import ChartModel
+
+
+def charts():
+    chart_model = ChartModel(id="load", type="bar", title="Load", x_axis=["snap_id"], y_axis=["value"])
+    return [(chart_model, pd.DataFrame({"snap_id": [1, 2, 2], "value": [1.0, 2.0, 3.0]}))]
+
+
+def test_default_dashboard_inlines_the_bundled_runtime():
+    page = render_dashboard(charts())
+    assert 'src="http' not in page
+    assert 'version="6.0.0"' in page or "6.0.0" in page
+    assert "Licensed to the Apache Software Foundation" in page
+
+
+def test_missing_bundle_is_an_error(monkeypatch, tmp_path):
+    monkeypatch.setattr(dashboard, "DEFAULT_ECHARTS_PATH", str(tmp_path / "echarts.min.js"))
+    with pytest.raises(FileNotFoundError):
+        render_dashboard(charts())
+
+
+def test_bundle_is_inlined(monkeypatch, tmp_path):
+    bundle = tmp_path / "echarts.min.js"
+    bundle.write_text("var echarts = {};", encoding="utf-8")
+    monkeypatch.setattr(dashboard, "DEFAULT_ECHARTS_PATH", str(bundle))
+    page = render_dashboard(charts())
+    assert "var echarts = {};" in page
+    assert ONLINE_ECHARTS_URL not in page
+
+
+def test_online_runtime_is_explicit(monkeypatch, tmp_path):
+    monkeypatch.setattr(dashboard, "DEFAULT_ECHARTS_PATH", str(tmp_path / "echarts.min.js"))
+    page = render_dashboard(charts(), echarts_url=ONLINE_ECHARTS_URL)
+    assert f'src="{ONLINE_ECHARTS_URL}"' in page
+
+
+def test_explicit_path_must_exist(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        render_dashboard(charts(), echarts_path=os.path.join(str(tmp_path), "missing.js"))
@@ -0,0 +1,53 @@
+# tests/test_instrument.py
+# This file checks the span parents reported by chart.instrument, including concurrent async renders.
+
+import asyncio
+import pandas as pd
+from chart import base
+from chart.chart import Chart
+from chart.instrument import RecordingInstrumentation
+from chart.models.chart_model import ChartModel
+
+
+def make_chart(index: int, instrumentation: RecordingInstrumentation) -> Chart:
+    chart_model = ChartModel(id=f"c{index}", type="line", title="Load", x_axis=["snap_id"], y_axis=["value"])
+    data = pd.DataFrame({"snap_id": [1, 2, 2, 3], "value": [1.0, 2.0, 3.0, 4.0]})
+    return Chart(chart_model, data, instrumentation=instrumentation)
+
+
+def test_sync_render_parents():
+    instrumentation = RecordingInstrumentation()
+    make_chart(0, instrumentation).render_html()
+    parents = {span["stage"]: span["parent"] for span in instrumentation.spans}
+    assert parents["render_html"] is None
+    assert parents["build_options"] == "render_html"
+    assert parents["prepare"] == "build_options"
+    assert parents["aggregate"] == "prepare"
+    assert parents["render_embed"] == "render_html"
+
+
+def test_concurrent_async_renders_keep_their_own_parents(monkeypatch):
+    async def fake_snapshot(html, chart_ids):
+        # Yield so that the other renders' snapshot spans are open at the same time
+        await asyncio.sleep(0.01)
+        return [b"png" for _ in chart_ids]
+
+    monkeypatch.setattr(base, "snapshot_html_async", fake_snapshot)
+    instrumentation = RecordingInstrumentation()
+    charts = [make_chart(index, instrumentation) for index in range(9)]
+
+    async def render_all():
+        return await asyncio.gather(*(chart.render_base64_async() for chart in charts))
+
+    assert len(asyncio.run(render_all())) == 9
+
+    snapshots = [span for span in instrumentation.spans if span["stage"] == "snapshot"]
+    assert sorted(span["chart"] for span in snapshots) == [f"c{index}" for index in range(9)]
+    assert all(span["parent"] is None for span in snapshots)
+    for span in instrumentation.spans:
+        if span["stage"] in ("build_options", "render_embed", "base64"):
+            assert span["parent"] is None
+        elif span["stage"] == "prepare":
+            assert span["parent"] == "build_options"
+    # Every span ran in the chart it was opened for
+    assert {span["chart"] for span in instrumentation.spans if span["parent"] == "build_options"} == {f"c{index}" for index in range(9)}
@@ -0,0 +1,39 @@
+# tests/test_live.py
+# This file checks the live chart page served by chart.server.
+
+import pandas as pd
+from flask import Flask
+from chart.live import LiveChart, insert_script
+from chart.models.chart_model import ChartModel
+from chart.server import LiveFeed, create_live_blueprint
+
+
+def live_chart() -> LiveChart:
+    chart_model = ChartModel(id="load", type="line", title="Load", x_axis=["snap_id"], y_axis=["value"])
+    return LiveChart(chart_model, pd.DataFrame({"snap_id": [1, 2], "value": [1.0, 2.0]}))
+
+
+def test_insert_script_goes_before_the_body_end():
+    html = insert_script("<html><body><div></div></body></html>", "run();")
+    assert html == '<html><body><div></div><script type="text/javascript">run();</script>\n</body></html>'
+    assert insert_script("<div></div>", "run();") == '<div></div><script type="text/javascript">run();</script>\n'
+
+
+def test_render_keeps_scripts_inside_the_body():
+    html = live_chart().render()
+    assert html.rstrip().endswith("</html>")
+    assert html.index("function orapyApplyDelta") < html.rindex("</body>")
+
+
+def test_page_scripts_are_inside_the_body():
+    feed = LiveFeed(live_chart(), lambda: None, interval=60)
+    app = Flask(__name__)
+    app.register_blueprint(create_live_blueprint({"load": feed}, url_prefix="/live"))
+    try:
+        page = app.test_client().get("/live/load").get_data(as_text=True)
+    finally:
+        feed.stop()
+    assert page.rstrip().endswith("</html>")
+    body_end = page.rindex("</body>")
+    assert page.index("function orapyApplyDelta") < page.index("new EventSource") < body_end
+    assert "/live/load/stream?since=0" in page
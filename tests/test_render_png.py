@@ -0,0 +1,110 @@
+# tests/test_render_png.py
+# This file checks that render_png only replaces the target file once the image is rendered.
+
+import asyncio
+import os
+import pandas as pd
+import pytest
+from chart.cache import RenderCache
+from chart.chart import Chart
+from chart.components.bar_chart import BarChart
+from chart.components.line_chart import LineChart
+from chart.components.pie_chart import PieChart
+from chart.models.chart_model import ChartModel
+
+COMPONENTS = [(LineChart, "line"), (BarChart, "bar"), (PieChart, "pie")]
+
+
+def component(chart_class, chart_type):
+    chart_model = ChartModel(id="load", type=chart_type, title="Load", x_axis=["snap_id"], y_axis=["value"])
+    return chart_class(chart_model, pd.DataFrame({"snap_id": [1, 2, 2], "value": [1.0, 2.0, 3.0]}))
+
+
+def failing_render(*args, **kwargs):
+    raise RuntimeError("no browser")
+
+
+async def failing_render_async(*args, **kwargs):
+    raise RuntimeError("no browser")
+
+
+def facade(chart_class, chart_type):
+    return Chart(component(chart_class, chart_type).chart_model, pd.DataFrame({"snap_id": [1, 2, 2], "value": [1.0, 2.0, 3.0]}))
+
+
+@pytest.mark.parametrize("chart_class, chart_type", COMPONENTS)
+def test_png_is_written(monkeypatch, tmp_path, chart_class, chart_type):
+    chart = component(chart_class, chart_type)
+    monkeypatch.setattr(chart, "render_bytes", lambda *args, **kwargs: b"\x89PNG new")
+    image_path = chart.render_png(output_path=str(tmp_path / "out"), image_name="load.png")
+    assert image_path == str(tmp_path / "out" / "load.png")
+    assert open(image_path, "rb").read() == b"\x89PNG new"
+    assert os.listdir(tmp_path / "out") == ["load.png"]
+
+
+@pytest.mark.parametrize("chart_class, chart_type", COMPONENTS)
+def test_failed_render_keeps_the_previous_png(monkeypatch, tmp_path, chart_class, chart_type):
+    previous = tmp_path / "load.png"
+    previous.write_bytes(b"\x89PNG old")
+    chart = component(chart_class, chart_type)
+    monkeypatch.setattr(chart, "render_bytes", failing_render)
+    with pytest.raises(RuntimeError, match="no browser"):
+        chart.render_png(output_path=str(tmp_path), image_name="load.png")
+    assert previous.read_bytes() == b"\x89PNG old"
+    assert os.listdir(tmp_path) == ["load.png"]
+
+
+@pytest.mark.parametrize("chart_class, chart_type", COMPONENTS)
+def test_failed_render_creates_no_file(monkeypatch, tmp_path, chart_class, chart_type):
+    chart = component(chart_class, chart_type)
+    monkeypatch.setattr(chart, "render_bytes", failing_render)
+    with pytest.raises(RuntimeError):
+        chart.render_png(output_path=str(tmp_path), image_name="load.png")
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("make", [component, facade])
+@pytest.mark.parametrize("chart_class, chart_type", COMPONENTS)
+def test_async_png_is_written(monkeypatch, tmp_path, make, chart_class, chart_type):
+    chart = make(chart_class, chart_type)
+
+    async def render_bytes_async(*args, **kwargs):
+        return b"\x89PNG new"
+
+    monkeypatch.setattr(chart, "render_bytes_async", render_bytes_async)
+    image_path = asyncio.run(chart.render_png_async(output_path=str(tmp_path), image_name="load.png"))
+    assert open(image_path, "rb").read() == b"\x89PNG new"
+    assert os.listdir(tmp_path) == ["load.png"]
+
+
+@pytest.mark.parametrize("make", [component, facade])
+@pytest.mark.parametrize("chart_class, chart_type", COMPONENTS)
+def test_failed_async_render_keeps_the_previous_png(monkeypatch, tmp_path, make, chart_class, chart_type):
+    previous = tmp_path / "load.png"
+    previous.write_bytes(b"\x89PNG old")
+    chart = make(chart_class, chart_type)
+    monkeypatch.setattr(chart, "render_bytes_async", failing_render_async)
+    with pytest.raises(RuntimeError, match="no browser"):
+        asyncio.run(chart.render_png_async(output_path=str(tmp_path), image_name="load.png"))
+    assert previous.read_bytes() == b"\x89PNG old"
+    assert os.listdir(tmp_path) == ["load.png"]
+
+
+def test_cached_png_failure_keeps_the_previous_png(monkeypatch, tmp_path):
+    previous = tmp_path / "load.png"
+    previous.write_bytes(b"\x89PNG old")
+    chart = facade(LineChart, "line")
+    chart.cache = RenderCache()
+    monkeypatch.setattr(chart, "render_bytes", failing_render)
+    with pytest.raises(RuntimeError, match="no browser"):
+        chart.render_png(output_path=str(tmp_path), image_name="load.png")
+    assert previous.read_bytes() == b"\x89PNG old"
+    assert os.listdir(tmp_path) == ["load.png"]
+
+
+def test_cached_png_is_written(monkeypatch, tmp_path):
+    chart = facade(LineChart, "line")
+    chart.cache = RenderCache()
+    monkeypatch.setattr(chart, "render_bytes", lambda *args, **kwargs: b"\x89PNG cached")
+    image_path = chart.render_png(output_path=str(tmp_path), image_name="load.png")
+    assert open(image_path, "rb").read() == b"\x89PNG cached"
@@ -0,0 +1,117 @@
+# tests/test_sql.py
+# This file checks the SQL pushdown of SqlSource against chart.aggregate on an in-memory sqlite3 table.
+
+import sqlite3
+import numpy as np
+import pandas as pd
+import pytest
+from chart.aggregate import aggregate
+from chart.components.bar_chart import BarChart
+from chart.components.pie_chart import PieChart
+from chart.models.chart_model import ChartModel
+from chart.resample import time_bucket_keys
+from chart.sql import SqlSource
+
+AGGREGATIONS = {"db_time": "sum", "cpu": "mean", "sessions": "max"}
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    rows = 2000
+    return pd.DataFrame({
+        "sample_time": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 6 * 3600, rows), unit="s"),
+        "wait_class": rng.choice(["CPU", "User I/O", "Commit", "Network", "Other", "Concurrency"], rows),
+        "snap": rng.choice(["1001", "1002", "1003"], rows),
+        "db_time": rng.integers(0, 1000, rows),
+        "cpu": rng.random(rows) * 100,
+        "sessions": rng.integers(1, 50, rows),
+    })
+
+
+@pytest.fixture
+def source(frame) -> SqlSource:
+    connection = sqlite3.connect(":memory:")
+    frame.to_sql("ash", connection, index=False)
+    yield SqlSource(connection, "SELECT * FROM ash")
+    connection.close()
+
+
+def assert_same(result: pd.DataFrame, expected: pd.DataFrame):
+    assert list(result.columns) == list(expected.columns)
+    for column in expected.columns:
+        if pd.api.types.is_float_dtype(expected[column]):
+            np.testing.assert_allclose(result[column].to_numpy(dtype=float), expected[column].to_numpy(), rtol=1e-9)
+        else:
+            assert result[column].tolist() == expected[column].tolist()
+
+
+@pytest.mark.parametrize("keys", [["wait_class"], ["snap", "wait_class"]])
+def test_group_by_matches_pandas(frame, source, keys):
+    result = source.aggregate(keys, list(AGGREGATIONS), AGGREGATIONS)
+    assert_same(result, aggregate(frame, keys, list(AGGREGATIONS), AGGREGATIONS))
+
+
+@pytest.mark.parametrize("time_bucket", ["15min", "1h", "auto"])
+def test_time_bucket_matches_pandas(frame, source, time_bucket):
+    result = source.aggregate(["sample_time"], list(AGGREGATIONS), AGGREGATIONS, time_bucket=time_bucket, max_buckets=60)
+    keys = time_bucket_keys(frame, ["sample_time"], time_bucket, max_buckets=60)
+    assert_same(result, aggregate(frame, keys, list(AGGREGATIONS), AGGREGATIONS))
+
+
+def test_top_n_reports_the_total_of_all_groups(frame, source):
+    result = source.aggregate(["wait_class"], ["db_time"], top_n=3)
+    expected = aggregate(frame, ["wait_class"], ["db_time"])
+    top = expected.nlargest(3, "db_time").sort_values("wait_class", ignore_index=True)
+    assert_same(result, top)
+    assert result.attrs["total"] == expected["db_time"].sum()
+
+
+@pytest.mark.parametrize("max_slices", [None, 3])
+def test_pie_others_matches_dataframe_input(frame, source, max_slices):
+    chart_model = ChartModel(id="pie", type="pie", title="Waits", x_axis=["wait_class"], y_axis=["db_time"],
+                             max_slices=max_slices)
+    from_sql = PieChart(chart_model, source)._prepare_chart_data()
+    from_frame = PieChart(chart_model, frame)._prepare_chart_data()
+    assert from_sql == from_frame
+    if max_slices:
+        assert from_sql[-1][0] == "Others"
+        assert sum(value for _, value in from_sql) == frame["db_time"].sum()
+
+
+def test_numeric_text_key_is_not_a_datetime(frame, source):
+    assert "snap" not in source.datetime_columns()
+    assert "sample_time" in source.datetime_columns()
+
+    chart_model = ChartModel(id="bar", type="bar", title="Snaps", x_axis=["snap"], y_axis=["db_time"], time_bucket="15min")
+    _, categories = BarChart(chart_model, source)._prepare_chart_data()
+    assert categories == ["1001", "1002", "1003"]
+
+
+def test_explicit_datetime_columns(frame):
+    connection = sqlite3.connect(":memory:")
+    frame.to_sql("ash", connection, index=False)
+    assert SqlSource(connection, "SELECT * FROM ash", datetime_columns=[]).datetime_columns() == []
+
+
+def test_line_prep_failure_propagates_and_is_not_memoized():
+    from chart.components.line_chart import LineChart
+    connection = sqlite3.connect(":memory:")
+    chart_model = ChartModel(id="load", type="line", title="Load", x_axis=["sample_time"], y_axis=["db_time"])
+    chart = LineChart(chart_model, SqlSource(connection, "SELECT * FROM ash"))
+    with pytest.raises(Exception, match="no such table"):
+        chart.render()
+    assert chart._prepared_data == {}
+    connection.close()
+
+
+def test_line_prep_retries_an_empty_result():
+    from chart.components.line_chart import LineChart
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE ash (sample_time TEXT, db_time INTEGER)")
+    chart_model = ChartModel(id="load", type="line", title="Load", x_axis=["sample_time"], y_axis=["db_time"])
+    chart = LineChart(chart_model, SqlSource(connection, "SELECT * FROM ash"))
+    assert chart.get_prepared_data()[1] == []
+    connection.execute("INSERT INTO ash VALUES ('2024-01-01 00:00:00', 5)")
+    assert chart.get_prepared_data()[1] == ["2024-01-01 00:00:00"]
+    connection.close()
@@ -0,0 +1,73 @@
+# tests/test_stream.py
+# This file checks which chart data is read as DataFrame chunks.
+
+import sqlite3
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from chart.aggregate import aggregate
+from chart.components.bar_chart import BarChart
+from chart.models.chart_model import ChartModel
+from chart.sql import SqlSource
+from chart.stream import ChunkedData, is_chunked
+
+
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({"snap_id": [1, 2, 2, 3], "value": [1.0, 2.0, 3.0, 4.0]})
+
+
+def chart(data) -> BarChart:
+    chart_model = ChartModel(id="load", type="bar", title="Load", x_axis=["snap_id"], y_axis=["value"])
+    return BarChart(chart_model, data)
+
+
+@pytest.mark.parametrize("data", [
+    lambda: iter([frame()]),
+    lambda: (chunk for chunk in [frame(), frame()]),
+    lambda: [frame(), frame()],
+    lambda: (frame(),),
+])
+def test_chunks_are_chunked(data):
+    assert is_chunked(data())
+    assert isinstance(chart(data()).data, ChunkedData)
+
+
+@pytest.mark.parametrize("data", [
+    frame,
+    lambda: pa.Table.from_pandas(frame()),
+    lambda: pl.from_pandas(frame()),
+    lambda: SqlSource(sqlite3.connect(":memory:"), "SELECT 1"),
+])
+def test_frames_and_sources_are_not_chunked(data):
+    assert not is_chunked(data())
+
+
+@pytest.mark.parametrize("data", [
+    lambda: frame()["value"],
+    lambda: frame().to_numpy(),
+    lambda: frame().to_dict("records"),
+    lambda: frame().to_dict("list"),
+    lambda: "snap_id,value",
+    lambda: [frame(), frame()["value"]],
+])
+def test_other_iterables_are_rejected(data):
+    with pytest.raises(TypeError, match="Unsupported chart data"):
+        is_chunked(data())
+    with pytest.raises(TypeError, match="Unsupported chart data"):
+        chart(data())
+
+
+def test_iterator_of_non_frames_is_rejected():
+    with pytest.raises(TypeError, match="chunk"):
+        chart(iter(frame().to_dict("records")))
+    chunks = chart(iter([frame(), np.arange(4)]))
+    with pytest.raises(Exception, match="chunk"):
+        chunks.aggregate_data()
+
+
+def test_list_of_frames_matches_concatenation():
+    result = chart([frame(), frame()]).aggregate_data()
+    expected = aggregate(pd.concat([frame(), frame()], ignore_index=True), ["snap_id"], ["value"])
+    assert result["value"].tolist() == expected["value"].tolist()